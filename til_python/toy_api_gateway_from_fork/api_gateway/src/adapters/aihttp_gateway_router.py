@@ -1,50 +1,189 @@
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from http import HTTPMethod, HTTPStatus
 from typing import Any
 
 import aiohttp
 
-from adapters.exceptions import GatewayRouterException, NotFoundException
-from config.settings import BaseSettings
-from ports.gateway_router import GatewayRouter
+from adapters.exceptions import (
+    GatewayRouterException,
+    NotFoundException,
+    UpstreamConnectionException,
+)
+from adapters.service_discovery import DiscoveryResolver, service_discovery
+from adapters.trace_config import create_trace_config
+from config.settings import BaseSettings, get_settings
+from domain.enitities.service import Service
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.load_balancing import LoadBalancerRegistry, load_balancers
+from use_cases.server_timing import record_phase
 
 logger = logging.getLogger()
 
+UNIX_SCHEME = "unix://"
+# unix socket으로 보내는 요청의 url(host는 Host header로만 쓰임)
+UNIX_BASE_URL = "http://localhost"
+
 
 class AiohttpGatewayRouter(GatewayRouter):
-    def __init__(self, session: aiohttp.ClientSession, settings: BaseSettings):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        settings: BaseSettings,
+        balancers: LoadBalancerRegistry = load_balancers,
+        sessions: "AiohttpSessionEngine | None" = None,
+    ):
         self._session = session
         self._settings = settings
+        self._balancers = balancers
+        self._sessions = sessions or get_session
 
     async def __call__(
-            self,
-            service_name: str,
-            route: str,
-            headers: dict[str, Any],
-            method: str = HTTPMethod.GET,
-            body: bytes | None = None,
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
     ) -> tuple[bytes, int]:
-        service = self._settings.service_mapping.get(service_name)
-        if service is None:
-            raise NotFoundException
+        service = self._get_service(service_name)
+        endpoint = self._balancers.get(service).pick()
+        endpoint.acquire()
+        start = time.perf_counter()
         try:
             # ClientSession(connection pool)을 재사용하기 때문에 context manager를 이용한 session.close구문은 필요 X
             # 단, fastapi 앱 종료 시점에 session.close() 호출 필요함 -> lifespan에서 처리
             # _RequestContextManager.__aexit__ 내에서 _resp.release()로 connection release
-            async with self._session.request(
-                    method=method,
-                    url=service.internal_url
-                        + (route[:-1] if route.endswith("/") else route),
-                    headers=self._get_headers(headers),
-                    data=body,
+            session, base_url = self._get_target(endpoint.url)
+            async with session.request(
+                method=method,
+                url=self._get_url(base_url, route),
+                headers=self._get_headers(headers),
+                data=body,
             ) as response:
+                endpoint.observe(time.perf_counter() - start)
                 response_body = b""
                 if response.status != HTTPStatus.NO_CONTENT:
+                    read_at = time.perf_counter()
                     response_body = await response.content.read()
+                    record_phase("body", read_at)
             return response_body, response.status
         except Exception as e:
+            # 실패한 요청의 소요 시간도 반영해 느린/죽은 endpoint를 덜 선택하도록 함
+            endpoint.observe(time.perf_counter() - start)
+            logger.exception(f"{service.name}: {e}")
+            raise self._get_exception(e) from e
+        finally:
+            endpoint.release()
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        service = self._get_service(service_name)
+        endpoint = self._balancers.get(service).pick()
+        endpoint.acquire()
+        start = time.perf_counter()
+        try:
+            # async iterator body는 aiohttp가 chunk 단위로 upstream에 흘려보냄
+            session, base_url = self._get_target(endpoint.url)
+            response = await session.request(
+                method=method,
+                url=self._get_url(base_url, route),
+                headers=self._get_headers(headers),
+                data=body,
+            )
+        except asyncio.CancelledError:
+            endpoint.release()
+            raise
+        except Exception as e:
+            endpoint.observe(time.perf_counter() - start)
+            endpoint.release()
+            logger.exception(f"{service.name}: {e}")
+            raise self._get_exception(e) from e
+        endpoint.observe(time.perf_counter() - start)
+
+        content_length = response.content_length
+        if response.status == HTTPStatus.NO_CONTENT or (
+            content_length is not None
+            and content_length <= self._settings.streaming_threshold
+        ):
+            # 작은 응답은 기존처럼 한 번에 읽고 connection을 바로 반환(buffered fast path)
+            try:
+                response_body = b""
+                if response.status != HTTPStatus.NO_CONTENT:
+                    read_at = time.perf_counter()
+                    response_body = await response.read()
+                    record_phase("body", read_at)
+            except Exception as e:
+                logger.exception(f"{service.name}: {e}")
+                raise GatewayRouterException from e
+            finally:
+                response.release()
+                endpoint.release()
+            return UpstreamResponse(response.status, response.headers, response_body)
+
+        released = False
+
+        async def close() -> None:
+            nonlocal released
+            # 끝까지 읽지 않은 응답이면 connection을 재사용하지 않고 닫음
+            response.release()
+            if not released:
+                released = True
+                endpoint.release()
+
+        return UpstreamResponse(
+            response.status,
+            response.headers,
+            self._iter_chunks(service, response, close),
+            close,
+        )
+
+    async def _iter_chunks(
+        self,
+        service: Service,
+        response: aiohttp.ClientResponse,
+        close: Callable[[], Awaitable[None]],
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.content.iter_chunked(
+                self._settings.streaming_chunk_size
+            ):
+                yield chunk
+        except Exception as e:
+            # 이미 status/header가 나간 뒤라 예외 응답으로 바꿀 수 없으므로 로그만 남기고 중단
             logger.exception(f"{service.name}: {e}")
-            raise GatewayRouterException from e
+        finally:
+            # connection과 endpoint 모두 반환, close는 여러 번 호출해도 한 번만 반환
+            await close()
+
+    def _get_service(self, service_name: str) -> Service:
+        service = self._settings.service_mapping.get(service_name)
+        if service is None:
+            raise NotFoundException
+        return service
+
+    def _get_target(self, base_url: str) -> tuple[aiohttp.ClientSession, str]:
+        if base_url.startswith(UNIX_SCHEME):
+            return self._sessions.get_unix_session(base_url), UNIX_BASE_URL
+        return self._session, base_url
+
+    @staticmethod
+    def _get_exception(e: Exception) -> GatewayRouterException:
+        if isinstance(e, aiohttp.ClientConnectorError | aiohttp.ConnectionTimeoutError):
+            return UpstreamConnectionException()
+        return GatewayRouterException()
+
+    @staticmethod
+    def _get_url(base_url: str, route: str) -> str:
+        return base_url + (route[:-1] if route.endswith("/") else route)
 
     @staticmethod
     def _get_headers(headers: dict[str, Any]) -> dict[str, Any]:
@@ -55,19 +194,84 @@ class AiohttpGatewayRouter(GatewayRouter):
 class AiohttpSessionEngine:
     def __init__(self) -> None:
         self.session: None | aiohttp.ClientSession = None
+        # unix socket 경로별 전용 connection pool
+        self.unix_sessions: dict[str, aiohttp.ClientSession] = {}
 
     async def __call__(self) -> aiohttp.ClientSession:
         # session을 싱글톤으로 사용
         if self.session is None:
-            connector = aiohttp.TCPConnector(limit_per_host=100)
+            settings = get_settings()
+            resolver = None
+            if settings.service_discovery_enabled:
+                # DNS는 ServiceDiscovery 캐시에서만 읽어 요청 경로에서 조회하지 않음
+                resolver = DiscoveryResolver(service_discovery, settings)
+            connector = aiohttp.TCPConnector(
+                limit_per_host=100, resolver=resolver, use_dns_cache=resolver is None
+            )
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                trace_configs=self._get_trace_configs(),
+            )
         return self.session
 
+    def get_unix_session(self, url: str) -> aiohttp.ClientSession:
+        path = url.removeprefix(UNIX_SCHEME)
+        session = self.unix_sessions.get(path)
+        if session is None:
+            connector = aiohttp.UnixConnector(path=path, limit=100)
+            timeout = aiohttp.ClientTimeout(total=30)
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                trace_configs=self._get_trace_configs(),
+            )
+            self.unix_sessions[path] = session
+        return session
+
+    @staticmethod
+    def _get_trace_configs() -> list[aiohttp.TraceConfig] | None:
+        if not get_settings().server_timing_enabled:
+            return None
+        return [create_trace_config()]
+
+    def pool_stats(self) -> list[tuple[str, int, int]]:
+        """host별 (사용 중, idle) connection 수, aiohttp 공개 API가 없어 connector 내부 상태를 읽음"""
+        stats = []
+        if self.session is not None:
+            stats += self._connector_stats(self.session.connector)
+        for path, session in self.unix_sessions.items():
+            stats += [
+                (UNIX_SCHEME + path, acquired, idle)
+                for _, acquired, idle in self._connector_stats(session.connector)
+            ]
+        return stats
+
+    @staticmethod
+    def _connector_stats(
+        connector: aiohttp.BaseConnector | None,
+    ) -> list[tuple[str, int, int]]:
+        if connector is None:
+            return []
+        acquired = getattr(connector, "_acquired_per_host", {})
+        idle = getattr(connector, "_conns", {})
+        return [
+            (
+                f"{key.host}:{key.port}",
+                len(acquired.get(key, ())),
+                len(idle.get(key, ())),
+            )
+            for key in acquired.keys() | idle.keys()
+        ]
+
     async def close(self) -> None:
         if self.session:
             await self.session.close()
             self.session = None
+        for session in self.unix_sessions.values():
+            await session.close()
+        self.unix_sessions.clear()
 
 
 get_session = AiohttpSessionEngine()
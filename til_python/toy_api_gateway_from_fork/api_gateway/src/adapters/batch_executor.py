@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import posixpath
+import re
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import unquote
+
+from adapters.exceptions import (
+    GatewayRouterException,
+    NotFoundException,
+    ServiceUnavailableException,
+)
+from config.settings import BaseSettings
+from domain.enitities.batch import SubRequest, SubResponse
+from ports.gateway_router import GatewayRouter
+from use_cases.exceptions import ForbiddenException, RateLimitedException
+from use_cases.json_codec import JSONCodec
+from use_cases.rate_limiter import RateLimiter, get_rate_limit_key, get_rate_limiter
+
+logger = logging.getLogger()
+
+# sub-request body에 맞지 않는 batch 요청의 header
+EXCLUDED_HEADERS = frozenset({"content-length", "content-type", "transfer-encoding"})
+
+# sub-request가 덮어쓸 수 없는 header: gateway가 검증한 인증 정보, 요청/connection 단위 header
+PROTECTED_HEADERS = frozenset(
+    {
+        "authorization",
+        "host",
+        "content-length",
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+# sub-request 실패를 generic handler의 exception handler와 같은 status로 변환
+EXCEPTION_STATUSES: tuple[tuple[type[Exception], HTTPStatus], ...] = (
+    (TimeoutError, HTTPStatus.GATEWAY_TIMEOUT),
+    (RateLimitedException, HTTPStatus.TOO_MANY_REQUESTS),
+    (NotFoundException, HTTPStatus.NOT_FOUND),
+    (ForbiddenException, HTTPStatus.FORBIDDEN),
+    (ServiceUnavailableException, HTTPStatus.SERVICE_UNAVAILABLE),
+    (GatewayRouterException, HTTPStatus.BAD_REQUEST),
+)
+
+
+class BatchExecutor:
+    """sub-request들을 최대 batch_concurrency개씩 동시에 gateway router로 보냄
+
+    sub-request마다 timeout을 따로 두고, 실패도 예외 대신 해당 sub-request의 status로 돌려줌
+    sub-request도 /{service}/... 요청처럼 service의 RateLimit bucket에서 하나씩 차감
+    """
+
+    def __init__(
+        self,
+        router: GatewayRouter,
+        settings: BaseSettings,
+        codec: JSONCodec,
+        headers: dict[str, str],
+        limiter: RateLimiter | None = None,
+        client: str | None = None,
+    ) -> None:
+        self._router = router
+        self._settings = settings
+        self._codec = codec
+        self._headers = {
+            name.lower(): value
+            for name, value in headers.items()
+            if name.lower() not in EXCLUDED_HEADERS
+        }
+        self._limiter = limiter if limiter is not None else get_rate_limiter()
+        self._client = client
+        self._semaphore = asyncio.Semaphore(settings.batch_concurrency)
+
+    async def run(self, requests: list[SubRequest]) -> list[SubResponse]:
+        """요청 순서대로 결과를 반환"""
+        return await asyncio.gather(
+            *(self._send(index, request) for index, request in enumerate(requests))
+        )
+
+    async def stream(self, requests: list[SubRequest]) -> AsyncIterator[SubResponse]:
+        """완료되는 순서대로 결과를 반환"""
+        tasks = [
+            asyncio.create_task(self._send(index, request))
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # client가 중간에 끊으면 남은 sub-request를 취소
+            for task in tasks:
+                task.cancel()
+
+    def encode(self, response: SubResponse) -> dict[str, Any]:
+        try:
+            body = self._codec.loads(response.body) if response.body else None
+        except ValueError:
+            # JSON이 아닌 응답은 문자열로 전달
+            body = response.body.decode(errors="replace")
+        return {
+            "index": response.index,
+            "id": response.id,
+            "status": response.status,
+            "body": body,
+        }
+
+    async def _send(self, index: int, request: SubRequest) -> SubResponse:
+        timeout = request.timeout or self._settings.batch_timeout
+        try:
+            # 동시 실행 대기 시간까지 timeout에 포함
+            async with asyncio.timeout(timeout), self._semaphore:
+                body, status = await self._call(request)
+        except Exception as e:
+            error_status = self._get_status(e)
+            if error_status is None:
+                logger.exception(f"{request.service}: {e}")
+                error_status = HTTPStatus.INTERNAL_SERVER_ERROR
+            status = error_status
+            message = "Timeout" if isinstance(e, TimeoutError) else str(e)
+            body = self._codec.dumps({"detail": message})
+        return SubResponse(index, request.id, status, body)
+
+    async def _call(self, request: SubRequest) -> tuple[bytes, int]:
+        path = self._get_path(request.path)
+        self._check_rate_limit(request.service)
+        # header 이름은 대소문자를 구분하지 않으므로 소문자로 합쳐 같은 header가 두 번 가지 않도록 함
+        headers = {
+            **self._headers,
+            **{
+                name.lower(): value
+                for name, value in request.headers.items()
+                if name.lower() not in PROTECTED_HEADERS
+            },
+        }
+        body = None
+        if request.body is not None:
+            body = self._codec.dumps(request.body)
+            headers["content-type"] = "application/json"
+        return await self._router(request.service, path, headers, request.method, body)
+
+    def _check_rate_limit(self, service_name: str) -> None:
+        service = self._settings.service_mapping.get(service_name)
+        if service is None or service.rate_limit is None:
+            return
+        key = get_rate_limit_key(
+            self._settings,
+            service.rate_limit,
+            self._headers.get("authorization", ""),
+            self._client,
+        )
+        if not self._limiter.acquire((service_name, key), service.rate_limit).allowed:
+            raise RateLimitedException
+
+    @staticmethod
+    def _get_path(path: str) -> str:
+        # JSON body의 경로는 client가 정규화해 주지 않고, upstream URL을 만들 때 yarl이
+        # %2e를 풀어 dot segment를 정리하므로 같은 기준으로 정리한 뒤 internal 경로를 막음
+        path, _, query = path.partition("?")
+        decoded = unquote(path)
+        if ".." in decoded.split("/"):
+            raise ForbiddenException
+        checked = posixpath.normpath(re.sub("/+", "/", f"/{decoded}"))
+        if checked == "/internal" or checked.startswith("/internal/"):
+            raise ForbiddenException
+        normalized = posixpath.normpath(re.sub("/+", "/", f"/{path}"))
+        if path.endswith("/") and normalized != "/":
+            normalized += "/"
+        return f"{normalized}?{query}" if query else normalized
+
+    @staticmethod
+    def _get_status(e: Exception) -> HTTPStatus | None:
+        for exception_type, status in EXCEPTION_STATUSES:
+            if isinstance(e, exception_type):
+                return status
+        return None
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable
+from http import HTTPMethod
+from typing import Any
+
+from adapters.response_cache import PrimaryKey, ResponseCache, parse_cache_control
+from config.settings import BaseSettings
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+
+logger = logging.getLogger()
+
+
+class CachedGatewayRouter(GatewayRouter):
+    CACHEABLE_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.HEAD})
+
+    def __init__(
+        self, router: GatewayRouter, cache: ResponseCache, settings: BaseSettings
+    ):
+        self._router = router
+        self._cache = cache
+        self._settings = settings
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        if not self._is_cacheable(service_name, method, headers):
+            return await self._router(service_name, route, headers, method, body)
+        upstream = await self._get_or_fetch(service_name, route, headers, method)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        if not self._is_cacheable(service_name, method, headers):
+            return await self._router.stream(service_name, route, headers, method, body)
+        return await self._get_or_fetch(service_name, route, headers, method)
+
+    async def _get_or_fetch(
+        self, service_name: str, route: str, headers: dict[str, Any], method: str
+    ) -> UpstreamResponse:
+        key = (service_name, method, route)
+        entry = self._cache.get(key, headers)
+        if entry is not None:
+            if not entry.is_fresh(time.monotonic()):
+                self._revalidate(key, headers)
+            return UpstreamResponse(entry.status_code, entry.headers, entry.body)
+        return await self._fetch(key, headers)
+
+    async def _fetch(
+        self, key: PrimaryKey, headers: dict[str, Any]
+    ) -> UpstreamResponse:
+        service_name, method, route = key
+        upstream = await self._router.stream(service_name, route, headers, method)
+        # 스트리밍으로 내려오는 큰 응답은 캐시하지 않고 그대로 전달
+        if isinstance(upstream.body, bytes):
+            self._cache.set(
+                key, headers, upstream.status_code, upstream.headers, upstream.body
+            )
+        return upstream
+
+    def _revalidate(self, key: PrimaryKey, headers: dict[str, Any]) -> None:
+        if key in self._cache.revalidating:
+            return
+
+        async def refresh() -> None:
+            try:
+                upstream = await self._fetch(key, headers)
+                # 캐시하지 않는 큰 응답은 읽을 client가 없으므로 connection을 바로 반환
+                if not isinstance(upstream.body, bytes):
+                    await upstream.close()
+            except Exception as e:
+                logger.warning(f"cache revalidation failed for {key}: {e}")
+            finally:
+                self._cache.revalidating.pop(key, None)
+
+        self._cache.revalidating[key] = asyncio.create_task(refresh())
+
+    def _is_cacheable(
+        self, service_name: str, method: str, headers: dict[str, Any]
+    ) -> bool:
+        service = self._settings.service_mapping.get(service_name)
+        if service is None or not service.cache_enabled:
+            return False
+        if method not in self.CACHEABLE_METHODS:
+            return False
+        request_directives = parse_cache_control(headers.get("cache-control", ""))
+        return not {"no-cache", "no-store"} & request_directives.keys()
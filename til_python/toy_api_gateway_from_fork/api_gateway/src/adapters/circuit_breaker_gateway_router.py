@@ -0,0 +1,92 @@
+import asyncio
+import time
+from collections.abc import AsyncIterable
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+from adapters.exceptions import GatewayRouterException, ServiceUnavailableException
+from config.settings import BaseSettings
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+
+class CircuitBreakerGatewayRouter(GatewayRouter):
+    def __init__(
+        self,
+        router: GatewayRouter,
+        breakers: CircuitBreakerRegistry,
+        settings: BaseSettings,
+    ):
+        self._router = router
+        self._breakers = breakers
+        self._settings = settings
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        breaker = self._acquire(service_name)
+        if breaker is None:
+            return await self._router(service_name, route, headers, method, body)
+        start = time.perf_counter()
+        try:
+            response_body, status_code = await self._router(
+                service_name, route, headers, method, body
+            )
+        except (asyncio.CancelledError, ServiceUnavailableException):
+            # 취소되었거나 gateway가 부하를 줄이려 거절한 요청은 upstream 결과가 아님
+            breaker.abandon()
+            raise
+        except GatewayRouterException:
+            breaker.record(False, time.perf_counter() - start)
+            raise
+        breaker.record(
+            status_code < HTTPStatus.INTERNAL_SERVER_ERROR, time.perf_counter() - start
+        )
+        return response_body, status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        breaker = self._acquire(service_name)
+        if breaker is None:
+            return await self._router.stream(service_name, route, headers, method, body)
+        start = time.perf_counter()
+        try:
+            upstream = await self._router.stream(
+                service_name, route, headers, method, body
+            )
+        except (asyncio.CancelledError, ServiceUnavailableException):
+            # 취소되었거나 gateway가 부하를 줄이려 거절한 요청은 upstream 결과가 아님
+            breaker.abandon()
+            raise
+        except GatewayRouterException:
+            breaker.record(False, time.perf_counter() - start)
+            raise
+        # 스트리밍 응답은 header 도착까지의 시간으로 판단
+        breaker.record(
+            upstream.status_code < HTTPStatus.INTERNAL_SERVER_ERROR,
+            time.perf_counter() - start,
+        )
+        return upstream
+
+    def _acquire(self, service_name: str) -> CircuitBreaker | None:
+        if (
+            not self._settings.circuit_breaker_enabled
+            or service_name not in self._settings.service_mapping
+        ):
+            return None
+        breaker = self._breakers.get(service_name, self._settings)
+        if not breaker.allow():
+            # open 상태에서는 upstream timeout을 기다리지 않고 바로 실패
+            raise ServiceUnavailableException(max(breaker.retry_after, 0))
+        return breaker
@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPMethod
+from typing import Any
+
+from config.settings import BaseSettings, get_settings
+from ports.gateway_router import GatewayRouter, UpstreamResponse, close_unclaimed
+
+FlightKey = tuple[str, str, str, tuple[str, ...]]
+
+
+@dataclass
+class Flight:
+    task: asyncio.Task[UpstreamResponse]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """동일 key의 upstream 요청을 하나만 보내고 결과를 모든 대기자에게 공유"""
+
+    def __init__(self, max_waiters: int) -> None:
+        self.max_waiters = max_waiters
+        self.flights: dict[FlightKey, Flight] = {}
+
+    def join(self, key: FlightKey) -> Flight | None:
+        flight = self.flights.get(key)
+        if flight is None or flight.waiters >= self.max_waiters:
+            return None
+        flight.waiters += 1
+        return flight
+
+    def start(self, key: FlightKey, task: asyncio.Task[UpstreamResponse]) -> None:
+        self.flights[key] = Flight(task)
+        task.add_done_callback(lambda _: self._finish(key, task))
+
+    def _finish(self, key: FlightKey, task: asyncio.Task[UpstreamResponse]) -> None:
+        flight = self.flights.get(key)
+        if flight is not None and flight.task is task:
+            del self.flights[key]
+
+
+class CoalescingGatewayRouter(GatewayRouter):
+    COALESCING_METHODS = frozenset({HTTPMethod.GET, HTTPMethod.HEAD})
+
+    def __init__(
+        self, router: GatewayRouter, single_flight: SingleFlight, settings: BaseSettings
+    ):
+        self._router = router
+        self._single_flight = single_flight
+        self._settings = settings
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        if not self._is_coalescable(method, body):
+            return await self._router(service_name, route, headers, method, body)
+        upstream = await self._coalesce(service_name, route, headers, method)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        if not self._is_coalescable(method, body):
+            return await self._router.stream(service_name, route, headers, method, body)
+        return await self._coalesce(service_name, route, headers, method)
+
+    async def _coalesce(
+        self, service_name: str, route: str, headers: dict[str, Any], method: str
+    ) -> UpstreamResponse:
+        key = (service_name, method, route, self._key_headers(headers))
+        flight = self._single_flight.join(key)
+        if flight is None:
+            return await self._lead(key, service_name, route, headers, method)
+
+        # 대기자의 취소가 공유 중인 upstream 요청을 취소하지 않도록 shield
+        upstream = await asyncio.shield(flight.task)
+        if not isinstance(upstream.body, bytes):
+            # 스트리밍 응답은 leader만 소비할 수 있으므로 대기자는 직접 요청
+            return await self._router.stream(service_name, route, headers, method)
+        return upstream
+
+    async def _lead(
+        self,
+        key: FlightKey,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str,
+    ) -> UpstreamResponse:
+        task = asyncio.create_task(
+            self._router.stream(service_name, route, headers, method)
+        )
+        if key not in self._single_flight.flights:
+            # 대기자 수 제한을 넘은 요청은 단독으로 보내고 flight를 교체하지 않음
+            self._single_flight.start(key, task)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(close_unclaimed)
+            raise
+
+    def _key_headers(self, headers: dict[str, Any]) -> tuple[str, ...]:
+        return tuple(
+            headers.get(name, "") for name in self._settings.coalescing_key_headers
+        )
+
+    def _is_coalescable(
+        self, method: str, body: bytes | AsyncIterable[bytes] | None
+    ) -> bool:
+        return (
+            self._settings.coalescing_enabled
+            and method in self.COALESCING_METHODS
+            and not body
+        )
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight:
+    return SingleFlight(get_settings().coalescing_max_waiters)
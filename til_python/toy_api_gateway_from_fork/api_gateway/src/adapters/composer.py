@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import re
+from collections.abc import Mapping
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import quote
+
+from adapters.exceptions import CompositionException, ServiceUnavailableException
+from domain.enitities.composition import ComposedRoute, UpstreamCall, is_internal_path
+from ports.gateway_router import GatewayRouter
+from use_cases.exceptions import ForbiddenException
+from use_cases.json_codec import JSONCodec
+
+logger = logging.getLogger()
+
+PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+def lookup(values: Mapping[str, Any], source: str) -> Any:
+    """ "call.field.0.sub" 형식의 경로로 중첩된 dict/list 값을 찾음, 없으면 None"""
+    value: Any = values
+    for key in source.split("."):
+        if isinstance(value, Mapping):
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+    return value
+
+
+class Composer:
+    """ComposedRoute의 call들을 의존 관계 순서로 실행해 하나의 JSON 객체로 합침
+
+    의존하는 call이 끝나는 즉시 실행하므로 독립적인 call은 동시에 진행되고,
+    전체 latency는 모든 call의 합이 아니라 가장 긴 의존 경로의 합이 됨
+    """
+
+    def __init__(
+        self, router: GatewayRouter, codec: JSONCodec, headers: dict[str, Any]
+    ) -> None:
+        self._router = router
+        self._codec = codec
+        self._headers = headers
+
+    async def __call__(
+        self, route: ComposedRoute, params: Mapping[str, str]
+    ) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run(name: str, call: UpstreamCall) -> None:
+            # 의존하는 call이 실패하면 gather가 예외를 그대로 전파
+            await asyncio.gather(*(tasks[dependency] for dependency in call.depends_on))
+            results[name] = await self._call(name, call, {**params, **results})
+
+        for name, call in route.calls.items():
+            tasks[name] = asyncio.create_task(run(name, call))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            # 하나라도 실패하면 아직 진행 중인 call은 취소
+            for task in tasks.values():
+                task.cancel()
+
+        if not route.merge:
+            return results
+        return {key: lookup(results, source) for key, source in route.merge.items()}
+
+    async def _call(
+        self, name: str, call: UpstreamCall, values: Mapping[str, Any]
+    ) -> Any:
+        path = PLACEHOLDER.sub(
+            lambda match: self._quote(lookup(values, match.group(1))), call.path
+        )
+        if is_internal_path(path):
+            raise ForbiddenException
+        try:
+            body, status = await self._router(
+                call.service, path, self._headers, call.method
+            )
+            if status >= HTTPStatus.BAD_REQUEST:
+                raise CompositionException(name, status)
+            return self._codec.loads(body) if body else None
+        except Exception as e:
+            if call.optional:
+                return None
+            # circuit breaker의 503(Retry-After)은 그대로 전달
+            if isinstance(e, CompositionException | ServiceUnavailableException):
+                raise
+            logger.exception(f"{name}: {e}")
+            raise CompositionException(name) from e
+
+    @staticmethod
+    def _quote(value: Any) -> str:
+        # "/"는 escape되지만 "."과 ".."은 그대로 남아 yarl이 dot segment로 정리하면서
+        # template 밖의 경로가 되므로 거절
+        text = str(value)
+        if text in (".", ".."):
+            raise ForbiddenException
+        return quote(text, safe="")
@@ -0,0 +1,150 @@
+import hashlib
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Protocol
+
+from config.settings import get_settings
+from domain.enitities.service import CompressionPolicy
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    # 지금까지 받은 데이터를 모두 내보내고 stream은 이어감(스트리밍 chunk마다 호출)
+    def flush(self) -> bytes: ...
+
+    # stream을 끝냄
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)  # type: ignore[no-any-return]
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()  # type: ignore[no-any-return]
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()  # type: ignore[no-any-return]
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# 같은 q 값이면 앞에 있는 인코딩을 우선, 설치되지 않은 라이브러리의 인코딩은 제외
+compressors: dict[str, Callable[[int], Compressor]] = {}
+if zstandard is not None:
+    compressors["zstd"] = ZstdCompressor
+if brotli is not None:
+    compressors["br"] = BrotliCompressor
+compressors["gzip"] = GzipCompressor
+
+
+def get_level(policy: CompressionPolicy, encoding: str) -> int:
+    return {
+        "gzip": policy.gzip_level,
+        "br": policy.brotli_quality,
+        "zstd": policy.zstd_level,
+    }[encoding]
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding의 q 값과 서버 우선순위로 응답 인코딩을 선택, 없으면 None"""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        if coding:
+            weights[coding.strip().lower()] = q
+
+    default = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in compressors:
+        q = weights.get(encoding, default)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    compressor = compressors[encoding](level)
+    return compressor.compress(data) + compressor.finish()
+
+
+class CompressedBodyCache:
+    """원본 body digest 기준으로 압축 결과를 보관하는 byte 크기 제한 LRU 캐시"""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, int, bytes], bytes] = OrderedDict()
+
+    def compress(self, data: bytes, encoding: str, level: int) -> bytes:
+        key = (encoding, level, hashlib.sha256(data).digest())
+        compressed = self._entries.get(key)
+        if compressed is not None:
+            self._entries.move_to_end(key)
+            return compressed
+
+        compressed = compress(data, encoding, level)
+        if len(compressed) <= self.max_bytes:
+            self._entries[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache
+def get_compressed_body_cache() -> CompressedBodyCache:
+    return CompressedBodyCache(get_settings().compression_cache_max_bytes)
@@ -0,0 +1,129 @@
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+from adapters.exceptions import GatewayRouterException, ServiceUnavailableException
+from config.settings import BaseSettings
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.concurrency_limit import ConcurrencyLimiter, ConcurrencyLimiterRegistry
+from use_cases.priority import PriorityClassifier
+
+# upstream이 과부하라고 알려 온 응답, 제한을 바로 줄임
+OVERLOAD_STATUSES = (HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
+
+
+class ConcurrencyLimitGatewayRouter(GatewayRouter):
+    """service별 적응형 동시 요청 제한, 넘친 요청은 upstream timeout까지 쌓지 않고 바로 503
+
+    classifier가 있으면 제한을 넘어 기다리는 요청을 priority class별로 나눠 weight 비율로 처리
+    """
+
+    def __init__(
+        self,
+        router: GatewayRouter,
+        limiters: ConcurrencyLimiterRegistry,
+        settings: BaseSettings,
+        classifier: PriorityClassifier | None = None,
+    ):
+        self._router = router
+        self._limiters = limiters
+        self._settings = settings
+        self._classifier = classifier
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        limiter = await self._acquire(service_name, route, headers)
+        if limiter is None:
+            return await self._router(service_name, route, headers, method, body)
+        start = time.perf_counter()
+        try:
+            response_body, status_code = await self._router(
+                service_name, route, headers, method, body
+            )
+        except GatewayRouterException:
+            limiter.record(time.perf_counter() - start, True)
+            raise
+        else:
+            limiter.record(
+                time.perf_counter() - start, status_code in OVERLOAD_STATUSES
+            )
+        finally:
+            limiter.release()
+        return response_body, status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        limiter = await self._acquire(service_name, route, headers)
+        if limiter is None:
+            return await self._router.stream(service_name, route, headers, method, body)
+        start = time.perf_counter()
+        try:
+            upstream = await self._router.stream(
+                service_name, route, headers, method, body
+            )
+        except GatewayRouterException:
+            limiter.record(time.perf_counter() - start, True)
+            limiter.release()
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+        # 스트리밍 응답은 header 도착까지의 시간으로 판단하고 body 전송이 끝나면 slot 반환
+        limiter.record(
+            time.perf_counter() - start, upstream.status_code in OVERLOAD_STATUSES
+        )
+        if isinstance(upstream.body, bytes):
+            limiter.release()
+        else:
+            upstream.close = self._close_with(upstream, limiter)
+        return upstream
+
+    async def _acquire(
+        self, service_name: str, route: str, headers: dict[str, Any]
+    ) -> ConcurrencyLimiter | None:
+        if (
+            not self._settings.concurrency_limit_enabled
+            or service_name not in self._settings.service_mapping
+        ):
+            return None
+        limiter = self._limiters.get(service_name, self._settings)
+        if limiter.try_acquire():
+            return limiter
+        # 기다려야 할 때만 priority를 정함(claim rule이면 token 검증이 필요)
+        priority = None
+        if self._classifier is not None:
+            priority = self._classifier.classify(service_name, route, headers)
+        if not await limiter.acquire(priority):
+            raise ServiceUnavailableException(
+                self._settings.concurrency_limit_retry_after
+            )
+        return limiter
+
+    @staticmethod
+    def _close_with(
+        upstream: UpstreamResponse, limiter: ConcurrencyLimiter
+    ) -> Callable[[], Awaitable[None]]:
+        close = upstream.close
+        closed = False
+
+        async def wrapper() -> None:
+            nonlocal closed
+            if not closed:
+                closed = True
+                limiter.release()
+            await close()
+
+        return wrapper
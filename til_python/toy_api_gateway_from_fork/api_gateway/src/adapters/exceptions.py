@@ -3,6 +3,29 @@ class GatewayRouterException(Exception):
         return "Something goes wrong. Please try again later"
 
 
+class UpstreamConnectionException(GatewayRouterException):
+    # upstream에 요청이 전달되기 전(connect 단계)에 실패, 재시도해도 안전
+    pass
+
+
 class NotFoundException(Exception):
     def __str__(self) -> str:
         return "Not Found"
+
+
+class ServiceUnavailableException(Exception):
+    def __init__(self, retry_after: float = 1) -> None:
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return "Service temporarily unavailable"
+
+
+class CompositionException(Exception):
+    # composed route의 필수 call이 실패, status는 upstream 응답 status(예외면 None)
+    def __init__(self, call: str, status: int | None = None) -> None:
+        self.call = call
+        self.status = status
+
+    def __str__(self) -> str:
+        return f"Upstream call '{self.call}' failed"
@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+
+import aiohttp
+import httpx
+
+from adapters.aihttp_gateway_router import UNIX_BASE_URL, UNIX_SCHEME, get_session
+from config.settings import BaseSettings
+from domain.enitities.service import Service
+from use_cases.circuit_breaker import CircuitBreakerRegistry, circuit_breakers
+
+logger = logging.getLogger()
+
+# upstream_client 설정에 따라 aiohttp session 또는 httpx client로 probe
+UpstreamClient = aiohttp.ClientSession | httpx.AsyncClient
+
+
+class HealthProber:
+    """service의 health_path를 주기적으로 호출해 결과를 circuit breaker에 반영"""
+
+    def __init__(self, breakers: CircuitBreakerRegistry) -> None:
+        self.breakers = breakers
+        self.results: dict[str, bool] = {}
+        # service slug -> 연속으로 실패한 health check 횟수
+        self.failures: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def start(
+        self,
+        get_client: Callable[[], Awaitable[UpstreamClient]],
+        settings: BaseSettings,
+    ) -> None:
+        services = [s for s in settings.service_mapping.values() if s.health_path]
+        if services and self._task is None:
+            self._task = asyncio.create_task(self._run(get_client, settings, services))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(
+        self,
+        get_client: Callable[[], Awaitable[UpstreamClient]],
+        settings: BaseSettings,
+        services: list[Service],
+    ) -> None:
+        client = await get_client()
+        while True:
+            await asyncio.gather(
+                *(self.probe(client, settings, service) for service in services)
+            )
+            await asyncio.sleep(settings.health_check_interval)
+
+    async def probe(
+        self, client: UpstreamClient, settings: BaseSettings, service: Service
+    ) -> bool:
+        results = await asyncio.gather(
+            *(
+                self._probe_url(client, settings, url, service.health_path)
+                for url in service.urls
+            )
+        )
+        healthy = self.results[service.slug] = any(results)
+        breaker = self.breakers.get(service.slug, settings)
+        if healthy:
+            self.failures[service.slug] = 0
+            breaker.probe_succeeded()
+            return True
+        # 한 번 놓친 health check로 service 전체를 막지 않도록 연속 실패가 쌓였을 때만 open
+        failures = self.failures[service.slug] = self.failures.get(service.slug, 0) + 1
+        if failures >= settings.health_check_failure_threshold:
+            breaker.trip()
+        return False
+
+    @classmethod
+    async def _probe_url(
+        cls,
+        client: UpstreamClient,
+        settings: BaseSettings,
+        base_url: str,
+        health_path: str | None,
+    ) -> bool:
+        if isinstance(client, aiohttp.ClientSession) and base_url.startswith(
+            UNIX_SCHEME
+        ):
+            client, base_url = get_session.get_unix_session(base_url), UNIX_BASE_URL
+        url = f"{base_url}{health_path}"
+        try:
+            status = await cls._get_status(client, url, settings.health_check_timeout)
+            return status < HTTPStatus.INTERNAL_SERVER_ERROR
+        except Exception as e:
+            logger.warning(f"health check failed for {url}: {e}")
+            return False
+
+    @staticmethod
+    async def _get_status(client: UpstreamClient, url: str, timeout: float) -> int:
+        if isinstance(client, httpx.AsyncClient):
+            return (await client.get(url, timeout=timeout)).status_code
+        async with client.get(
+            url, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            return response.status
+
+
+health_prober = HealthProber(circuit_breakers)
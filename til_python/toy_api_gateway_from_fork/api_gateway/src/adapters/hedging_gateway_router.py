@@ -0,0 +1,126 @@
+import asyncio
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable
+from http import HTTPMethod
+from typing import Any
+
+from adapters.exceptions import UpstreamConnectionException
+from config.settings import BaseSettings
+from domain.enitities.service import RetryPolicy
+from ports.gateway_router import GatewayRouter, UpstreamResponse, close_unclaimed
+from use_cases.retry_policy import RetryState, RetryStateRegistry, get_backoff
+
+
+class HedgingGatewayRouter(GatewayRouter):
+    IDEMPOTENT_METHODS = frozenset(
+        {HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS}
+    )
+
+    def __init__(
+        self, router: GatewayRouter, states: RetryStateRegistry, settings: BaseSettings
+    ):
+        self._router = router
+        self._states = states
+        self._settings = settings
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        policy = self._get_policy(service_name, method, body)
+        if policy is None:
+            return await self._router(service_name, route, headers, method, body)
+        upstream = await self._send(service_name, route, headers, method, policy)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        policy = self._get_policy(service_name, method, body)
+        if policy is None:
+            return await self._router.stream(service_name, route, headers, method, body)
+        return await self._send(service_name, route, headers, method, policy)
+
+    async def _send(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str,
+        policy: RetryPolicy,
+    ) -> UpstreamResponse:
+        state = self._states.get(self._settings.service_mapping[service_name], policy)
+        state.budget.deposit()
+
+        async def attempt() -> UpstreamResponse:
+            start = time.perf_counter()
+            upstream = await self._router.stream(service_name, route, headers, method)
+            state.latency.record(time.perf_counter() - start)
+            return upstream
+
+        retries = 0
+        while True:
+            try:
+                return await self._hedge(attempt, policy, state)
+            except UpstreamConnectionException:
+                # connect 단계 실패만 재시도, budget이 바닥나면 바로 실패
+                if retries >= policy.max_retries or not state.budget.withdraw():
+                    raise
+                await asyncio.sleep(get_backoff(policy, retries))
+                retries += 1
+
+    @staticmethod
+    async def _hedge(
+        attempt: Callable[[], Awaitable[UpstreamResponse]],
+        policy: RetryPolicy,
+        state: RetryState,
+    ) -> UpstreamResponse:
+        primary = asyncio.ensure_future(attempt())
+        delay = state.latency.percentile(policy.hedge_percentile)
+        if not policy.hedge or delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(
+                pending, timeout=max(delay, policy.hedge_min_delay)
+            )
+            if not done and state.budget.withdraw():
+                pending.add(asyncio.ensure_future(attempt()))
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    # 같은 round에 함께 성공한 나머지 응답도 connection을 반환
+                    for task in succeeded[1:]:
+                        close_unclaimed(task)
+                    return succeeded[0].result()
+                error = next(iter(done)).exception()
+            assert error is not None
+            raise error
+        finally:
+            # 먼저 도착한 응답을 사용하고 나머지 요청은 취소
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(close_unclaimed)
+
+    def _get_policy(
+        self, service_name: str, method: str, body: bytes | AsyncIterable[bytes] | None
+    ) -> RetryPolicy | None:
+        service = self._settings.service_mapping.get(service_name)
+        if service is None or method not in self.IDEMPOTENT_METHODS or body:
+            return None
+        return service.retry_policy
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+import httpx
+
+from adapters.exceptions import (
+    GatewayRouterException,
+    NotFoundException,
+    UpstreamConnectionException,
+)
+from config.settings import BaseSettings
+from domain.enitities.service import Service
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.load_balancing import LoadBalancerRegistry, load_balancers
+
+logger = logging.getLogger()
+
+# HTTP/2에서는 connection 단위 header를 보낼 수 없음(RFC 9113 8.2.2)
+HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+)
+
+
+class HttpxGatewayRouter(GatewayRouter):
+    """HTTP/2 connection 하나에 여러 요청을 multiplexing 하는 httpx 기반 GatewayRouter"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        settings: BaseSettings,
+        balancers: LoadBalancerRegistry = load_balancers,
+    ):
+        self._client = client
+        self._settings = settings
+        self._balancers = balancers
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        upstream = await self.stream(service_name, route, headers, method, body)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        service = self._get_service(service_name)
+        endpoint = self._balancers.get(service).pick()
+        endpoint.acquire()
+        start = time.perf_counter()
+        request = self._client.build_request(
+            method,
+            self._get_url(endpoint.url, route),
+            headers=self._get_headers(headers),
+            content=body,
+        )
+        try:
+            response = await self._client.send(request, stream=True)
+        except asyncio.CancelledError:
+            endpoint.release()
+            raise
+        except Exception as e:
+            endpoint.observe(time.perf_counter() - start)
+            endpoint.release()
+            logger.exception(f"{service.name}: {e}")
+            raise self._get_exception(e) from e
+        endpoint.observe(time.perf_counter() - start)
+
+        content_length = response.headers.get("content-length")
+        if response.status_code == HTTPStatus.NO_CONTENT or (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) <= self._settings.streaming_threshold
+        ):
+            # 작은 응답은 한 번에 읽고 stream을 바로 반환(buffered fast path)
+            try:
+                response_body = await response.aread()
+            except Exception as e:
+                logger.exception(f"{service.name}: {e}")
+                raise GatewayRouterException from e
+            finally:
+                await response.aclose()
+                endpoint.release()
+            return UpstreamResponse(
+                response.status_code, response.headers, response_body
+            )
+
+        released = False
+
+        async def close() -> None:
+            nonlocal released
+            await response.aclose()
+            if not released:
+                released = True
+                endpoint.release()
+
+        return UpstreamResponse(
+            response.status_code,
+            response.headers,
+            self._iter_chunks(service, response),
+            close,
+        )
+
+    async def _iter_chunks(
+        self, service: Service, response: httpx.Response
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes(
+                self._settings.streaming_chunk_size
+            ):
+                yield chunk
+        except Exception as e:
+            # 이미 status/header가 나간 뒤라 예외 응답으로 바꿀 수 없으므로 로그만 남기고 중단
+            logger.exception(f"{service.name}: {e}")
+        finally:
+            await response.aclose()
+
+    def _get_service(self, service_name: str) -> Service:
+        service = self._settings.service_mapping.get(service_name)
+        if service is None:
+            raise NotFoundException
+        return service
+
+    @staticmethod
+    def _get_exception(e: Exception) -> GatewayRouterException:
+        if isinstance(e, httpx.ConnectError | httpx.ConnectTimeout):
+            return UpstreamConnectionException()
+        return GatewayRouterException()
+
+    @staticmethod
+    def _get_url(base_url: str, route: str) -> str:
+        return base_url + (route[:-1] if route.endswith("/") else route)
+
+    @staticmethod
+    def _get_headers(headers: dict[str, Any]) -> dict[str, Any]:
+        return {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+
+
+class HttpxClientEngine:
+    def __init__(self) -> None:
+        self.client: None | httpx.AsyncClient = None
+
+    def __call__(self, settings: BaseSettings) -> httpx.AsyncClient:
+        # client(connection pool)를 싱글톤으로 사용
+        if self.client is None:
+            h2c = settings.http2_prior_knowledge
+            self.client = httpx.AsyncClient(
+                mounts={
+                    # prior knowledge면 평문 upstream에도 upgrade 없이 h2c로 연결
+                    "http://": httpx.AsyncHTTPTransport(
+                        http1=not h2c,
+                        http2=True,
+                        limits=self._get_limits(settings, h2c),
+                    ),
+                    # https는 ALPN으로 협상하므로 HTTP/1.1로 연결될 수도 있음
+                    "https://": httpx.AsyncHTTPTransport(
+                        http2=True, limits=self._get_limits(settings, False)
+                    ),
+                },
+                timeout=httpx.Timeout(30),
+            )
+        return self.client
+
+    @staticmethod
+    def _get_limits(settings: BaseSettings, http2_only: bool) -> httpx.Limits:
+        # HTTP/2 connection 수 제한은 HTTP/2로만 연결하는 pool에만 적용
+        if http2_only:
+            return httpx.Limits(max_connections=settings.http2_max_connections)
+        return httpx.Limits(max_connections=settings.http1_max_connections)
+
+    async def close(self) -> None:
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+
+get_http2_client = HttpxClientEngine()
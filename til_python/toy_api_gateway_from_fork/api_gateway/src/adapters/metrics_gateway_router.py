@@ -0,0 +1,93 @@
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable
+from http import HTTPMethod
+from typing import Any
+
+from config.settings import BaseSettings
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.metrics import MetricsRegistry, ServiceMetrics, metrics_registry
+
+
+class MetricsGatewayRouter(GatewayRouter):
+    """실제 upstream 요청 단위로 status별 요청 수, latency, 진행 중인 요청 수를 기록
+
+    등록된 service만 기록, 임의의 slug로 series가 끝없이 늘어나지 않도록 함
+    """
+
+    def __init__(
+        self,
+        router: GatewayRouter,
+        settings: BaseSettings,
+        registry: MetricsRegistry = metrics_registry,
+    ):
+        self._router = router
+        self._settings = settings
+        self._registry = registry
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        if service_name not in self._settings.service_mapping:
+            return await self._router(service_name, route, headers, method, body)
+        metrics = self._registry.get(service_name)
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        status: int | str = "error"
+        try:
+            response_body, status = await self._router(
+                service_name, route, headers, method, body
+            )
+            return response_body, status
+        finally:
+            metrics.in_flight -= 1
+            metrics.record(status, time.perf_counter() - start)
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        if service_name not in self._settings.service_mapping:
+            return await self._router.stream(service_name, route, headers, method, body)
+        metrics = self._registry.get(service_name)
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            upstream = await self._router.stream(
+                service_name, route, headers, method, body
+            )
+        except BaseException:
+            metrics.in_flight -= 1
+            metrics.record("error", time.perf_counter() - start)
+            raise
+        # 스트리밍 응답은 header 도착까지의 시간을 기록하고 body 전송이 끝나면 in-flight 해제
+        metrics.record(upstream.status_code, time.perf_counter() - start)
+        if isinstance(upstream.body, bytes):
+            metrics.in_flight -= 1
+        else:
+            upstream.close = self._close_with(upstream, metrics)
+        return upstream
+
+    @staticmethod
+    def _close_with(
+        upstream: UpstreamResponse, metrics: ServiceMetrics
+    ) -> Callable[[], Awaitable[None]]:
+        close = upstream.close
+        closed = False
+
+        async def wrapper() -> None:
+            nonlocal closed
+            if not closed:
+                closed = True
+                metrics.in_flight -= 1
+            await close()
+
+        return wrapper
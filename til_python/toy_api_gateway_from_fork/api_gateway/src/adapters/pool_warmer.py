@@ -0,0 +1,108 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from adapters.aihttp_gateway_router import UNIX_BASE_URL, UNIX_SCHEME, get_session
+from adapters.health_prober import UpstreamClient
+from adapters.service_discovery import ServiceDiscovery, service_discovery
+from config.settings import BaseSettings
+from use_cases.load_balancing import LoadBalancerRegistry, load_balancers
+
+logger = logging.getLogger()
+
+
+class PoolWarmer:
+    """시작 시 service endpoint마다 keep-alive connection을 미리 열어 배포 직후 첫 요청의 연결 비용을 없앰
+
+    warmup이 끝나거나 pool_warmup_timeout이 지날 때까지 warming이 True이고 /healthcheck가 503을 반환,
+    httpx(HTTP/2) client는 동시 요청이 connection 하나에 multiplexing 되므로 endpoint마다 connection을 하나 엶
+    """
+
+    def __init__(
+        self,
+        balancers: LoadBalancerRegistry = load_balancers,
+        discovery: ServiceDiscovery = service_discovery,
+    ) -> None:
+        self.balancers = balancers
+        self.discovery = discovery
+        self.warming = False
+        # endpoint url -> 열어 둔 connection 수
+        self.results: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def start(
+        self,
+        get_client: Callable[[], Awaitable[UpstreamClient]],
+        settings: BaseSettings,
+    ) -> None:
+        if settings.pool_warmup_connections > 0 and self._task is None:
+            self.warming = True
+            self._task = asyncio.create_task(self._run(get_client, settings))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.warming = False
+
+    async def _run(
+        self,
+        get_client: Callable[[], Awaitable[UpstreamClient]],
+        settings: BaseSettings,
+    ) -> None:
+        try:
+            async with asyncio.timeout(settings.pool_warmup_timeout):
+                await self.warm(await get_client(), settings)
+        except TimeoutError:
+            logger.warning("pool warmup timed out, serving with partially warm pools")
+        finally:
+            self.warming = False
+
+    async def warm(self, client: UpstreamClient, settings: BaseSettings) -> None:
+        if settings.service_discovery_enabled:
+            # IP로 펼쳐진 endpoint(connection pool key)를 warmup 하도록 첫 DNS 조회를 기다림
+            await self.discovery.refreshed.wait()
+        jobs = []
+        for service in settings.service_mapping.values():
+            path = service.health_path or "/"
+            for endpoint in self.balancers.get(service).endpoints:
+                jobs.append(self.warm_url(client, settings, endpoint.url, path))
+        await asyncio.gather(*jobs)
+
+    async def warm_url(
+        self, client: UpstreamClient, settings: BaseSettings, base_url: str, path: str
+    ) -> int:
+        """동시에 요청을 보내 connection을 여러 개 열고, 응답을 끝까지 읽어 pool에 keep-alive로 반환"""
+        url = base_url
+        connections = settings.pool_warmup_connections
+        if isinstance(client, httpx.AsyncClient):
+            connections = 1
+        elif base_url.startswith(UNIX_SCHEME):
+            client, url = get_session.get_unix_session(base_url), UNIX_BASE_URL
+        results = await asyncio.gather(
+            *(self._request(client, f"{url}{path}") for _ in range(connections))
+        )
+        opened = self.results[base_url] = sum(results)
+        return opened
+
+    @staticmethod
+    async def _request(client: UpstreamClient, url: str) -> bool:
+        try:
+            if isinstance(client, httpx.AsyncClient):
+                # 응답을 모두 읽은 뒤 connection을 pool로 반환
+                await client.get(url)
+                return True
+            async with client.get(url) as response:
+                await response.read()
+                return True
+        except Exception as e:
+            logger.warning(f"pool warmup failed for {url}: {e}")
+            return False
+
+
+pool_warmer = PoolWarmer()
@@ -0,0 +1,229 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from config.settings import get_settings
+
+# RFC 9111 기준 기본적으로 캐시 가능한 status
+CACHEABLE_STATUSES = frozenset(
+    {
+        HTTPStatus.OK,
+        HTTPStatus.NON_AUTHORITATIVE_INFORMATION,
+        HTTPStatus.NO_CONTENT,
+        HTTPStatus.MOVED_PERMANENTLY,
+        HTTPStatus.NOT_FOUND,
+        HTTPStatus.GONE,
+    }
+)
+
+PrimaryKey = tuple[str, str, str]
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    fresh_until: float
+    stale_until: float
+    size: int
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size_bytes: int = 0
+    entries: int = 0
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: str | None) -> int | None:
+    if value is None or not value.isdigit():
+        return None
+    return int(value)
+
+
+def get_freshness(
+    headers: Mapping[str, str], authorized: bool
+) -> tuple[int, int] | None:
+    """upstream 응답 header로부터 (ttl, stale-while-revalidate) 초를 계산, 캐시 불가면 None"""
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if {"no-store", "no-cache", "private"} & directives.keys():
+        return None
+    # 공유 캐시는 Authorization 요청의 응답을 명시적으로 허용된 경우에만 저장(RFC 9111 3.5)
+    if authorized and not {"public", "s-maxage", "must-revalidate"} & directives.keys():
+        return None
+
+    ttl = _seconds(directives.get("s-maxage"))
+    if ttl is None:
+        ttl = _seconds(directives.get("max-age"))
+    if ttl is None and "Expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            date = (
+                parsedate_to_datetime(headers["Date"])
+                if "Date" in headers
+                else datetime.now(tz=UTC)
+            )
+        except (TypeError, ValueError):
+            return None
+        ttl = int((expires - date).total_seconds())
+    if not ttl or ttl <= 0:
+        return None
+    return ttl, _seconds(directives.get("stale-while-revalidate")) or 0
+
+
+class ResponseCache:
+    """byte 크기로 제한되는 in-memory LRU 응답 캐시(Vary header 반영)"""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[
+            tuple[PrimaryKey, tuple[str, ...]], CachedResponse
+        ] = OrderedDict()
+        # primary key별로 마지막 응답의 Vary header 이름 목록과 저장된 변형들
+        self._vary: dict[PrimaryKey, tuple[str, ...]] = {}
+        self._variants: dict[PrimaryKey, set[tuple[str, ...]]] = {}
+        # stale-while-revalidate로 백그라운드 갱신 중인 key(중복 갱신 방지, task GC 방지)
+        self.revalidating: dict[PrimaryKey, asyncio.Task[None]] = {}
+
+    def get(
+        self, key: PrimaryKey, request_headers: Mapping[str, Any]
+    ) -> CachedResponse | None:
+        vary = self._vary.get(key)
+        if vary is None:
+            self.stats.misses += 1
+            return None
+        entry_key = (key, self._vary_values(vary, request_headers))
+        entry = self._entries.get(entry_key)
+        now = time.monotonic()
+        if entry is None or not entry.is_usable(now):
+            if entry is not None:
+                self._remove(entry_key)
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(entry_key)
+        if entry.is_fresh(now):
+            self.stats.hits += 1
+        else:
+            self.stats.stale_hits += 1
+        return entry
+
+    def set(
+        self,
+        key: PrimaryKey,
+        request_headers: Mapping[str, Any],
+        status_code: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> bool:
+        if status_code not in CACHEABLE_STATUSES or len(body) > self.max_entry_bytes:
+            return False
+        response_headers = CIMultiDictProxy(CIMultiDict(headers))
+        freshness = get_freshness(
+            response_headers,
+            authorized=_get(request_headers, "authorization") is not None,
+        )
+        vary = tuple(
+            sorted(
+                name.strip().lower()
+                for name in response_headers.get("Vary", "").split(",")
+                if name.strip()
+            )
+        )
+        if freshness is None or "*" in vary:
+            return False
+
+        ttl, stale_while_revalidate = freshness
+        now = time.monotonic()
+        size = len(body) + sum(len(k) + len(v) for k, v in response_headers.items())
+        entry_key = (key, self._vary_values(vary, request_headers))
+        if self._vary.get(key) != vary:
+            # Vary 구성이 바뀌면 이전 변형들은 더 이상 조회할 수 없으므로 정리
+            for values in list(self._variants.get(key, ())):
+                self._remove((key, values))
+        if entry_key in self._entries:
+            self._remove(entry_key)
+        self._vary[key] = vary
+        self._variants.setdefault(key, set()).add(entry_key[1])
+        self._entries[entry_key] = CachedResponse(
+            status_code,
+            response_headers,
+            body,
+            now + ttl,
+            now + ttl + stale_while_revalidate,
+            size,
+        )
+        self.stats.size_bytes += size
+        self.stats.entries += 1
+        while self.stats.size_bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._vary.clear()
+        self._variants.clear()
+        self.stats.size_bytes = self.stats.entries = 0
+
+    def _remove(self, entry_key: tuple[PrimaryKey, tuple[str, ...]]) -> None:
+        entry = self._entries.pop(entry_key)
+        self.stats.size_bytes -= entry.size
+        self.stats.entries -= 1
+        key, values = entry_key
+        variants = self._variants[key]
+        variants.discard(values)
+        if not variants:
+            del self._variants[key]
+            del self._vary[key]
+
+    @staticmethod
+    def _vary_values(
+        vary: tuple[str, ...], request_headers: Mapping[str, Any]
+    ) -> tuple[str, ...]:
+        return tuple(_get(request_headers, name) or "" for name in vary)
+
+
+def _get(headers: Mapping[str, Any], name: str) -> Any:
+    # starlette의 request.headers dict는 소문자 key를 사용
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.title())
+    return value
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        settings.response_cache_max_bytes, settings.response_cache_max_entry_bytes
+    )
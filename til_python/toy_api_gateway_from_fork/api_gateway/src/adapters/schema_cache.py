@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+from adapters.exceptions import GatewayRouterException
+from config.settings import get_settings
+from ports.gateway_router import GatewayRouter
+from use_cases.docs import merge_schemas, modify_paths
+from use_cases.json_codec import get_json_codec
+
+logger = logging.getLogger()
+
+
+@dataclass
+class CachedSchema:
+    # 최종 응답 그대로의 JSON bytes와 그 ETag
+    body: bytes
+    etag: str
+    upstream_etag: str | None = None
+    fetched_at: float = 0.0
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        # 합친 schema를 만들 때만 decode
+        return get_json_codec().loads(self.body)  # type: ignore[no-any-return]
+
+
+def create_schema(body: bytes, upstream_etag: str | None = None) -> CachedSchema:
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return CachedSchema(body, etag, upstream_etag, time.monotonic())
+
+
+class SchemaCache:
+    """service별로 경로를 바꾼 OpenAPI schema를 직렬화된 bytes로 보관
+
+    ttl이 지나면 기존 schema를 그대로 응답하면서 백그라운드에서 upstream ETag로 재검증
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.schemas: dict[str, CachedSchema] = {}
+        # 갱신 중인 service(동시 요청이 같은 upstream 요청을 공유, task GC 방지)
+        self.refreshing: dict[str, asyncio.Task[CachedSchema]] = {}
+        self._merged: tuple[tuple[str, ...], CachedSchema] | None = None
+
+    async def get(self, service_name: str, router: GatewayRouter) -> CachedSchema:
+        schema = self.schemas.get(service_name)
+        if schema is None:
+            return await asyncio.shield(self._refresh(service_name, router))
+        if time.monotonic() - schema.fetched_at >= self.ttl:
+            self._refresh(service_name, router).add_done_callback(self._log_failure)
+        return schema
+
+    async def get_merged(
+        self, service_names: list[str], router: GatewayRouter, title: str
+    ) -> CachedSchema:
+        results = await asyncio.gather(
+            *(self.get(service_name, router) for service_name in service_names),
+            return_exceptions=True,
+        )
+        schemas = {}
+        for service_name, result in zip(service_names, results, strict=True):
+            if isinstance(result, CachedSchema):
+                schemas[service_name] = result
+            else:
+                logger.warning(
+                    f"openapi schema of {service_name} unavailable: {result}"
+                )
+
+        # 구성 schema가 바뀌지 않았으면 합친 결과를 다시 만들지 않음
+        key = tuple(f"{name}:{schema.etag}" for name, schema in schemas.items())
+        if self._merged is None or self._merged[0] != key:
+            data = {name: schema.data for name, schema in schemas.items()}
+            merged = merge_schemas(data, title)
+            self._merged = key, create_schema(get_json_codec().dumps(merged))
+        return self._merged[1]
+
+    def _refresh(
+        self, service_name: str, router: GatewayRouter
+    ) -> asyncio.Task[CachedSchema]:
+        task = self.refreshing.get(service_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch(service_name, router))
+            self.refreshing[service_name] = task
+            task.add_done_callback(lambda _: self.refreshing.pop(service_name, None))
+        return task
+
+    async def _fetch(self, service_name: str, router: GatewayRouter) -> CachedSchema:
+        cached = self.schemas.get(service_name)
+        headers = {}
+        if cached is not None and cached.upstream_etag:
+            headers["if-none-match"] = cached.upstream_etag
+        upstream = await router.stream(
+            service_name, "/openapi.json", headers, HTTPMethod.GET
+        )
+        body = await upstream.read()
+        if cached is not None and upstream.status_code == HTTPStatus.NOT_MODIFIED:
+            cached.fetched_at = time.monotonic()
+            return cached
+        if upstream.status_code != HTTPStatus.OK:
+            raise GatewayRouterException
+
+        schema = create_schema(
+            modify_paths(body, service_name), upstream.headers.get("ETag")
+        )
+        if cached is not None and cached.etag == schema.etag:
+            # 내용이 같으면 기존 객체를 유지해 합친 schema도 다시 만들지 않음
+            cached.upstream_etag = schema.upstream_etag
+            cached.fetched_at = schema.fetched_at
+            return cached
+        self.schemas[service_name] = schema
+        return schema
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task[CachedSchema]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"openapi schema refresh failed: {task.exception()}")
+
+
+@lru_cache
+def get_schema_cache() -> SchemaCache:
+    return SchemaCache(get_settings().openapi_cache_ttl)
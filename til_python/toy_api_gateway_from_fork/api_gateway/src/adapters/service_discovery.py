@@ -0,0 +1,244 @@
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from aiohttp.abc import AbstractResolver, ResolveResult
+
+from config.settings import BaseSettings
+from domain.enitities.service import Service
+from use_cases.load_balancing import LoadBalancerRegistry, load_balancers
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+except ImportError:  # pragma: no cover
+    dns = None  # type: ignore[assignment]
+
+logger = logging.getLogger()
+
+# host -> (IPv4/IPv6 주소 목록, TTL(초), TTL을 알 수 없으면 None)
+Lookup = Callable[[str], Awaitable[tuple[list[str], float | None]]]
+
+
+async def dns_lookup(host: str) -> tuple[list[str], float | None]:
+    if dns is not None:
+        answers = await asyncio.gather(
+            *(
+                dns.asyncresolver.resolve(host, rdtype, lifetime=5)
+                for rdtype in ("A", "AAAA")
+            ),
+            return_exceptions=True,
+        )
+        addresses: list[str] = []
+        ttls: list[float] = []
+        for answer in answers:
+            if isinstance(answer, dns.exception.DNSException):
+                # A나 AAAA 중 한쪽만 있는 host
+                continue
+            if isinstance(answer, BaseException):
+                raise answer
+            addresses += (rdata.address for rdata in answer)
+            if answer.rrset is not None:
+                ttls.append(answer.rrset.ttl)
+        if addresses:
+            return sorted(addresses), min(ttls, default=None)
+        # /etc/hosts 등 DNS 서버가 모르는 이름은 시스템 resolver로 조회
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+    )
+    return sorted({str(info[4][0]) for info in infos}), None
+
+
+def is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def address_family(address: str) -> socket.AddressFamily:
+    if ipaddress.ip_address(address).version == 6:
+        return socket.AF_INET6
+    return socket.AF_INET
+
+
+@dataclass
+class ResolvedHost:
+    addresses: list[str]
+    expires_at: float
+
+
+class ServiceDiscovery:
+    """service host의 A/AAAA record를 TTL에 맞춰 백그라운드에서 갱신하고 마지막 성공 결과를 보관
+
+    요청 경로에서는 DNS를 조회하지 않도록 aiohttp resolver와 service별 endpoint 목록에 캐시를 제공
+    """
+
+    def __init__(
+        self,
+        balancers: LoadBalancerRegistry = load_balancers,
+        lookup: Lookup = dns_lookup,
+    ) -> None:
+        self.balancers = balancers
+        self.lookup = lookup
+        self.hosts: dict[str, ResolvedHost] = {}
+        # 백그라운드에서 갱신하는 service host
+        self.managed: set[str] = set()
+        # 첫 refresh가 끝나면 set, pool warmup이 IP endpoint가 정해질 때까지 기다리는 데 사용
+        # module singleton이므로 lifespan(event loop)마다 start에서 새로 만듦
+        self.refreshed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, settings: BaseSettings) -> None:
+        if settings.service_discovery_enabled and self._task is None:
+            self.refreshed = asyncio.Event()
+            self._task = asyncio.create_task(self._run(settings))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # 다시 start 되면 새 refresh를 기다리도록 함
+        self.refreshed = asyncio.Event()
+
+    def addresses(self, host: str) -> list[str] | None:
+        resolved = self.hosts.get(host)
+        if resolved is None:
+            return None
+        # service host가 아니면 갱신해 줄 task가 없으므로 만료 후에는 다시 조회하게 함
+        if host not in self.managed and resolved.expires_at <= time.monotonic():
+            return None
+        return resolved.addresses
+
+    async def resolve(self, host: str, settings: BaseSettings) -> list[str]:
+        """host를 조회해 캐시를 갱신, 실패하면 마지막으로 성공한 결과를 반환"""
+        now = time.monotonic()
+        previous = self.hosts.get(host)
+        try:
+            addresses, ttl = await self.lookup(host)
+            if not addresses:
+                raise OSError(f"no A/AAAA records for {host}")
+        except Exception as e:
+            if previous is None:
+                raise
+            logger.warning(f"DNS lookup for {host} failed, keeping last answer: {e}")
+            previous.expires_at = now + settings.dns_min_ttl
+            return previous.addresses
+        ttl = settings.dns_fallback_ttl if ttl is None else ttl
+        ttl = min(max(ttl, settings.dns_min_ttl), settings.dns_max_ttl)
+        self.hosts[host] = ResolvedHost(addresses, now + ttl)
+        return addresses
+
+    async def refresh(self, settings: BaseSettings) -> None:
+        """만료된 host를 다시 조회하고 service별 endpoint 목록에 반영"""
+        services = list(settings.service_mapping.values())
+        self.managed = {
+            host for service in services for host in self._get_hosts(service)
+        }
+        now = time.monotonic()
+        expired = {
+            host
+            for host in self.managed
+            if host not in self.hosts or self.hosts[host].expires_at <= now
+        }
+        results = await asyncio.gather(
+            *(self.resolve(host, settings) for host in expired), return_exceptions=True
+        )
+        for host, result in zip(expired, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"DNS lookup for {host} failed: {result}")
+        for service in services:
+            self.balancers.update(service, self.expand_urls(service))
+        self.refreshed.set()
+
+    def expand_urls(self, service: Service) -> list[str]:
+        """평문 http url의 host를 조회된 A/AAAA record 수만큼의 IP url로 펼침
+
+        Host header는 client 요청 값을 그대로 전달하므로 IP url로 바꿔도 달라지지 않음,
+        https는 인증서 검증을 위해 host 이름을 유지하고 resolver가 캐시된 IP로 연결
+        """
+        urls = []
+        for url in service.urls:
+            parts = urlsplit(url)
+            addresses = self.addresses(parts.hostname or "")
+            if parts.scheme != "http" or not addresses:
+                urls.append(url)
+                continue
+            port = f":{parts.port}" if parts.port else ""
+            urls += [
+                parts._replace(netloc=f"{_url_host(ip)}{port}").geturl()
+                for ip in addresses
+            ]
+        return urls
+
+    async def _run(self, settings: BaseSettings) -> None:
+        while True:
+            await self.refresh(settings)
+            # 가장 먼저 만료되는 host에 맞춰 다시 조회
+            now = time.monotonic()
+            next_expiry = min(
+                (resolved.expires_at for resolved in self.hosts.values()),
+                default=now + settings.dns_max_ttl,
+            )
+            await asyncio.sleep(max(next_expiry - now, settings.dns_min_ttl))
+
+    @staticmethod
+    def _get_hosts(service: Service) -> set[str]:
+        hosts = set()
+        for url in service.urls:
+            parts = urlsplit(url)
+            hostname = parts.hostname
+            if parts.scheme in ("http", "https") and hostname and not is_ip(hostname):
+                hosts.add(hostname)
+        return hosts
+
+
+def _url_host(address: str) -> str:
+    # url의 IPv6 주소는 []로 감쌈
+    return f"[{address}]" if address_family(address) == socket.AF_INET6 else address
+
+
+class DiscoveryResolver(AbstractResolver):
+    """ServiceDiscovery 캐시로 host를 변환하는 aiohttp resolver, 캐시에 없을 때만 직접 조회"""
+
+    def __init__(self, discovery: ServiceDiscovery, settings: BaseSettings) -> None:
+        self.discovery = discovery
+        self.settings = settings
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        addresses = self.discovery.addresses(host)
+        if addresses is None:
+            addresses = await self.discovery.resolve(host, self.settings)
+        # connector가 요청한 family의 주소만 반환, AF_UNSPEC이면 모두 반환
+        hosts: list[ResolveResult] = [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": address_family(address),
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+            for address in addresses
+            if family in (socket.AF_UNSPEC, address_family(address))
+        ]
+        if not hosts:
+            raise OSError(f"no {family.name} addresses for {host}")
+        return hosts
+
+    async def close(self) -> None:
+        pass
+
+
+service_discovery = ServiceDiscovery()
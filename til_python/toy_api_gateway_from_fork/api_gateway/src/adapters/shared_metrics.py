@@ -0,0 +1,226 @@
+import asyncio
+import contextlib
+import logging
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from adapters.aihttp_gateway_router import get_session
+from config.settings import BaseSettings
+from use_cases.concurrency_limit import concurrency_limiters
+from use_cases.json_codec import get_json_codec
+from use_cases.metrics import MetricsRegistry, metrics_registry
+
+logger = logging.getLogger()
+
+# shared memory 맨 앞: (slot 수, slot 크기)
+HEADER = struct.Struct("<II")
+# slot 맨 앞: (sequence, payload 길이), sequence가 홀수면 쓰는 중
+SLOT_HEADER = struct.Struct("<QI")
+DEFAULT_SLOT_SIZE = 256 * 1024
+
+# (지표, host별 connection 수, service별 동시 요청 제한)
+Collected = tuple[
+    MetricsRegistry, list[tuple[str, int, int]], list[tuple[str, float, int, int]]
+]
+
+
+class SharedMetrics:
+    """worker process마다 slot 하나에 자기 지표 snapshot을 쓰고, 어느 worker든 모든 slot을 읽는 shared memory
+
+    lock 없이 seqlock 방식으로 읽음: 쓰기 전후로 sequence를 올리고, 읽는 동안 sequence가 바뀌면 다시 읽음
+    """
+
+    def __init__(self, shm: SharedMemory) -> None:
+        self.shm = shm
+        self.buf = self._buffer(shm)
+        self.slots: int
+        self.slot_size: int
+        self.slots, self.slot_size = HEADER.unpack_from(self.buf)
+
+    @classmethod
+    def create(cls, slots: int, slot_size: int = DEFAULT_SLOT_SIZE) -> "SharedMetrics":
+        shm = SharedMemory(create=True, size=HEADER.size + slots * slot_size)
+        HEADER.pack_into(cls._buffer(shm), 0, slots, slot_size)
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMetrics":
+        return cls(SharedMemory(name=name))
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, index: int, payload: bytes) -> bool:
+        offset = self._offset(index)
+        if SLOT_HEADER.size + len(payload) > self.slot_size:
+            logger.warning(
+                f"metrics snapshot of {len(payload)} bytes exceeds slot size"
+            )
+            return False
+        buf = self.buf
+        sequence = SLOT_HEADER.unpack_from(buf, offset)[0]
+        # 이전 process가 쓰는 도중 죽어 홀수로 남은 sequence는 짝수로 맞춤
+        sequence += sequence % 2
+        SLOT_HEADER.pack_into(buf, offset, sequence + 1, 0)
+        start = offset + SLOT_HEADER.size
+        buf[start : start + len(payload)] = payload
+        SLOT_HEADER.pack_into(buf, offset, sequence + 2, len(payload))
+        return True
+
+    def read(self, index: int, retries: int = 10) -> bytes | None:
+        """slot의 마지막 snapshot, 아직 쓴 적이 없거나 계속 쓰는 중이면 None"""
+        offset = self._offset(index)
+        buf = self.buf
+        for _ in range(retries):
+            sequence, length = SLOT_HEADER.unpack_from(buf, offset)
+            if sequence % 2:
+                continue
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buf[start : start + length])
+            if SLOT_HEADER.unpack_from(buf, offset)[0] == sequence:
+                return payload if sequence else None
+        return None
+
+    def close(self) -> None:
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+    @staticmethod
+    def _buffer(shm: SharedMemory) -> memoryview:
+        # close()한 SharedMemory만 buf가 None
+        if shm.buf is None:
+            raise ValueError(f"shared memory {shm.name} is closed")
+        return shm.buf
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self.slots:
+            raise IndexError(f"worker index {index} out of range (slots: {self.slots})")
+        return HEADER.size + index * self.slot_size
+
+
+def worker_snapshot() -> dict[str, Any]:
+    """현재 worker의 지표, connection pool 상태, 동시 요청 제한"""
+    return {
+        "metrics": metrics_registry.snapshot(),
+        "pools": get_session.pool_stats(),
+        "limits": concurrency_limiters.stats(),
+    }
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]]) -> Collected:
+    """worker별 snapshot을 host 전체 합계로 합침, connection pool과 동시 요청 제한은 key별로 더함"""
+    registry = MetricsRegistry()
+    pools: dict[str, list[int]] = {}
+    limits: dict[str, list[float]] = {}
+    for snapshot in snapshots:
+        registry.merge(snapshot["metrics"])
+        for host, *counts in snapshot["pools"]:
+            _add(pools.setdefault(host, [0, 0]), counts)
+        for service, *values in snapshot["limits"]:
+            _add(limits.setdefault(service, [0.0, 0, 0]), values)
+    return (
+        registry,
+        [(host, acquired, idle) for host, (acquired, idle) in pools.items()],
+        [
+            (service, limit, int(queued), int(shed))
+            for service, (limit, queued, shed) in limits.items()
+        ],
+    )
+
+
+def carried_over(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """재시작한 worker가 이어받을 이전 process의 누적값, 현재 상태를 나타내는 값은 0으로 둠"""
+    metrics = snapshot["metrics"]
+    for service in metrics["services"].values():
+        service["in_flight"] = 0
+    metrics["loop_lag_max"] = 0.0
+    return {
+        "metrics": metrics,
+        "pools": [],
+        "limits": [
+            (service, 0.0, 0, shed) for service, _, _, shed in snapshot["limits"]
+        ],
+    }
+
+
+def _add(totals: list[Any], values: list[Any]) -> None:
+    for i, value in enumerate(values):
+        totals[i] += value
+
+
+class MetricsPublisher:
+    """runner가 띄운 worker에서 주기적으로 자기 snapshot을 shared memory slot에 기록"""
+
+    def __init__(self) -> None:
+        self.shared: SharedMetrics | None = None
+        self.index = 0
+        # 같은 slot을 쓰던 이전 worker process의 누적값
+        self.base: dict[str, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, settings: BaseSettings) -> None:
+        if settings.metrics_shm_name and self._task is None:
+            self.shared = SharedMetrics.attach(settings.metrics_shm_name)
+            self.index = settings.worker_index
+            # slot을 비우면 host 전체 counter가 줄어 Prometheus가 reset으로 읽으므로
+            # 이전 process의 누적값에 이어서 더하고, 비는 순간이 없도록 바로 덮어씀
+            payload = self.shared.read(self.index)
+            if payload is not None:
+                self.base = carried_over(get_json_codec().loads(payload))
+            self.publish()
+            self._task = asyncio.create_task(
+                self._run(settings.metrics_publish_interval)
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+        self.base = None
+
+    def publish(self) -> None:
+        if self.shared is None:
+            return
+        snapshot = worker_snapshot()
+        if self.base is not None:
+            registry, pools, limits = merge_snapshots([self.base, snapshot])
+            snapshot = {
+                "metrics": registry.snapshot(),
+                "pools": pools,
+                "limits": limits,
+            }
+        self.shared.write(self.index, get_json_codec().dumps(snapshot))
+
+    def collect(self) -> Collected:
+        """모든 worker의 지표 합계, 읽는 worker 자신의 값은 방금 기록한 최신 값을 사용"""
+        if self.shared is None:
+            return (
+                metrics_registry,
+                get_session.pool_stats(),
+                concurrency_limiters.stats(),
+            )
+        self.publish()
+        codec = get_json_codec()
+        snapshots = []
+        for index in range(self.shared.slots):
+            payload = self.shared.read(index)
+            if payload is not None:
+                snapshots.append(codec.loads(payload))
+        return merge_snapshots(snapshots)
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            self.publish()
+            await asyncio.sleep(interval)
+
+
+metrics_publisher = MetricsPublisher()
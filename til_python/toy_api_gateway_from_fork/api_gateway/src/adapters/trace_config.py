@@ -0,0 +1,118 @@
+import time
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp.tracing import (
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceDnsResolveHostEndParams,
+    TraceDnsResolveHostStartParams,
+    TraceRequestEndParams,
+    TraceRequestHeadersSentParams,
+    TraceRequestStartParams,
+)
+
+from use_cases.server_timing import current_timing
+
+
+async def on_request_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceRequestStartParams,
+) -> None:
+    ctx.sent_at = time.perf_counter()
+
+
+async def on_connection_queued_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceConnectionQueuedStartParams,
+) -> None:
+    ctx.queued_at = time.perf_counter()
+
+
+async def on_connection_queued_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceConnectionQueuedEndParams,
+) -> None:
+    timing = current_timing.get()
+    if timing is not None:
+        # pool의 connection이 모두 사용 중이라 기다린 시간
+        timing.add("pool", time.perf_counter() - ctx.queued_at)
+
+
+async def on_connection_create_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceConnectionCreateStartParams,
+) -> None:
+    ctx.connecting_at = time.perf_counter()
+    ctx.dns = 0.0
+
+
+async def on_dns_resolvehost_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceDnsResolveHostStartParams,
+) -> None:
+    ctx.resolving_at = time.perf_counter()
+
+
+async def on_dns_resolvehost_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceDnsResolveHostEndParams,
+) -> None:
+    ctx.dns = time.perf_counter() - ctx.resolving_at
+    timing = current_timing.get()
+    if timing is not None:
+        timing.add("dns", ctx.dns)
+
+
+async def on_connection_create_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceConnectionCreateEndParams,
+) -> None:
+    timing = current_timing.get()
+    if timing is not None:
+        # DNS 조회를 뺀 TCP(+TLS) 연결 시간
+        timing.add("connect", time.perf_counter() - ctx.connecting_at - ctx.dns)
+
+
+async def on_request_headers_sent(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: TraceRequestHeadersSentParams,
+) -> None:
+    ctx.sent_at = time.perf_counter()
+
+
+async def on_request_end(
+    session: aiohttp.ClientSession, ctx: SimpleNamespace, params: TraceRequestEndParams
+) -> None:
+    timing = current_timing.get()
+    if timing is not None:
+        # 요청 header 전송부터 응답 header 수신까지(upstream TTFB)
+        timing.add("ttfb", time.perf_counter() - ctx.sent_at)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """pool 대기, DNS, connect, upstream TTFB를 ServerTiming에 기록하는 TraceConfig
+
+    handler는 요청을 보낸 task의 context에서 호출되므로 current_timing으로 현재 요청의 ServerTiming을 읽음
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(on_connection_queued_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_headers_sent.append(on_request_headers_sent)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
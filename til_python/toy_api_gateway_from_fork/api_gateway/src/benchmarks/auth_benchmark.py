@@ -0,0 +1,85 @@
+"""validate_token의 요청당 인증 오버헤드 비교
+
+before: sync dependency(anyio threadpool) + 매 요청 jwt.decode
+after: async dependency + 검증된 token 캐시
+
+    ENV_TYPE=test python -m benchmarks.auth_benchmark --requests 20000 --users 100
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+from anyio import to_thread
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from benchmarks.stats import print_table, summarize
+from config.settings import BaseSettings, TestSettings
+from drivers.rest.dependencies.security import validate_token
+from use_cases.security import JWTValidator, VerifiedTokenCache
+
+
+def create_tokens(settings: BaseSettings, users: int) -> list[str]:
+    exp = datetime.now(tz=UTC) + timedelta(minutes=30)
+    return [
+        jwt.encode(
+            {"aud": f"user-{i}@example.com", "exp": exp},
+            settings.jwt_secret_key.get_secret_value(),
+            algorithm=settings.jwt_algorithm,
+        )
+        for i in range(users)
+    ]
+
+
+async def run_before(
+    settings: BaseSettings, tokens: list[str], requests: int
+) -> list[float]:
+    samples = []
+    for i in range(requests):
+        token = tokens[i % len(tokens)]
+        start = time.perf_counter()
+        await to_thread.run_sync(JWTValidator(settings).validate, token)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_after(
+    settings: BaseSettings, tokens: list[str], requests: int
+) -> list[float]:
+    cache = VerifiedTokenCache(settings.jwt_cache_max_size)
+    samples = []
+    for i in range(requests):
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=tokens[i % len(tokens)]
+        )
+        start = time.perf_counter()
+        await validate_token(credentials, settings, cache)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args()
+
+    settings = TestSettings()
+    tokens = create_tokens(settings, args.users)
+    print_table(
+        f"validate_token overhead ({args.requests} requests, {args.users} tokens)",
+        {
+            "sync + threadpool": summarize(
+                await run_before(settings, tokens, args.requests)
+            ),
+            "async + token cache": summarize(
+                await run_after(settings, tokens, args.requests)
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
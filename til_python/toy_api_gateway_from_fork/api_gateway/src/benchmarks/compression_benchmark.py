@@ -0,0 +1,68 @@
+"""인코딩/레벨별 JSON 응답 압축률과 압축 시간, CompressedBodyCache hit 비용 비교
+
+ENV_TYPE=test python -m benchmarks.compression_benchmark --size 65536
+"""
+
+import argparse
+import json
+import time
+from typing import Any
+
+from adapters.compression import CompressedBodyCache, compress, compressors
+from benchmarks.stats import print_table, summarize
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11), "zstd": (1, 3, 19)}
+
+
+def create_payload(size: int) -> bytes:
+    items: list[dict[str, Any]] = []
+    body = b""
+    while len(body) < size:
+        i = len(items)
+        items.append(
+            {"userId": i % 10, "id": i, "title": f"item {i}", "completed": i % 3 == 0}
+        )
+        body = json.dumps(items).encode()
+    return body
+
+
+def measure(body: bytes, encoding: str, level: int, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compress(body, encoding, level)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    body = create_payload(args.size)
+    rows, ratios = {}, {}
+    for encoding in compressors:
+        for level in LEVELS[encoding]:
+            name = f"{encoding} level {level}"
+            rows[name] = summarize(measure(body, encoding, level, args.repeat))
+            ratios[name] = len(compress(body, encoding, level)) / len(body)
+
+    cache = CompressedBodyCache(max_bytes=16 * 1024 * 1024)
+    cache.compress(body, "gzip", 6)
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        cache.compress(body, "gzip", 6)
+        samples.append(time.perf_counter() - start)
+    rows["cache hit (gzip 6)"] = summarize(samples)
+
+    print_table(f"compress {len(body)} bytes of JSON", rows)
+    print()  # noqa: T201
+    for name, ratio in ratios.items():
+        print(f"{name:<24}{ratio:>12.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""FastAPI routing/DI 경로와 ProxyDispatcher fast path의 요청당 오버헤드 비교
+
+로컬 stub upstream을 두고 같은 gateway 설정으로 두 앱을 만들어 ASGI 레벨에서 직접 호출
+
+    ENV_TYPE=test python -m benchmarks.dispatch_benchmark --requests 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+from starlette.types import ASGIApp
+
+from adapters.aihttp_gateway_router import get_session
+from benchmarks.asgi import call_asgi
+from benchmarks.auth_benchmark import create_tokens
+from benchmarks.stats import print_table, summarize
+from benchmarks.stub_upstream import StubUpstream
+from config.settings import get_settings
+from domain.enitities.service import Service
+from drivers.rest.main import create_app
+
+
+async def run(app: ASGIApp, requests: int, headers: dict[str, str]) -> list[float]:
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        status, _ = await call_asgi(app, "GET", f"/bench/items/{i % 100}", headers)
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    upstream = await StubUpstream().start()
+    settings = get_settings()
+    settings.service_mapping["bench"] = Service(
+        name="Bench", internal_url=upstream.url, slug="bench"
+    )
+    settings.fast_dispatch_enabled = False
+    fastapi_app = create_app()
+    settings.fast_dispatch_enabled = True
+    dispatcher_app = create_app()
+    headers = {"Authorization": f"Bearer {create_tokens(settings, 1)[0]}"}
+
+    # connection pool, token cache 등을 미리 채워 둠
+    await run(fastapi_app, 200, headers)
+    await run(dispatcher_app, 200, headers)
+    rows = {
+        "fastapi routing + DI": summarize(
+            await run(fastapi_app, args.requests, headers)
+        ),
+        "raw ASGI dispatcher": summarize(
+            await run(dispatcher_app, args.requests, headers)
+        ),
+    }
+    print_table(f"GET /bench/items/* ({args.requests} requests)", rows)
+    saved = (
+        rows["fastapi routing + DI"]["mean_us"] - rows["raw ASGI dispatcher"]["mean_us"]
+    )
+    print(f"\nmean overhead saved per request: {saved:.1f}us")  # noqa: T201
+
+    await (await get_session()).close()
+    await upstream.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""aiohttp(HTTP/1.1)와 httpx(HTTP/2) GatewayRouter의 connection 수, latency, 처리량 비교
+
+gateway client 비용만 비교하도록 h1 stub과 h2c stub upstream은 별도 process에서 실행
+
+    ENV_TYPE=test python -m benchmarks.http2_benchmark --requests 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from multiprocessing.connection import Connection
+
+import aiohttp
+import httpx
+
+from adapters.aihttp_gateway_router import AiohttpGatewayRouter
+from adapters.httpx_gateway_router import HttpxGatewayRouter
+from benchmarks.stats import print_table, summarize
+from benchmarks.stub_upstream import H2StubUpstream, StubUpstream
+from config.settings import get_settings
+from domain.enitities.service import Service
+from ports.gateway_router import GatewayRouter
+
+
+async def run(
+    router: GatewayRouter, service: str, requests: int, concurrency: int
+) -> tuple[list[float], float]:
+    samples: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            _, status = await router(service, f"/items/{i}", {})
+            samples.append(time.perf_counter() - start)
+            assert status == 200, status
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(requests)))
+    return samples, requests / (time.perf_counter() - start)
+
+
+def serve_upstreams(latency: float, conn: Connection) -> None:
+    async def serve() -> None:
+        h1 = await StubUpstream(latency=latency).start()
+        h2 = await H2StubUpstream(latency=latency).start()
+        conn.send((h1.url, h2.url))
+        # 부모 process가 요청하면 지금까지의 connection 수를 돌려줌
+        while await asyncio.to_thread(conn.recv):
+            conn.send((h1.connections, h2.connections))
+        await h1.stop()
+        await h2.stop()
+
+    asyncio.run(serve())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=serve_upstreams, args=(args.latency, child_conn)
+    )
+    process.start()
+    settings = get_settings()
+    for slug, url in zip(("h1", "h2"), conn.recv(), strict=True):
+        settings.service_mapping[slug] = Service(name=slug, internal_url=url, slug=slug)
+
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=100))
+    client = httpx.AsyncClient(
+        http1=False, http2=True, limits=httpx.Limits(max_connections=10)
+    )
+    h1_client = httpx.AsyncClient(limits=httpx.Limits(max_connections=100))
+    backends = {
+        "aiohttp HTTP/1.1": (AiohttpGatewayRouter(session, settings), "h1"),
+        "httpx HTTP/1.1": (HttpxGatewayRouter(h1_client, settings), "h1"),
+        "httpx HTTP/2 (h2c)": (HttpxGatewayRouter(client, settings), "h2"),
+    }
+
+    rows, throughput, connections = {}, {}, {}
+    seen = {"h1": 0, "h2": 0}
+    for name, (router, slug) in backends.items():
+        await run(router, slug, 500, args.concurrency)
+        samples, throughput[name] = await run(
+            router, slug, args.requests, args.concurrency
+        )
+        rows[name] = summarize(samples)
+        # upstream별 누적 connection 수에서 이번 backend가 연 connection 수만 계산
+        conn.send(True)
+        total = dict(zip(("h1", "h2"), conn.recv(), strict=True))[slug]
+        connections[name], seen[slug] = total - seen[slug], total
+    print_table(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"upstream latency {args.latency * 1000:.0f}ms",
+        rows,
+    )
+    print()  # noqa: T201
+    for name in rows:
+        print(  # noqa: T201
+            f"{name:<24}{throughput[name]:>10.0f} req/s{connections[name]:>6} connections"
+        )
+
+    await session.close()
+    await client.aclose()
+    await h1_client.aclose()
+    conn.send(False)
+    process.join()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""JSON codec별 큰 OpenAPI 문서의 경로 prefix 변경과 에러 응답 연속 생성 비용 비교
+
+ENV_TYPE=test python -m benchmarks.json_benchmark --paths 2000 --errors 20000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from functools import partial
+
+from fastapi.responses import JSONResponse
+
+from benchmarks.stats import print_table, summarize
+from drivers.rest.exception_handlers.handlers import error_body
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from use_cases.json_codec import json_codec_mapping
+
+
+def legacy_modify_paths(body: bytes, service_name: str) -> bytes:
+    # 이전 구현(json.loads 후 dict 재구성, JSONResponse가 다시 직렬화)
+    data = json.loads(body.decode())
+    data["paths"] = {f"/{service_name}" + k: v for k, v in data["paths"].items()}
+    return bytes(JSONResponse(data).body)
+
+
+def create_openapi(paths: int) -> bytes:
+    operation = {
+        "summary": "Read Item",
+        "operationId": "read_item",
+        "parameters": [
+            {
+                "name": "item_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {
+            "200": {
+                "description": "Successful Response",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Item"}
+                    }
+                },
+            },
+            "422": {"description": "Validation Error"},
+        },
+    }
+    document = {
+        "openapi": "3.1.0",
+        "info": {"title": "Service A", "version": "0.1.0"},
+        "paths": {
+            f"/items{i}/{{item_id}}": {"get": operation, "put": operation}
+            for i in range(paths)
+        },
+        "components": {"schemas": {"Item": {"type": "object"}}},
+    }
+    return json.dumps(document).encode()
+
+
+def measure(func: Callable[[], object], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--errors", type=int, default=20_000)
+    args = parser.parse_args()
+
+    body = create_openapi(args.paths)
+    rows = {
+        "stdlib + JSONResponse": summarize(
+            measure(lambda: legacy_modify_paths(body, "service-a"), args.repeat)
+        )
+    }
+    for name, codec_class in json_codec_mapping.items():
+        prefix_keys = partial(codec_class().prefix_keys, body, "paths", "/service-a")
+        rows[name] = summarize(measure(prefix_keys, args.repeat))
+    print_table(f"modify_paths on {len(body) // 1024}KB OpenAPI document", rows)
+
+    detail = "Something goes wrong. Please try again later"
+    rows = {
+        "JSONResponse": summarize(
+            measure(lambda: JSONResponse({"detail": detail}, 400), args.errors)
+        ),
+        "pre-encoded body": summarize(
+            measure(lambda: RowJSONResponse(error_body(detail), 400), args.errors)
+        ),
+    }
+    print_table(f"error response x {args.errors}", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from benchmarks.stats import percentile
+
+# 요청 하나를 보내고 성공 여부를 돌려주는 함수, i는 요청 순번
+Request = Callable[[int], Awaitable[bool]]
+
+
+@dataclass
+class LoadResult:
+    duration: float
+    samples: list[float] = field(default_factory=list)
+    errors: int = 0
+    # fixed rate에서 예정 시각보다 늦게 보낸 요청 수(load generator가 못 따라감)
+    late: int = 0
+
+    @property
+    def rps(self) -> float:
+        return len(self.samples) / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """latency는 마이크로초 단위"""
+        return {
+            "requests": len(self.samples),
+            "errors": self.errors,
+            "late": self.late,
+            "rps": self.rps,
+            "p50_us": percentile(self.samples, 50) * 1e6,
+            "p95_us": percentile(self.samples, 95) * 1e6,
+            "p99_us": percentile(self.samples, 99) * 1e6,
+            "p999_us": percentile(self.samples, 99.9) * 1e6,
+        }
+
+
+async def run_max_throughput(
+    request: Request, duration: float, concurrency: int
+) -> LoadResult:
+    """closed loop: worker concurrency개가 응답을 받는 즉시 다음 요청을 보냄"""
+    result = LoadResult(duration)
+    counter = iter(range(1 << 62))
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while (start := time.perf_counter()) < deadline:
+            ok = await request(next(counter))
+            result.samples.append(time.perf_counter() - start)
+            result.errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.duration = time.perf_counter() - start
+    return result
+
+
+async def run_fixed_rate(
+    request: Request, rps: float, duration: float, max_in_flight: int = 10_000
+) -> LoadResult:
+    """open loop: 응답과 관계없이 rps 간격으로 요청을 보냄
+
+    앞 요청의 응답을 기다리지 않으므로 gateway가 밀리면 그 대기 시간이 latency에 그대로
+    반영됨(closed loop의 coordinated omission 회피)
+    """
+    result = LoadResult(duration)
+    interval = 1 / rps
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def send(i: int, start: float) -> None:
+        try:
+            ok = await request(i)
+        finally:
+            semaphore.release()
+        result.samples.append(time.perf_counter() - start)
+        result.errors += not ok
+
+    begin = time.perf_counter()
+    for i in range(int(rps * duration)):
+        scheduled = begin + i * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        elif delay < -interval:
+            result.late += 1
+        await semaphore.acquire()
+        # asyncio.sleep의 timer 오차가 섞이지 않도록 실제로 보내는 시각부터 잼
+        task = asyncio.create_task(send(i, time.perf_counter()))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks)
+    result.duration = time.perf_counter() - begin
+    return result
@@ -0,0 +1,99 @@
+"""기존 3단 middleware(CORS, ProxyHeaders, AdditionalHeaders)와 GatewayMiddleware의 요청당 오버헤드 비교
+
+middleware 비용만 보기 위해 고정 응답을 돌려주는 raw ASGI 앱을 감싸서 직접 호출
+
+    ENV_TYPE=test python -m benchmarks.middleware_benchmark --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from benchmarks.asgi import call_asgi
+from benchmarks.stats import print_table, summarize
+from config.settings import get_settings
+from drivers.rest.middleware.additional_headers_middleware import (
+    AdditionalHeadersMiddleware,
+)
+from drivers.rest.middleware.gateway_middleware import GatewayMiddleware
+
+CASES = {
+    "no origin": ("GET", {"X-Forwarded-For": "1.1.1.1"}),
+    "simple CORS": ("GET", {"Origin": "https://example.com"}),
+    "preflight": (
+        "OPTIONS",
+        {
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "Content-Type",
+        },
+    ),
+}
+
+
+async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def create_layered_app() -> ASGIApp:
+    settings = get_settings()
+    app = AdditionalHeadersMiddleware(endpoint, headers=settings.additional_headers)
+    app = ProxyHeadersMiddleware(app, trusted_hosts=["*"])  # type: ignore
+    return CORSMiddleware(
+        app,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        allow_origins=settings.allow_origins,
+    )
+
+
+def create_fused_app() -> ASGIApp:
+    settings = get_settings()
+    return GatewayMiddleware(
+        endpoint,
+        allow_origins=settings.allow_origins,
+        additional_headers=settings.additional_headers,
+        trusted_hosts=["*"],
+    )
+
+
+async def run(
+    app: ASGIApp, requests: int, method: str, headers: dict[str, str]
+) -> list[float]:
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        status, _ = await call_asgi(app, method, "/bench/items", headers)
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    apps = {"3 layers": create_layered_app(), "fused": create_fused_app()}
+    for case, (method, headers) in CASES.items():
+        rows = {}
+        for name, app in apps.items():
+            await run(app, 1_000, method, headers)
+            rows[name] = summarize(await run(app, args.requests, method, headers))
+        print_table(f"{case} ({args.requests} requests)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
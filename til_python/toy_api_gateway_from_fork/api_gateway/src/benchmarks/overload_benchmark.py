@@ -0,0 +1,132 @@
+"""upstream 처리량을 넘는 부하에서 priority class별 latency와 거절 비율 측정
+
+동시에 capacity개만 처리하는 가상 upstream 앞에 ConcurrencyLimitGatewayRouter를 두고
+high/normal/low class에 각각 fixed rate로 요청을 보냄
+fifo는 모든 요청이 같은 class, priority는 경로로 class를 나눠 weighted fair queue로 처리
+
+    ENV_TYPE=test python -m benchmarks.overload_benchmark --rps 100 --capacity 10 --latency 0.05
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterable
+from http import HTTPMethod
+from typing import Any
+
+from adapters.concurrency_limit_gateway_router import ConcurrencyLimitGatewayRouter
+from adapters.exceptions import ServiceUnavailableException
+from benchmarks.load_generator import run_fixed_rate
+from benchmarks.stats import percentile
+from config.settings import TestSettings
+from domain.enitities.service import PriorityRule
+from ports.gateway_router import GatewayRouter, UpstreamResponse
+from use_cases.concurrency_limit import ConcurrencyLimiterRegistry
+from use_cases.priority import PriorityClassifier
+
+PRIORITIES = ("high", "normal", "low")
+
+
+class SimulatedUpstream(GatewayRouter):
+    """동시에 capacity개까지만 처리하고 나머지는 upstream 안에서 기다리는 upstream"""
+
+    def __init__(self, capacity: int, latency: float) -> None:
+        self._semaphore = asyncio.Semaphore(capacity)
+        self._latency = latency
+
+    async def __call__(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | None = None,
+    ) -> tuple[bytes, int]:
+        async with self._semaphore:
+            await asyncio.sleep(self._latency)
+        return b"{}", 200
+
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        async with self._semaphore:
+            await asyncio.sleep(self._latency)
+        return UpstreamResponse(200, {}, b"{}")
+
+
+async def run(mode: str, args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    rules = [
+        PriorityRule(priority=priority, path=f"/{priority}/*")
+        for priority in PRIORITIES
+    ]
+    settings = TestSettings(
+        priority_rules=rules if mode == "priority" else [],
+        concurrency_limit_initial=args.capacity,
+        # 제한 탐색이 아니라 queue에서의 처리 순서를 보려는 것이므로 upstream capacity로 고정
+        concurrency_limit_min=args.capacity,
+        concurrency_limit_max=args.capacity,
+    )
+    router = ConcurrencyLimitGatewayRouter(
+        SimulatedUpstream(args.capacity, args.latency),
+        ConcurrencyLimiterRegistry(),
+        settings,
+        PriorityClassifier(settings),
+    )
+    service = next(iter(settings.service_mapping))
+    latencies: dict[str, list[float]] = {priority: [] for priority in PRIORITIES}
+
+    async def load(priority: str) -> dict[str, float]:
+        loop = asyncio.get_running_loop()
+
+        async def request(i: int) -> bool:
+            start = loop.time()
+            try:
+                await router(service, f"/{priority}/items/{i}", {})
+            except ServiceUnavailableException:
+                return False
+            latencies[priority].append(loop.time() - start)
+            return True
+
+        result = await run_fixed_rate(request, args.rps, args.duration)
+        samples = latencies[priority]
+        return {
+            "ok_rps": len(samples) / result.duration,
+            "shed_%": 100 * result.errors / max(1, len(result.samples)),
+            "p50_ms": percentile(samples, 50) * 1e3,
+            "p99_ms": percentile(samples, 99) * 1e3,
+        }
+
+    rows = await asyncio.gather(*(load(priority) for priority in PRIORITIES))
+    return dict(zip(PRIORITIES, rows, strict=True))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rps", type=float, default=100.0, help="class당 초당 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--capacity", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    offered = args.rps * len(PRIORITIES)
+    print(  # noqa: T201
+        f"offered {offered:.0f} rps, upstream capacity"
+        f" {args.capacity / args.latency:.0f} rps"
+    )
+    for mode in ("fifo", "priority"):
+        rows = await run(mode, args)
+        print(f"\n{mode}")  # noqa: T201
+        columns = list(rows[PRIORITIES[0]])
+        print(f"{'':<10}" + "".join(f"{c:>10}" for c in columns))  # noqa: T201
+        for priority, row in rows.items():
+            print(  # noqa: T201
+                f"{priority:<10}" + "".join(f"{row[c]:>10.1f}" for c in columns)
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""많은 수의 활성 key에서 RateLimiter.acquire와 RateLimitMiddleware의 요청당 비용 측정
+
+ENV_TYPE=test python -m benchmarks.rate_limit_benchmark --keys 10000 --requests 100000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from starlette.types import Receive, Scope, Send
+
+from benchmarks.asgi import call_asgi
+from benchmarks.stats import print_table, summarize
+from domain.enitities.service import RateLimit
+from drivers.rest.middleware.rate_limit_middleware import RateLimitMiddleware
+from use_cases.rate_limiter import RateLimiter
+
+LIMIT = RateLimit(rate=1_000_000, burst=1_000_000)
+
+
+async def endpoint(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def run_limiter(keys: list[tuple[str, str]], requests: int) -> list[float]:
+    limiter = RateLimiter(shards=16, idle_timeout=60)
+    for key in keys:
+        limiter.acquire(key, LIMIT)
+    samples = []
+    for _ in range(requests):
+        key = random.choice(keys)
+        start = time.perf_counter()
+        limiter.acquire(key, LIMIT)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run_middleware(with_limit: bool, requests: int) -> list[float]:
+    middleware = RateLimitMiddleware(endpoint, RateLimiter(shards=16, idle_timeout=60))
+    middleware.limits = {"bench": LIMIT} if with_limit else {}
+    samples = []
+    # call_asgi의 client는 고정이므로 key 수에 따른 비용은 limiter 단독 측정에서 확인
+    for _ in range(requests):
+        start = time.perf_counter()
+        status, _ = await call_asgi(middleware, "GET", "/bench/items")
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    keys = [("bench", f"10.0.{i // 256}.{i % 256}") for i in range(args.keys)]
+    print_table(
+        f"RateLimiter.acquire ({args.keys} active keys)",
+        {"acquire": summarize(run_limiter(keys, args.requests))},
+    )
+    rows = {
+        "no limit": summarize(await run_middleware(False, args.requests)),
+        "rate limited": summarize(await run_middleware(True, args.requests)),
+    }
+    print_table(f"RateLimitMiddleware ({args.requests} requests)", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
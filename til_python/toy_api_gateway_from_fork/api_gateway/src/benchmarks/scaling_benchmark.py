@@ -0,0 +1,169 @@
+"""drivers.rest.runner의 worker 수에 따른 gateway 처리량 scaling 측정
+
+stub upstream과 load generator는 별도 process에서 실행, worker 수마다 runner를 새로 띄워
+인증 + /service-a/... 프록시 요청을 closed loop로 보냄
+load generator도 CPU를 쓰므로 core 수보다 worker를 많이 띄우면 scaling이 꺾임
+
+    ENV_TYPE=test python -m benchmarks.scaling_benchmark --workers 1 2 4 8 --duration 10 --clients 4
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Any
+
+import aiohttp
+
+from benchmarks.auth_benchmark import create_tokens
+from benchmarks.load_generator import LoadResult, run_max_throughput
+from benchmarks.suite import serve_upstream
+from config.settings import TestSettings
+
+JWT_SECRET_KEY = "scaling-benchmark"
+
+
+def start_gateway(
+    workers: int, port: int, upstream_url: str
+) -> subprocess.Popen[bytes]:
+    env = {
+        **os.environ,
+        "ENV_TYPE": "prod",
+        "JWT_SECRET_KEY": JWT_SECRET_KEY,
+        "SERVICE_A_URL": upstream_url,
+        "LOG_LEVEL": "40",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "drivers.rest.runner",
+            "--workers",
+            str(workers),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    # /healthcheck는 connection pool warmup이 끝나야 200
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{url}/healthcheck") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"gateway at {url} did not become ready")
+
+
+def run_client(
+    url: str, tokens: list[str], duration: float, concurrency: int
+) -> tuple[list[float], int]:
+    async def run() -> LoadResult:
+        headers = [{"Authorization": f"Bearer {token}"} for token in tokens]
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            async def request(i: int) -> bool:
+                async with session.get(
+                    f"{url}/service-a/items/{i % 100}",
+                    headers=headers[i % len(headers)],
+                ) as response:
+                    await response.read()
+                    return response.status == 200
+
+            # connection, token cache를 미리 채워 둠
+            await run_max_throughput(request, 1, concurrency)
+            return await run_max_throughput(request, duration, concurrency)
+
+    result = asyncio.run(run())
+    return result.samples, result.errors
+
+
+def measure(url: str, tokens: list[str], args: argparse.Namespace) -> dict[str, Any]:
+    with multiprocessing.Pool(args.clients) as pool:
+        outputs = pool.starmap(
+            run_client, [(url, tokens, args.duration, args.concurrency)] * args.clients
+        )
+    result = LoadResult(args.duration)
+    for samples, errors in outputs:
+        result.samples += samples
+        result.errors += errors
+    return result.to_dict()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    cpus = os.cpu_count() or 1
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, *(n for n in (2, 4, 8, 16, 32) if n <= cpus), cpus}),
+    )
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--clients", type=int, default=2, help="load generator process 수"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="client당 동시 요청 수"
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    parser.add_argument("--port", type=int, default=8090)
+    args = parser.parse_args()
+
+    conn, child_conn = multiprocessing.Pipe()
+    upstream = multiprocessing.Process(
+        target=serve_upstream, args=(args.latency, args.payload_size, 0.0, child_conn)
+    )
+    upstream.start()
+    upstream_url = conn.recv()
+    settings = TestSettings(jwt_secret_key=JWT_SECRET_KEY)
+    tokens = create_tokens(settings, args.users)
+    url = f"http://127.0.0.1:{args.port}"
+
+    results: dict[int, dict[str, Any]] = {}
+    try:
+        for workers in args.workers:
+            gateway = start_gateway(workers, args.port, upstream_url)
+            try:
+                asyncio.run(wait_ready(url))
+                results[workers] = measure(url, tokens, args)
+            finally:
+                gateway.send_signal(signal.SIGTERM)
+                gateway.wait()
+    finally:
+        conn.send(False)
+        upstream.join()
+
+    base = results[min(results)]["rps"] or 1.0
+    print(f"\ncpus: {cpus}, clients: {args.clients} x {args.concurrency}")  # noqa: T201
+    print(  # noqa: T201
+        f"{'workers':>8}{'rps':>10}{'speedup':>9}{'errors':>8}"
+        f"{'p50_us':>12}{'p99_us':>12}"
+    )
+    for workers, row in results.items():
+        print(  # noqa: T201
+            f"{workers:>8}{row['rps']:>10.0f}{row['rps'] / base:>8.2f}x{row['errors']:>8}"
+            f"{row['p50_us']:>12.1f}{row['p99_us']:>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
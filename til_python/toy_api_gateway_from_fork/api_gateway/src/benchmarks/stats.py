@@ -0,0 +1,30 @@
+import statistics
+from collections.abc import Sequence
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """latency 샘플(초)을 마이크로초 단위 요약으로 변환"""
+    return {
+        "count": len(samples),
+        "mean_us": statistics.fmean(samples) * 1e6 if samples else 0.0,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p95_us": percentile(samples, 95) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "p999_us": percentile(samples, 99.9) * 1e6,
+    }
+
+
+def print_table(title: str, rows: dict[str, dict[str, float]]) -> None:
+    columns = list(next(iter(rows.values())).keys())
+    print(f"\n{title}")  # noqa: T201
+    print(f"{'':<24}" + "".join(f"{c:>12}" for c in columns))  # noqa: T201
+    for name, row in rows.items():
+        print(f"{name:<24}" + "".join(f"{row[c]:>12.1f}" for c in columns))  # noqa: T201
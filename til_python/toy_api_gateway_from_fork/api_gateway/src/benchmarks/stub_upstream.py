@@ -0,0 +1,154 @@
+import asyncio
+import random
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+import h2.settings
+from aiohttp import web
+
+
+class StubUpstream:
+    """고정 지연/응답 크기/에러율을 갖는 로컬 upstream 서버"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        payload_size: int = 64,
+        error_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str | None = None,
+    ) -> None:
+        self.latency = latency
+        self.payload = b'{"data":"' + b"x" * max(0, payload_size - 11) + b'"}'
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+        # 지정하면 TCP 대신 unix socket으로 listen
+        self.path = path
+        # 요청을 보낸 client 주소(host, port) 수 = 사용된 TCP connection 수
+        self.peers: set[tuple[str, int]] = set()
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        if self.path is not None:
+            return f"unix://{self.path}"
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def connections(self) -> int:
+        return len(self.peers)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if request.transport is not None:
+            self.peers.add(request.transport.get_extra_info("peername"))
+        await request.read()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            return web.json_response({"detail": "stub error"}, status=500)
+        return web.Response(body=self.payload, content_type="application/json")
+
+    async def start(self) -> "StubUpstream":
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        if self.path is not None:
+            await web.UnixSite(self._runner, self.path).start()
+            return self
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class H2StubUpstream:
+    """h2c(prior knowledge)로만 응답하는 로컬 HTTP/2 upstream 서버"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        payload_size: int = 64,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_concurrent_streams: int = 1000,
+    ) -> None:
+        self.latency = latency
+        self.payload = b'{"data":"' + b"x" * max(0, payload_size - 11) + b'"}'
+        self.host = host
+        self.port = port
+        self.max_concurrent_streams = max_concurrent_streams
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        config = h2.config.H2Configuration(client_side=False)
+        connection = h2.connection.H2Connection(config=config)
+        connection.initiate_connection()
+        connection.update_settings(
+            {
+                h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.max_concurrent_streams
+            }
+        )
+        writer.write(connection.data_to_send())
+        tasks = set()
+        try:
+            while data := await reader.read(65536):
+                for event in connection.receive_data(data):
+                    if isinstance(event, h2.events.StreamEnded):
+                        task = asyncio.create_task(
+                            self.respond(connection, writer, event.stream_id)
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, h2.events.DataReceived):
+                        connection.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                writer.write(connection.data_to_send())
+        except (ConnectionError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(
+        self,
+        connection: h2.connection.H2Connection,
+        writer: asyncio.StreamWriter,
+        stream_id: int,
+    ) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        headers = [
+            (":status", "200"),
+            ("content-type", "application/json"),
+            ("content-length", str(len(self.payload))),
+        ]
+        connection.send_headers(stream_id, headers)
+        connection.send_data(stream_id, self.payload, end_stream=True)
+        writer.write(connection.data_to_send())
+
+    async def start(self) -> "H2StubUpstream":
+        self._server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
@@ -0,0 +1,222 @@
+"""로컬 stub upstream을 두고 gateway 주요 경로의 처리량/latency를 재는 회귀 benchmark suite
+
+scenario마다 max throughput(closed loop)과 fixed rps(open loop) 두 가지로 부하를 주고
+결과를 JSON으로 저장, --baseline을 주면 이전 결과와 비교해 회귀가 있으면 exit code 1
+
+    ENV_TYPE=test python -m benchmarks.suite --duration 5 --rps 500 --output current.json
+    ENV_TYPE=test python -m benchmarks.suite --baseline current.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from multiprocessing.connection import Connection
+from typing import Any
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from adapters.aihttp_gateway_router import AiohttpGatewayRouter, get_session
+from benchmarks.asgi import call_asgi
+from benchmarks.auth_benchmark import create_tokens
+from benchmarks.load_generator import (
+    LoadResult,
+    Request,
+    run_fixed_rate,
+    run_max_throughput,
+)
+from benchmarks.stub_upstream import StubUpstream
+from config.settings import BaseSettings, get_settings
+from domain.enitities.service import Service
+from drivers.rest.dependencies.security import validate_token
+from drivers.rest.main import create_app
+from use_cases.security import VerifiedTokenCache
+
+# scenario 이름 -> 요청 함수를 만드는 coroutine
+Scenario = Callable[[BaseSettings, list[str]], Awaitable[Request]]
+# 비교할 지표와 좋아지는 방향(True면 클수록 좋음)
+METRICS = {"rps": True, "p50_us": False, "p99_us": False}
+
+
+async def generic_handler(settings: BaseSettings, tokens: list[str]) -> Request:
+    settings.fast_dispatch_enabled = False
+    return app_request(create_app(), tokens)
+
+
+async def proxy_dispatcher(settings: BaseSettings, tokens: list[str]) -> Request:
+    settings.fast_dispatch_enabled = True
+    return app_request(create_app(), tokens)
+
+
+def app_request(app: Any, tokens: list[str]) -> Request:
+    headers = [{"Authorization": f"Bearer {token}"} for token in tokens]
+
+    async def request(i: int) -> bool:
+        status, _ = await call_asgi(
+            app, "GET", f"/bench/items/{i % 100}", headers[i % len(headers)]
+        )
+        return status == 200
+
+    return request
+
+
+async def token_validation(settings: BaseSettings, tokens: list[str]) -> Request:
+    cache = VerifiedTokenCache(settings.jwt_cache_max_size)
+    credentials = [
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        for token in tokens
+    ]
+
+    async def request(i: int) -> bool:
+        await validate_token(credentials[i % len(credentials)], settings, cache)
+        return True
+
+    return request
+
+
+async def aiohttp_router(settings: BaseSettings, tokens: list[str]) -> Request:
+    router = AiohttpGatewayRouter(await get_session(), settings)
+
+    async def request(i: int) -> bool:
+        _, status = await router("bench", f"/items/{i % 100}", {})
+        return status == 200
+
+    return request
+
+
+scenarios: dict[str, Scenario] = {
+    "generic_handler": generic_handler,
+    "proxy_dispatcher": proxy_dispatcher,
+    "validate_token": token_validation,
+    "aiohttp_router": aiohttp_router,
+}
+
+
+def serve_upstream(
+    latency: float, payload_size: int, error_rate: float, conn: Connection
+) -> None:
+    async def serve() -> None:
+        upstream = await StubUpstream(latency, payload_size, error_rate).start()
+        conn.send(upstream.url)
+        await asyncio.to_thread(conn.recv)
+        await upstream.stop()
+
+    asyncio.run(serve())
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[str]:
+    """baseline보다 tolerance 비율 이상 나빠진 지표를 출력하고 그 목록을 반환"""
+    regressions = []
+    print(f"\n{'':<32}{'metric':>10}{'baseline':>14}{'current':>14}{'change':>10}")  # noqa: T201
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            # fixed rps에서는 처리량이 고정이라 비교하지 않음
+            if metric == "rps" and name.endswith("/fixed"):
+                continue
+            before, after = base[metric], result[metric]
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            mark = ""
+            if worse > tolerance:
+                mark = "  REGRESSION"
+                regressions.append(f"{name} {metric}")
+            print(  # noqa: T201
+                f"{name:<32}{metric:>10}{before:>14.1f}{after:>14.1f}"
+                f"{change:>+10.1%}{mark}"
+            )
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(scenarios), default=list(scenarios)
+    )
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rps", type=float, default=500, help="0이면 fixed rps 생략")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # load generator와 CPU를 나눠 쓰지 않도록 stub upstream은 별도 process에서 실행
+    conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=serve_upstream,
+        args=(args.latency, args.payload_size, args.error_rate, child_conn),
+    )
+    process.start()
+    settings = get_settings()
+    settings.service_mapping["bench"] = Service(
+        name="Bench", internal_url=conn.recv(), slug="bench"
+    )
+    tokens = create_tokens(settings, args.users)
+
+    results: dict[str, dict[str, Any]] = {}
+    for name in args.scenarios:
+        request = await scenarios[name](settings, tokens)
+        # connection pool, token cache 등을 미리 채워 둠
+        await run_max_throughput(request, 1, args.concurrency)
+        runs: dict[str, LoadResult] = {
+            "max": await run_max_throughput(request, args.duration, args.concurrency)
+        }
+        if args.rps:
+            runs["fixed"] = await run_fixed_rate(request, args.rps, args.duration)
+        for mode, result in runs.items():
+            results[f"{name}/{mode}"] = result.to_dict()
+
+    await get_session.close()
+    conn.send(False)
+    process.join()
+
+    print(  # noqa: T201
+        f"\n{'':<32}{'rps':>10}{'errors':>8}{'late':>8}"
+        + "".join(f"{c:>12}" for c in ("p50_us", "p95_us", "p99_us", "p999_us"))
+    )
+    for name, row in results.items():
+        print(  # noqa: T201
+            f"{name:<32}{row['rps']:>10.0f}{row['errors']:>8}{row['late']:>8}"
+            + "".join(
+                f"{row[c]:>12.1f}" for c in ("p50_us", "p95_us", "p99_us", "p999_us")
+            )
+        )
+
+    report = {
+        "created_at": datetime.now(tz=UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("output", "baseline")
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")  # noqa: T201
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
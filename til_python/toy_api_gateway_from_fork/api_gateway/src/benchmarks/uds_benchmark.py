@@ -0,0 +1,99 @@
+"""같은 host의 upstream을 loopback TCP와 unix domain socket으로 연결했을 때 latency, 처리량 비교
+
+gateway client 비용만 비교하도록 stub upstream은 별도 process에서 실행
+
+    ENV_TYPE=test python -m benchmarks.uds_benchmark --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from multiprocessing.connection import Connection
+
+import aiohttp
+
+from adapters.aihttp_gateway_router import AiohttpGatewayRouter, AiohttpSessionEngine
+from benchmarks.stats import print_table, summarize
+from benchmarks.stub_upstream import StubUpstream
+from config.settings import get_settings
+from domain.enitities.service import Service
+
+
+async def run(
+    router: AiohttpGatewayRouter, service: str, requests: int, concurrency: int
+) -> tuple[list[float], float]:
+    samples: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            _, status = await router(service, f"/items/{i}", {})
+            samples.append(time.perf_counter() - start)
+            assert status == 200, status
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(requests)))
+    return samples, requests / (time.perf_counter() - start)
+
+
+def serve_upstreams(payload_size: int, path: str, conn: Connection) -> None:
+    async def serve() -> None:
+        tcp = await StubUpstream(payload_size=payload_size).start()
+        uds = await StubUpstream(payload_size=payload_size, path=path).start()
+        conn.send((tcp.url, uds.url))
+        await asyncio.to_thread(conn.recv)
+        await tcp.stop()
+        await uds.stop()
+
+    asyncio.run(serve())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "upstream.sock")
+    conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=serve_upstreams, args=(args.payload_size, path, child_conn)
+    )
+    process.start()
+    settings = get_settings()
+    for slug, url in zip(("tcp", "uds"), conn.recv(), strict=True):
+        settings.service_mapping[slug] = Service(name=slug, internal_url=url, slug=slug)
+
+    sessions = AiohttpSessionEngine()
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=100))
+    router = AiohttpGatewayRouter(session, settings, sessions=sessions)
+
+    rows, throughput = {}, {}
+    for name, slug in (("loopback TCP", "tcp"), ("unix socket", "uds")):
+        await run(router, slug, 1_000, args.concurrency)
+        samples, throughput[name] = await run(
+            router, slug, args.requests, args.concurrency
+        )
+        rows[name] = summarize(samples)
+    print_table(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"payload {args.payload_size}B",
+        rows,
+    )
+    print()  # noqa: T201
+    for name in rows:
+        print(f"{name:<24}{throughput[name]:>10.0f} req/s")  # noqa: T201
+
+    await session.close()
+    await sessions.close()
+    conn.send(False)
+    process.join()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
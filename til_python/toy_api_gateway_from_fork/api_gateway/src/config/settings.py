@@ -2,14 +2,22 @@ import logging
 import os
 from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, Self
 
 from dotenv import load_dotenv
-from pydantic import SecretStr
+from pydantic import SecretStr, model_validator
 from pydantic_settings import BaseSettings as PydanticBaseSettings
 
 from config.environements import EnvType
-from domain.enitities.service import Service
+from domain.enitities.composition import ComposedRoute, UpstreamCall
+from domain.enitities.service import (
+    CompressionPolicy,
+    LoadBalancingStrategy,
+    PriorityRule,
+    RateLimit,
+    RetryPolicy,
+    Service,
+)
 
 
 class BaseSettings(PydanticBaseSettings):
@@ -17,19 +25,171 @@ class BaseSettings(PydanticBaseSettings):
     api_gateway_url: str = "http://localhost:8010"
     service_a_url: str = "http://service-a:8000"
     service_b_url: str = "http://service-b:8080"
+    # replica가 여러 개일 때 각 replica의 url 목록(비어 있으면 *_url 하나만 사용)
+    service_a_endpoints: list[str] = []
+    service_b_endpoints: list[str] = []
+    load_balancing: LoadBalancingStrategy = LoadBalancingStrategy.round_robin
+    # upstream client(aiohttp: HTTP/1.1, httpx: HTTP/2 multiplexing)
+    upstream_client: str = "aiohttp"
+    # httpx에서 평문(http://) upstream에 HTTP/2로 바로 연결(h2c prior knowledge),
+    # h2c를 지원하지 않는 upstream이면 False로 두고 HTTP/1.1로 연결
+    http2_prior_knowledge: bool = True
+    # HTTP/2 connection 수(origin마다 connection 하나에 요청을 multiplexing)
+    http2_max_connections: int = 10
+    # HTTP/1.1로 연결할 때의 connection 수(aiohttp limit_per_host와 같은 값)
+    http1_max_connections: int = 100
+    # service별 적응형 동시 요청 제한(latency가 늘면 제한을 줄이고 넘친 요청은 바로 503)
+    concurrency_limit_enabled: bool = True
+    # aiohttp connection pool의 host별 제한(limit_per_host)과 같은 값에서 시작
+    concurrency_limit_initial: int = 100
+    concurrency_limit_min: int = 4
+    concurrency_limit_max: int = 200
+    # 최근 RTT가 기준 RTT의 이 배수를 넘을 때부터 제한을 줄임
+    concurrency_limit_tolerance: float = 2.0
+    concurrency_limit_smoothing: float = 0.2
+    # timeout/연결 실패/503, 504 응답이면 제한에 곱하는 비율
+    concurrency_limit_backoff: float = 0.9
+    # 제한을 넘은 요청이 기다릴 수 있는 수와 시간(초), 넘으면 503 + Retry-After
+    concurrency_limit_queue_size: int = 50
+    concurrency_limit_queue_timeout: float = 5.0
+    concurrency_limit_retry_after: float = 1.0
+    # priority class -> weight, 제한을 넘어 기다리는 요청은 weight 비율로 slot을 받고
+    # queue가 가득 차면 weight가 더 낮은 class의 대기 요청부터 거절
+    priority_weights: dict[str, int] = {"high": 8, "normal": 4, "low": 1}
+    default_priority: str = "normal"
+    # 순서대로 검사해 처음 맞는 rule의 priority, 없으면 default_priority
+    priority_rules: list[PriorityRule] = [
+        PriorityRule(priority="high", service="service-a", path="/auth/*")
+    ]
+    # service host의 A/AAAA record를 백그라운드에서 TTL에 맞춰 갱신하고 요청 경로에서는 캐시만 사용
+    service_discovery_enabled: bool = True
+    # DNS TTL을 이 범위(초)로 제한, TTL을 알 수 없는 조회(/etc/hosts 등)는 dns_fallback_ttl 사용
+    dns_min_ttl: float = 5.0
+    dns_max_ttl: float = 300.0
+    dns_fallback_ttl: float = 30.0
+    # 시작 시 upstream endpoint마다 미리 열어 둘 keep-alive connection 수(0이면 warmup X)
+    # warmup이 끝나거나 pool_warmup_timeout(초)이 지날 때까지 /healthcheck가 503을 반환
+    pool_warmup_connections: int = 4
+    pool_warmup_timeout: float = 10.0
+    # service별 circuit breaker(rolling window 기준 실패율/느린 호출 비율로 open)
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_window: float = 10.0
+    circuit_breaker_min_requests: int = 20
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_duration: float = 5.0
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_open_duration: float = 5.0
+    circuit_breaker_half_open_calls: int = 3
+    # service slug -> health check 경로
+    health_check_paths: dict[str, str] = {}
+    health_check_interval: float = 5.0
+    health_check_timeout: float = 2.0
+    # 연속으로 이 횟수만큼 health check가 실패해야 circuit breaker를 open
+    health_check_failure_threshold: int = 3
+    # service slug -> 재시도/hedging 정책, 없으면 재시도/hedge X
+    # 예: RETRY_POLICIES='{"service-a": {"hedge": true}}'
+    retry_policies: dict[str, RetryPolicy] = {}
+    # service slug -> rate limit, 없으면 제한 X
+    rate_limits: dict[str, RateLimit] = {}
+    rate_limit_shards: int = 16
+    # 이 시간(초) 이상 쓰이지 않고 다시 가득 찬 bucket은 제거
+    rate_limit_idle_timeout: float = 60.0
+    # service slug -> 응답 압축 정책, 없으면 압축 X
+    compression_policies: dict[str, CompressionPolicy] = {
+        "service-a": CompressionPolicy()
+    }
+    # 이 크기(bytes)보다 작은 응답은 압축하지 않음
+    compression_min_size: int = 1024
+    # cache_enabled service의 압축 결과를 재사용하는 캐시 크기(0이면 캐시 X)
+    compression_cache_max_bytes: int = 16 * 1024 * 1024
+    # /metrics에 service별 upstream 요청 수/latency, connection pool, event loop 지연 노출
+    metrics_enabled: bool = True
+    # event loop 지연 측정 주기(초), 0이면 측정 X
+    loop_lag_interval: float = 0.5
+    # drivers.rest.runner가 worker process마다 설정, /metrics가 모든 worker의 합계를 보여주도록
+    # 이 이름의 shared memory slot(worker_index)에 metrics_publish_interval(초)마다 지표를 기록
+    # metrics 외의 상태는 worker마다 따로 가지므로 worker가 N개면 rate_limits는 최대 N배까지
+    # 허용되고 circuit breaker/concurrency limiter는 각자 받은 1/N의 traffic만 보고 판단함
+    # 그래서 image는 이 상태를 공유하기 전까지 --workers 1로 실행
+    metrics_shm_name: str | None = None
+    worker_index: int = 0
+    metrics_publish_interval: float = 1.0
+    # 단계별(auth, pool, dns, connect, ttfb, body) 소요 시간을 Server-Timing header와 /metrics로 노출
+    # aiohttp TraceConfig가 모든 upstream 요청에 붙어 처리량이 약 10% 줄어듦
+    server_timing_enabled: bool = False
+    # Server-Timing을 기록할 요청 비율, 유효한 JWT와 debug header가 있는 요청은 항상 기록
+    # 내부 지연 정보라 Server-Timing header는 유효한 JWT가 있는 요청의 응답에만 붙임
+    server_timing_sample_rate: float = 0.0
+    server_timing_debug_header: str = "X-Debug-Timing"
     log_level: int = logging.DEBUG
     jwt_secret_key: SecretStr = SecretStr("")
     jwt_algorithm: str = "HS256"
+    # 검증된 token claims 캐시 크기(0이면 캐시 X)
+    jwt_cache_max_size: int = 10_000
     allow_origins: list[str] = ["*"]
     additional_headers: dict[str, Any] = {
         "Strict-Transport-Security": "max-age=31536000",
         "X-Content-Type-Options": "nosniff",
     }
+    # proxy header, CORS, 추가 header 처리를 middleware 하나로 합쳐 처리
+    fused_middleware_enabled: bool = True
+    # gateway가 직접 만드는 JSON의 codec(auto, msgspec, orjson, stdlib)
+    json_codec: Literal["auto", "msgspec", "orjson", "stdlib"] = "auto"
+    # 경로를 바꿔 직렬화해 둔 service별 OpenAPI schema를 재검증하기 전까지 사용하는 시간(초)
+    openapi_cache_ttl: float = 60.0
+    # /batch 한 번에 받을 sub-request 수, 동시에 보낼 수, sub-request 기본 timeout(초)
+    batch_max_requests: int = 50
+    batch_concurrency: int = 10
+    batch_timeout: float = 10.0
+    # gateway 경로 -> 여러 service 응답을 합쳐 돌려주는 composed route(BFF)
+    # fast_dispatch_enabled면 service slug로 시작하지 않는 경로만 FastAPI route로 전달됨
+    composed_routes: dict[str, ComposedRoute] = {
+        "/compose/hello": ComposedRoute(
+            calls={
+                "a": UpstreamCall(service="service-a", path="/hello"),
+                "b": UpstreamCall(service="service-b", path="/hello"),
+            },
+            merge={"service_a": "a.message", "service_b": "b.message"},
+        )
+    }
     base_path: Path = Path(__file__).parent.parent.resolve()
+    # generic_handler의 요청/응답 body를 버퍼링하지 않고 chunk 단위로 전달
+    streaming_enabled: bool = False
+    # /{service}/... 프록시 요청을 FastAPI routing 앞단의 raw ASGI dispatcher에서 처리
+    fast_dispatch_enabled: bool = False
+    # 이 크기(bytes) 이하의 body는 스트리밍하지 않고 한 번에 읽음
+    streaming_threshold: int = 64 * 1024
+    streaming_chunk_size: int = 64 * 1024
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+    response_cache_max_entry_bytes: int = 1024 * 1024
+    # 동시에 들어온 동일 GET/HEAD 요청을 upstream 요청 하나로 합침
+    coalescing_enabled: bool = True
+    coalescing_max_waiters: int = 1000
+    # 응답이 달라질 수 있는 header는 coalescing key에 포함
+    coalescing_key_headers: list[str] = [
+        "authorization",
+        "cookie",
+        "accept",
+        "accept-encoding",
+        "accept-language",
+    ]
 
     # 특정 env 파일을 읽어야할 경우
     # model_config = SettingsConfigDict(env_file='dev.env', env_file_encoding='utf-8')
 
+    @model_validator(mode="after")
+    def check_priorities(self) -> Self:
+        # 잘못된 priority 설정이 첫 과부하 요청에서야 드러나지 않도록 설정을 읽을 때 검사
+        priorities = {self.default_priority}
+        priorities.update(rule.priority for rule in self.priority_rules)
+        unknown = priorities - self.priority_weights.keys()
+        if unknown:
+            raise ValueError(f"unknown priority classes: {sorted(unknown)}")
+        invalid = [p for p, weight in self.priority_weights.items() if weight <= 0]
+        if invalid:
+            raise ValueError(f"priority weights must be positive: {sorted(invalid)}")
+        return self
+
     def configure_logging(self) -> None:
         logging.basicConfig(level=self.log_level)
 
@@ -37,10 +197,27 @@ class BaseSettings(PydanticBaseSettings):
     def service_mapping(self) -> dict[str, Service]:
         return {
             "service-a": Service(
-                name="Service A", internal_url=self.service_a_url, slug="service-a"
+                name="Service A",
+                internal_url=self.service_a_url,
+                slug="service-a",
+                cache_enabled=True,
+                endpoints=self.service_a_endpoints,
+                load_balancing=self.load_balancing,
+                health_path=self.health_check_paths.get("service-a"),
+                retry_policy=self.retry_policies.get("service-a"),
+                rate_limit=self.rate_limits.get("service-a"),
+                compression=self.compression_policies.get("service-a"),
             ),
             "service-b": Service(
-                name="Service B", internal_url=self.service_b_url, slug="service-b"
+                name="Service B",
+                internal_url=self.service_b_url,
+                slug="service-b",
+                endpoints=self.service_b_endpoints,
+                load_balancing=self.load_balancing,
+                health_path=self.health_check_paths.get("service-b"),
+                retry_policy=self.retry_policies.get("service-b"),
+                rate_limit=self.rate_limits.get("service-b"),
+                compression=self.compression_policies.get("service-b"),
             ),
         }
 
@@ -93,5 +270,7 @@ def get_settings() -> BaseSettings:
         env = EnvType(env_type)
     except ValueError:
         valid_envs = [e.value for e in EnvType]
-        raise ValueError(f"올바르지 않은 환경변수 ENV: {env_type}(valid_envs: {valid_envs})")
+        raise ValueError(
+            f"올바르지 않은 환경변수 ENV: {env_type}(valid_envs: {valid_envs})"
+        )
     return settings_mapping[env](env=env)
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from http import HTTPMethod
+from typing import Any
+
+
+@dataclass
+class SubRequest:
+    service: str
+    # service 내부 경로(query string 포함), 예: /todos/1?expand=user
+    path: str
+    method: HTTPMethod = HTTPMethod.GET
+    # JSON으로 직렬화해 upstream에 전달, None이면 body 없음
+    body: Any = None
+    # batch 요청 header에 덮어쓸 header
+    headers: dict[str, str] = field(default_factory=dict)
+    # 초 단위, None이면 batch_timeout 사용
+    timeout: float | None = None
+    id: str | None = None
+
+
+@dataclass
+class BatchRequest:
+    requests: list[SubRequest]
+
+
+@dataclass
+class SubResponse:
+    index: int
+    id: str | None
+    status: int
+    body: bytes
@@ -0,0 +1,59 @@
+import posixpath
+import re
+from dataclasses import dataclass, field
+from http import HTTPMethod
+from urllib.parse import unquote
+
+
+def is_internal_path(path: str) -> bool:
+    """yarl이 upstream URL을 만들 때처럼 %2e와 dot segment를 정리한 경로가 /internal 아래인지"""
+    decoded = unquote(path.partition("?")[0])
+    normalized = posixpath.normpath(re.sub("/+", "/", f"/{decoded}"))
+    return normalized == "/internal" or normalized.startswith("/internal/")
+
+
+@dataclass
+class UpstreamCall:
+    service: str
+    # {name}은 route path/query parameter, {call.field}는 먼저 끝난 call 결과 값으로 치환
+    path: str
+    method: HTTPMethod = HTTPMethod.GET
+    # 이 call들이 끝난 뒤에 실행, 없으면 바로 실행
+    depends_on: list[str] = field(default_factory=list)
+    # 실패해도 전체 응답을 실패시키지 않고 결과를 null로 둠
+    optional: bool = False
+
+
+@dataclass
+class ComposedRoute:
+    calls: dict[str, UpstreamCall]
+    # 응답 key -> "call" 또는 "call.field.0.sub" 형식의 결과 경로, 비어 있으면 call 이름별 결과 전체
+    merge: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for name, call in self.calls.items():
+            # gateway가 403으로 막는 /internal 경로를 composed route로 노출하지 않음
+            if is_internal_path(call.path):
+                raise ValueError(f"{name} calls an internal path: {call.path}")
+            unknown = set(call.depends_on) - self.calls.keys()
+            if unknown:
+                raise ValueError(f"{name} depends on unknown calls: {sorted(unknown)}")
+        for key, source in self.merge.items():
+            if source.partition(".")[0] not in self.calls:
+                raise ValueError(f"merge {key} refers to unknown call: {source}")
+        self._check_cycles()
+
+    def _check_cycles(self) -> None:
+        done: set[str] = set()
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if name in path:
+                raise ValueError(f"dependency cycle: {' -> '.join((*path, name))}")
+            if name in done:
+                return
+            for dependency in self.calls[name].depends_on:
+                visit(dependency, (*path, name))
+            done.add(name)
+
+        for name in self.calls:
+            visit(name, ())
@@ -1,4 +1,60 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class LoadBalancingStrategy(StrEnum):
+    round_robin = "round_robin"
+    least_outstanding = "least_outstanding"
+    power_of_two = "power_of_two"
+
+
+class RateLimitKey(StrEnum):
+    ip = "ip"
+    aud = "aud"
+    service = "service"
+
+
+@dataclass
+class RetryPolicy:
+    # connect error 재시도 횟수와 full jitter backoff(초)
+    max_retries: int = 2
+    backoff_base: float = 0.05
+    backoff_max: float = 1.0
+    # 응답이 running percentile latency보다 늦으면 중복 요청(hedge)을 보냄
+    hedge: bool = False
+    hedge_percentile: float = 95
+    hedge_min_delay: float = 0.01
+    # 요청 1건당 적립되는 재시도 토큰과 초당 최소 적립량(retry storm 방지)
+    budget_ratio: float = 0.1
+    budget_min_per_second: float = 1.0
+
+
+@dataclass
+class CompressionPolicy:
+    # 인코딩별 압축 레벨(높을수록 CPU를 더 써서 크기를 줄임)
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+
+
+@dataclass
+class RateLimit:
+    # 초당 적립되는 token 수와 bucket 크기(순간 허용량)
+    rate: float
+    burst: int
+    # client IP, JWT aud claim, service 전체 중 무엇을 기준으로 제한할지
+    key: RateLimitKey = RateLimitKey.ip
+
+
+@dataclass
+class PriorityRule:
+    # 맞는 요청의 priority class(settings.priority_weights의 key)
+    priority: str
+    # None이 아닌 조건을 모두 만족하면 맞음: service slug, upstream 경로 glob, JWT claim 값
+    service: str | None = None
+    path: str | None = None
+    claim: str | None = None
+    value: str | None = None
 
 
 @dataclass
@@ -6,3 +62,21 @@ class Service:
     name: str
     internal_url: str
     slug: str
+    # GET/HEAD 응답을 upstream Cache-Control에 따라 gateway에서 캐시
+    cache_enabled: bool = False
+    # scale-out된 replica들의 url, 비어 있으면 internal_url 하나만 사용
+    # 같은 host의 service는 unix:///path.sock 형식으로 unix socket에 연결
+    endpoints: list[str] = field(default_factory=list)
+    load_balancing: LoadBalancingStrategy = LoadBalancingStrategy.round_robin
+    # 백그라운드 health check 경로, None이면 probe 하지 않음
+    health_path: str | None = None
+    # GET/HEAD/OPTIONS 요청의 재시도/hedging 정책, None이면 사용 X
+    retry_policy: RetryPolicy | None = None
+    # token bucket 기반 요청 수 제한, None이면 제한 X
+    rate_limit: RateLimit | None = None
+    # Accept-Encoding에 따른 응답 압축, None이면 압축 X
+    compression: CompressionPolicy | None = None
+
+    @property
+    def urls(self) -> list[str]:
+        return self.endpoints or [self.internal_url]
@@ -4,15 +4,49 @@ import aiohttp
 from fastapi import Depends
 
 from adapters.aihttp_gateway_router import AiohttpGatewayRouter, get_session
+from adapters.cached_gateway_router import CachedGatewayRouter
+from adapters.circuit_breaker_gateway_router import CircuitBreakerGatewayRouter
+from adapters.coalescing_gateway_router import (
+    CoalescingGatewayRouter,
+    SingleFlight,
+    get_single_flight,
+)
+from adapters.concurrency_limit_gateway_router import ConcurrencyLimitGatewayRouter
+from adapters.hedging_gateway_router import HedgingGatewayRouter
+from adapters.httpx_gateway_router import HttpxGatewayRouter, get_http2_client
+from adapters.metrics_gateway_router import MetricsGatewayRouter
+from adapters.response_cache import ResponseCache, get_response_cache
 from config.settings import BaseSettings, get_settings
 from ports.gateway_router import GatewayRouter
+from use_cases.circuit_breaker import circuit_breakers
+from use_cases.concurrency_limit import concurrency_limiters
+from use_cases.metrics import metrics_registry
+from use_cases.priority import get_priority_classifier
+from use_cases.retry_policy import retry_states
 
 
 def get_gateway_router(
     session: Annotated[aiohttp.ClientSession, Depends(get_session)],
     settings: Annotated[BaseSettings, Depends(get_settings)],
+    cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    single_flight: Annotated[SingleFlight, Depends(get_single_flight)],
 ) -> GatewayRouter:
-    return AiohttpGatewayRouter(session, settings)
+    router: GatewayRouter
+    if settings.upstream_client == "httpx":
+        router = HttpxGatewayRouter(get_http2_client(settings), settings)
+    else:
+        router = AiohttpGatewayRouter(session, settings)
+    if settings.metrics_enabled:
+        # hedging/재시도까지 실제 upstream 요청마다 기록하도록 가장 안쪽에 둠
+        router = MetricsGatewayRouter(router, settings, metrics_registry)
+    # hedging/재시도 요청도 각각 slot을 쓰도록 circuit breaker 안쪽에 둠
+    router = ConcurrencyLimitGatewayRouter(
+        router, concurrency_limiters, settings, get_priority_classifier()
+    )
+    router = CircuitBreakerGatewayRouter(router, circuit_breakers, settings)
+    router = HedgingGatewayRouter(router, retry_states, settings)
+    router = CoalescingGatewayRouter(router, single_flight, settings)
+    return CachedGatewayRouter(router, cache, settings)
 
 
 # Create distinct dependencies for each handler to be
@@ -21,3 +55,5 @@ def get_gateway_router(
 get_generic_gateway_router = get_gateway_router
 get_auth_gateway_router = get_gateway_router
 get_openapi_gateway_router = get_gateway_router
+get_batch_gateway_router = get_gateway_router
+get_composed_gateway_router = get_gateway_router
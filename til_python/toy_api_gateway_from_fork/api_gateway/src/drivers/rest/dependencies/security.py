@@ -1,3 +1,4 @@
+import time
 from typing import Annotated
 
 from fastapi import Depends
@@ -5,11 +6,18 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from config.settings import BaseSettings, get_settings
 from drivers.rest.utils.auth_schema import oauth_scheme
-from use_cases.security import JWTValidator
+from use_cases.security import JWTValidator, VerifiedTokenCache, get_token_cache
+from use_cases.server_timing import record_phase
 
 
-def validate_token(
+async def validate_token(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(oauth_scheme)],
     settings: Annotated[BaseSettings, Depends(get_settings)],
+    cache: Annotated[VerifiedTokenCache, Depends(get_token_cache)],
 ) -> None:
-    JWTValidator(settings).validate(credentials.credentials if credentials else None)
+    # async dependency라 threadpool을 거치지 않고, 캐시 hit이면 서명 검증도 생략
+    start = time.perf_counter()
+    JWTValidator(settings, cache).validate(
+        credentials.credentials if credentials else None
+    )
+    record_phase("auth", start)
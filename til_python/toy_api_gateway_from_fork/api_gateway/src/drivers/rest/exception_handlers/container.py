@@ -1,13 +1,25 @@
 from fastapi import FastAPI
 
-from adapters.exceptions import GatewayRouterException, NotFoundException
+from adapters.exceptions import (
+    CompositionException,
+    GatewayRouterException,
+    NotFoundException,
+    ServiceUnavailableException,
+)
 from drivers.rest.exception_handlers.handlers import (
+    batch_too_large_exception_handler,
+    composition_exception_handler,
     forbidden_exception_handler,
     gateway_exception_handler,
     jwt_not_valid_exception_handler,
     not_found_exception_handler,
+    service_unavailable_exception_handler,
+)
+from use_cases.exceptions import (
+    BatchTooLargeException,
+    ForbiddenException,
+    NotAuthorizedException,
 )
-from use_cases.exceptions import ForbiddenException, NotAuthorizedException
 
 
 def exception_container(app: FastAPI) -> None:
@@ -15,3 +27,8 @@ def exception_container(app: FastAPI) -> None:
     app.add_exception_handler(GatewayRouterException, gateway_exception_handler)
     app.add_exception_handler(NotFoundException, not_found_exception_handler)
     app.add_exception_handler(ForbiddenException, forbidden_exception_handler)
+    app.add_exception_handler(
+        ServiceUnavailableException, service_unavailable_exception_handler
+    )
+    app.add_exception_handler(BatchTooLargeException, batch_too_large_exception_handler)
+    app.add_exception_handler(CompositionException, composition_exception_handler)
@@ -1,28 +1,62 @@
+import math
+from functools import lru_cache
+
 from fastapi import Request, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
+
+from adapters.exceptions import ServiceUnavailableException
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from use_cases.json_codec import get_json_codec
+
+
+@lru_cache(maxsize=256)
+def error_body(detail: str) -> bytes:
+    # 에러 메시지는 대부분 고정 문자열이므로 한 번 직렬화한 body를 재사용
+    return get_json_codec().dumps({"detail": detail})
 
 
 def jwt_not_valid_exception_handler(request: Request, exc: Exception) -> Response:
-    return JSONResponse(
+    return RowJSONResponse(
+        error_body(str(exc)),
         status_code=status.HTTP_401_UNAUTHORIZED,
-        content={"detail": str(exc)},
         headers={"WWW-Authenticate": "Bearer"},
     )
 
 
 async def gateway_exception_handler(request: Request, exc: Exception) -> Response:
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)}
+    return RowJSONResponse(
+        error_body(str(exc)), status_code=status.HTTP_400_BAD_REQUEST
     )
 
 
 async def not_found_exception_handler(request: Request, exc: Exception) -> Response:
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)}
-    )
+    return RowJSONResponse(error_body(str(exc)), status_code=status.HTTP_404_NOT_FOUND)
 
 
 async def forbidden_exception_handler(request: Request, exc: Exception) -> Response:
-    return JSONResponse(
-        status_code=status.HTTP_403_FORBIDDEN, content={"detail": str(exc)}
+    return RowJSONResponse(error_body(str(exc)), status_code=status.HTTP_403_FORBIDDEN)
+
+
+async def service_unavailable_exception_handler(
+    request: Request, exc: Exception
+) -> Response:
+    retry_after = exc.retry_after if isinstance(exc, ServiceUnavailableException) else 1
+    return RowJSONResponse(
+        error_body(str(exc)),
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+async def batch_too_large_exception_handler(
+    request: Request, exc: Exception
+) -> Response:
+    return RowJSONResponse(
+        error_body(str(exc)), status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    )
+
+
+async def composition_exception_handler(request: Request, exc: Exception) -> Response:
+    return RowJSONResponse(
+        error_body(str(exc)), status_code=status.HTTP_502_BAD_GATEWAY
     )
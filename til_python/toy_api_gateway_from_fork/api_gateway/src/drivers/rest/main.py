@@ -1,35 +1,77 @@
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+import aiohttp
+import httpx
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from adapters.aihttp_gateway_router import get_session
+from adapters.health_prober import health_prober
+from adapters.httpx_gateway_router import get_http2_client
+from adapters.pool_warmer import pool_warmer
+from adapters.service_discovery import service_discovery
+from adapters.shared_metrics import metrics_publisher
 from config.settings import get_settings
 from drivers.rest.exception_handlers.container import exception_container
 from drivers.rest.middleware.middleware_container import middleware_container
-from drivers.rest.routers import docs, generic, root, service_a
+from drivers.rest.routers import batch, composed, docs, generic, root, service_a
 from drivers.rest.utils.row_json_response import RowJSONResponse
+from use_cases.metrics import loop_lag_monitor
+
+
+async def get_upstream_client() -> aiohttp.ClientSession | httpx.AsyncClient:
+    settings = get_settings()
+    if settings.upstream_client == "httpx":
+        return get_http2_client(settings)
+    return await get_session()
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    # 첫 요청이 session/connection 생성 비용을 내지 않도록 시작 시 만들고 connection을 미리 열어 둠
+    await get_upstream_client()
+    pool_warmer.start(get_upstream_client, settings)
+    service_discovery.start(settings)
+    health_prober.start(get_upstream_client, settings)
+    if settings.metrics_enabled:
+        loop_lag_monitor.start(settings.loop_lag_interval)
+        metrics_publisher.start(settings)
     yield
-    if get_session.session is not None:
-        await get_session.session.close()
+    await metrics_publisher.stop()
+    await loop_lag_monitor.stop()
+    await pool_warmer.stop()
+    await health_prober.stop()
+    await service_discovery.stop()
+    await get_session.close()
+    await get_http2_client.close()
 
 
-app = FastAPI(default_response_class=RowJSONResponse, openapi_url=None, lifespan=lifespan)
+def create_app() -> FastAPI:
+    app = FastAPI(
+        default_response_class=RowJSONResponse, openapi_url=None, lifespan=lifespan
+    )
 
-get_settings().configure_logging()
+    middleware_container(app)
+    exception_container(app)
 
-middleware_container(app)
-exception_container(app)
+    app.mount(
+        "/static",
+        StaticFiles(directory=get_settings().base_path / "static"),
+        name="static",
+    )
 
-app.mount(
-    "/static", StaticFiles(directory=get_settings().base_path / "static"), name="static"
-)
+    app.include_router(service_a.router)
+    app.include_router(docs.router)
+    app.include_router(root.router)
+    app.include_router(batch.router)
+    # generic route보다 먼저 등록해 /{service}/... 형식의 composed 경로도 처리
+    app.include_router(composed.router)
+    app.include_router(generic.router)
+    return app
+
+
+get_settings().configure_logging()
 
-app.include_router(service_a.router)
-app.include_router(docs.router)
-app.include_router(root.router)
-app.include_router(generic.router)
+app = create_app()
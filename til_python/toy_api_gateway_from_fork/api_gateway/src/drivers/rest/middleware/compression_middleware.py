@@ -0,0 +1,167 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from adapters.compression import (
+    CompressedBodyCache,
+    Compressor,
+    compress,
+    compressors,
+    get_compressed_body_cache,
+    get_level,
+    negotiate_encoding,
+)
+from config.settings import get_settings
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript")
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml", "/xml")
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith(COMPRESSIBLE_TYPES) or media_type.endswith(
+        COMPRESSIBLE_SUFFIXES
+    )
+
+
+class CompressionMiddleware:
+    """Service별 CompressionPolicy에 따라 /{service}/... 응답을 gzip/br/zstd로 압축
+
+    스트리밍 응답은 chunk 단위로 압축하고, 한 번에 오는 body는 cache_enabled service면
+    같은 body를 다시 압축하지 않도록 CompressedBodyCache를 거침
+    """
+
+    def __init__(self, app: ASGIApp, cache: CompressedBodyCache | None = None) -> None:
+        self.app = app
+        settings = get_settings()
+        self.min_size = settings.compression_min_size
+        self.cache = cache or get_compressed_body_cache()
+        self.policies = {
+            slug: service.compression
+            for slug, service in settings.service_mapping.items()
+            if service.compression is not None
+        }
+        self.cached_services = frozenset(
+            slug
+            for slug, service in settings.service_mapping.items()
+            if service.cache_enabled and settings.compression_cache_max_bytes
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        slug = scope["path"][1:].partition("/")[0]
+        policy = self.policies.get(slug)
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if policy is None or not accept_encoding:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(
+            send,
+            encoding,
+            get_level(policy, encoding),
+            self.min_size,
+            self.cache if slug in self.cached_services else None,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        level: int,
+        min_size: int,
+        cache: CompressedBodyCache | None,
+    ) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.min_size = min_size
+        self.cache = cache
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._should_compress(MutableHeaders(scope=message))
+            if self._passthrough:
+                await self._send(message)
+        elif message["type"] != "http.response.body":
+            await self._send(message)
+        elif self._compressor is not None:
+            await self._send_chunk(message)
+        elif message.get("more_body", False):
+            await self._start_stream(message)
+        else:
+            await self._send_whole(message)
+
+    def _should_compress(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+        content_length = headers.get("content-length")
+        # 잘못된 Content-Length는 크기를 모르는 응답처럼 처리
+        return (
+            content_length is None
+            or not content_length.isdigit()
+            or int(content_length) >= self.min_size
+        )
+
+    async def _send_whole(self, message: Message) -> None:
+        assert self._start is not None
+        body = message.get("body", b"")
+        if len(body) < self.min_size:
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        if self.cache is not None:
+            compressed = self.cache.compress(body, self.encoding, self.level)
+        else:
+            compressed = compress(body, self.encoding, self.level)
+        headers = self._encoded_headers()
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self, message: Message) -> None:
+        assert self._start is not None
+        headers = self._encoded_headers()
+        del headers["Content-Length"]
+        self._compressor = compressors[self.encoding](self.level)
+        await self._send(self._start)
+        await self._send_chunk(message)
+
+    async def _send_chunk(self, message: Message) -> None:
+        assert self._compressor is not None
+        more_body = message.get("more_body", False)
+        chunk = message.get("body", b"")
+        body = self._compressor.compress(chunk)
+        if not more_body:
+            body += self._compressor.finish()
+        elif chunk:
+            # 압축기가 작은 chunk를 모아 두지 않도록 chunk마다 flush(SSE 등이 바로 전달되도록)
+            body += self._compressor.flush()
+        if body or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+    def _encoded_headers(self) -> MutableHeaders:
+        assert self._start is not None
+        headers = MutableHeaders(scope=self._start)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
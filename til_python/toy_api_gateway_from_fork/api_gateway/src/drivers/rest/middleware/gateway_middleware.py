@@ -0,0 +1,195 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from starlette.middleware.cors import ALL_METHODS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Header = tuple[bytes, bytes]
+
+FORWARDED_SCHEMES = frozenset({"http", "https", "ws", "wss"})
+ALLOWED_METHODS = frozenset(method.encode() for method in ALL_METHODS)
+# upstream 응답에 있더라도 gateway의 CORS 설정으로 덮어쓰는 header
+CORS_HEADER_NAMES = frozenset(
+    {b"access-control-allow-origin", b"access-control-allow-credentials"}
+)
+
+
+def encode_headers(headers: Mapping[str, Any]) -> list[Header]:
+    return [
+        (name.lower().encode("latin-1"), str(value).encode("latin-1"))
+        for name, value in headers.items()
+    ]
+
+
+class GatewayMiddleware:
+    """proxy header 반영, CORS, 추가 header 주입을 한 번의 ASGI 호출로 처리
+
+    ProxyHeadersMiddleware, CORSMiddleware(allow_credentials, 모든 method/header 허용),
+    AdditionalHeadersMiddleware를 차례로 쌓은 것과 같은 응답을 만들며
+    header는 시작 시 한 번만 인코딩하고 preflight 응답은 설정된 origin별로 미리 만들어 둠
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str],
+        additional_headers: Mapping[str, Any],
+        trusted_hosts: Sequence[str] = ("*",),
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(
+            origin.encode("latin-1") for origin in allow_origins
+        )
+        # network 대역은 지원하지 않고 host 문자열 단위로만 비교
+        self.always_trust = "*" in trusted_hosts
+        self.trusted_hosts = frozenset(trusted_hosts)
+
+        self.additional_headers = encode_headers(additional_headers)
+        credentials = (b"access-control-allow-credentials", b"true")
+        self.credentials_headers = [*self.additional_headers, credentials]
+        self.simple_headers = list(self.credentials_headers)
+        if self.allow_all_origins:
+            self.simple_headers.append((b"access-control-allow-origin", b"*"))
+
+        self.preflight_headers = encode_headers(
+            {
+                "Vary": "Origin",
+                "Access-Control-Allow-Methods": ", ".join(ALL_METHODS),
+                "Access-Control-Max-Age": max_age,
+                "Access-Control-Allow-Credentials": "true",
+            }
+        )
+        self.preflight_by_origin = {
+            origin: [*self.preflight_headers, (b"access-control-allow-origin", origin)]
+            for origin in self.allow_origins - {b"*"}
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        self._rewrite_client(scope, headers)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = headers.get(b"origin")
+        if origin is None:
+            await self.app(
+                scope, receive, self._send_with(send, self.additional_headers)
+            )
+            return
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            await self._preflight(origin, headers, send)
+            return
+
+        # cookie가 있거나 origin을 지정해 허용한 경우 '*' 대신 요청 origin을 그대로 돌려줌
+        vary_origin = False
+        if self.allow_all_origins and b"cookie" not in headers:
+            extra = self.simple_headers
+        elif self.allow_all_origins or origin in self.allow_origins:
+            extra = [
+                *self.credentials_headers,
+                (b"access-control-allow-origin", origin),
+            ]
+            vary_origin = True
+        else:
+            extra = self.credentials_headers
+        send = self._send_with(send, extra, replace_cors=True, vary_origin=vary_origin)
+        await self.app(scope, receive, send)
+
+    def _rewrite_client(self, scope: Scope, headers: dict[bytes, bytes]) -> None:
+        client = scope.get("client")
+        if not self.always_trust and (
+            not client or client[0] not in self.trusted_hosts
+        ):
+            return
+
+        forwarded_proto = headers.get(b"x-forwarded-proto")
+        if forwarded_proto is not None:
+            scheme = forwarded_proto.decode("latin-1").strip()
+            if scheme in FORWARDED_SCHEMES:
+                if scope["type"] == "websocket":
+                    scheme = scheme.replace("http", "ws")
+                scope["scheme"] = scheme
+
+        forwarded_for = headers.get(b"x-forwarded-for")
+        if forwarded_for is not None:
+            host = self._get_client_host(forwarded_for.decode("latin-1"))
+            if host:
+                scope["client"] = (host, 0)
+
+    def _get_client_host(self, forwarded_for: str) -> str:
+        hosts = [host.strip() for host in forwarded_for.split(",")]
+        if self.always_trust:
+            return hosts[0]
+        # proxy마다 뒤에 덧붙이므로 뒤에서부터 처음 나오는 신뢰하지 않는 host가 client
+        for host in reversed(hosts):
+            if host not in self.trusted_hosts:
+                return host
+        return hosts[0]
+
+    async def _preflight(
+        self, origin: bytes, headers: dict[bytes, bytes], send: Send
+    ) -> None:
+        failures = []
+        response_headers = self.preflight_by_origin.get(origin)
+        if response_headers is None:
+            if self.allow_all_origins:
+                allow_origin = (b"access-control-allow-origin", origin)
+                response_headers = [*self.preflight_headers, allow_origin]
+            else:
+                response_headers = self.preflight_headers
+                failures.append("origin")
+        if headers[b"access-control-request-method"] not in ALLOWED_METHODS:
+            failures.append("method")
+
+        requested_headers = headers.get(b"access-control-request-headers")
+        if requested_headers is not None:
+            allow_headers = (b"access-control-allow-headers", requested_headers)
+            response_headers = [*response_headers, allow_headers]
+
+        status, body = 200, b"OK"
+        if failures:
+            status, body = 400, f"Disallowed CORS {', '.join(failures)}".encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    *response_headers,
+                    (b"content-length", str(len(body)).encode()),
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    *self.additional_headers,
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _send_with(
+        send: Send,
+        extra: list[Header],
+        replace_cors: bool = False,
+        vary_origin: bool = False,
+    ) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] != "http.response.start":
+                await send(message)
+                return
+
+            headers = message.get("headers") or []
+            if replace_cors:
+                headers = [h for h in headers if h[0] not in CORS_HEADER_NAMES]
+            if vary_origin:
+                vary = [value for name, value in headers if name == b"vary"]
+                headers = [h for h in headers if h[0] != b"vary"]
+                headers.append((b"vary", b", ".join([*vary, b"Origin"])))
+            message["headers"] = [*headers, *extra]
+            await send(message)
+
+        return send_wrapper
@@ -6,17 +6,42 @@ from config.settings import get_settings
 from drivers.rest.middleware.additional_headers_middleware import (
     AdditionalHeadersMiddleware,
 )
+from drivers.rest.middleware.compression_middleware import CompressionMiddleware
+from drivers.rest.middleware.gateway_middleware import GatewayMiddleware
+from drivers.rest.middleware.proxy_dispatcher import ProxyDispatcher
+from drivers.rest.middleware.rate_limit_middleware import RateLimitMiddleware
+from drivers.rest.middleware.server_timing_middleware import ServerTimingMiddleware
 
 
 def middleware_container(app: FastAPI) -> None:
+    # 가장 안쪽 middleware로 등록해 아래 header/CORS 처리는 fast path에도 그대로 적용
+    if get_settings().fast_dispatch_enabled:
+        app.add_middleware(ProxyDispatcher, exception_handlers=app.exception_handlers)
+    if get_settings().compression_policies:
+        app.add_middleware(CompressionMiddleware)
+    # proxy header 처리 안쪽, fast path 바깥쪽에서 요청 수 제한
+    if get_settings().rate_limits:
+        app.add_middleware(RateLimitMiddleware)
+    # 압축, rate limit, fast path까지 포함한 시간을 total로 기록
+    if get_settings().server_timing_enabled:
+        app.add_middleware(ServerTimingMiddleware)
+
+    if get_settings().fused_middleware_enabled:
+        # 아래 3개 middleware와 같은 처리를 한 번의 ASGI 호출로 수행
+        app.add_middleware(
+            GatewayMiddleware,
+            allow_origins=get_settings().allow_origins,
+            additional_headers=get_settings().additional_headers,
+            trusted_hosts=["*"],
+        )
+        return
+
     # setting some additional security headers
     app.add_middleware(
         AdditionalHeadersMiddleware, headers=get_settings().additional_headers
     )
-
     # getting the connecting client information in case of the app being deployed behind a proxy
     app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=["*"])  # type: ignore
-
     # setting CORS
     app.add_middleware(
         CORSMiddleware,
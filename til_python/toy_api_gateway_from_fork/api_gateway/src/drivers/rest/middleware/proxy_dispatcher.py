@@ -0,0 +1,104 @@
+import inspect
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from adapters.aihttp_gateway_router import get_session
+from adapters.coalescing_gateway_router import get_single_flight
+from adapters.response_cache import get_response_cache
+from config.settings import get_settings
+from drivers.rest.dependencies.gateway_router import get_gateway_router
+from drivers.rest.routers.generic import stream_handler
+from drivers.rest.utils.auth_schema import oauth_scheme
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from use_cases.security import JWTValidator, get_token_cache
+from use_cases.server_timing import record_phase
+
+ExceptionHandler = Callable[[Request, Exception], Any]
+
+
+class ProxyDispatcher:
+    """/{service}/... 프록시 요청을 FastAPI routing/DI 없이 바로 gateway router로 전달
+
+    service slug가 아닌 경로와 docs, openapi.json, internal, auth 경로는 FastAPI 앱으로 넘김
+    """
+
+    FALLBACK_PATHS = frozenset({"docs", "openapi.json"})
+    FALLBACK_PREFIXES = ("internal/",)
+    # service별로 전용 handler가 있는 경로
+    SERVICE_FALLBACK_PREFIXES = {"service-a": ("auth/",)}
+
+    def __init__(
+        self, app: ASGIApp, exception_handlers: Mapping[Any, ExceptionHandler]
+    ) -> None:
+        self.app = app
+        # exception_container가 나중에 등록해도 반영되도록 app의 dict를 그대로 참조
+        self.exception_handlers = exception_handlers
+        self.settings = get_settings()
+        self.services = frozenset(self.settings.service_mapping)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        service, _, path = scope["path"][1:].partition("/")
+        if service not in self.services or self._is_fallback(service, path):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        try:
+            response = await self._proxy(service, path, request)
+        except Exception as e:
+            response = await self._handle_exception(request, e)
+        await response(scope, receive, send)
+
+    async def _proxy(self, service: str, path: str, request: Request) -> Response:
+        start = time.perf_counter()
+        credentials = await oauth_scheme(request)
+        JWTValidator(self.settings, get_token_cache()).validate(
+            credentials.credentials if credentials else None
+        )
+        record_phase("auth", start)
+        redirect = get_gateway_router(
+            await get_session(),
+            self.settings,
+            get_response_cache(),
+            get_single_flight(),
+        )
+        query = request.scope["query_string"]
+        full_path = f"/{path}?{query.decode()}" if query else f"/{path}"
+        if self.settings.streaming_enabled:
+            return await stream_handler(
+                service, full_path, request, redirect, self.settings
+            )
+        body, status_code = await redirect(
+            service,
+            full_path,
+            dict(request.headers),
+            request.method,
+            await request.body(),
+        )
+        return RowJSONResponse(body, status_code)
+
+    async def _handle_exception(self, request: Request, exc: Exception) -> Response:
+        for cls in type(exc).__mro__:
+            handler = self.exception_handlers.get(cls)
+            if handler is not None:
+                response = handler(request, exc)
+                if inspect.isawaitable(response):
+                    response = await response
+                return response  # type: ignore[no-any-return]
+        raise exc
+
+    def _is_fallback(self, service: str, path: str) -> bool:
+        if not path or path in self.FALLBACK_PATHS:
+            return True
+        prefixes = self.FALLBACK_PREFIXES + self.SERVICE_FALLBACK_PREFIXES.get(
+            service, ()
+        )
+        return path.startswith(prefixes)
@@ -0,0 +1,79 @@
+import math
+from collections.abc import Hashable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.settings import get_settings
+from domain.enitities.service import RateLimit
+from drivers.rest.exception_handlers.handlers import error_body
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from use_cases.rate_limiter import (
+    RateLimitDecision,
+    RateLimiter,
+    get_rate_limit_key,
+    get_rate_limiter,
+)
+
+
+class RateLimitMiddleware:
+    """Service별 RateLimit 설정에 따라 /{service}/... 요청 수를 제한
+
+    proxy header 처리 안쪽에 두어 client IP는 X-Forwarded-For가 반영된 값을 사용
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter | None = None) -> None:
+        self.app = app
+        self.settings = get_settings()
+        self.limiter = limiter if limiter is not None else get_rate_limiter()
+        self.limits = {
+            slug: service.rate_limit
+            for slug, service in self.settings.service_mapping.items()
+            if service.rate_limit is not None
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.limits:
+            await self.app(scope, receive, send)
+            return
+        slug = scope["path"][1:].partition("/")[0]
+        limit = self.limits.get(slug)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = self.limiter.acquire((slug, self._get_key(scope, limit)), limit)
+        rate_limit_headers = self._get_headers(decision)
+        if not decision.allowed:
+            response = RowJSONResponse(error_body("Too many requests"), 429)
+            retry_after = max(1, math.ceil(decision.retry_after))
+            response.raw_headers += [
+                *rate_limit_headers,
+                (b"retry-after", b"%d" % retry_after),
+            ]
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *rate_limit_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _get_key(self, scope: Scope, limit: RateLimit) -> Hashable:
+        authorization = dict(scope["headers"]).get(b"authorization", b"")
+        client = scope.get("client")
+        return get_rate_limit_key(
+            self.settings,
+            limit,
+            authorization.decode("latin-1"),
+            client[0] if client else None,
+        )
+
+    @staticmethod
+    def _get_headers(decision: RateLimitDecision) -> list[tuple[bytes, bytes]]:
+        return [
+            (b"ratelimit-limit", b"%d" % decision.limit),
+            (b"ratelimit-remaining", b"%d" % decision.remaining),
+            (b"ratelimit-reset", b"%d" % math.ceil(decision.reset)),
+        ]
@@ -0,0 +1,76 @@
+import random
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.settings import get_settings
+from use_cases.exceptions import NotAuthorizedException
+from use_cases.metrics import MetricsRegistry, metrics_registry
+from use_cases.security import JWTValidator, get_token_cache
+from use_cases.server_timing import ServerTiming, current_timing
+
+
+class ServerTimingMiddleware:
+    """샘플링된 요청과 debug header가 있는 요청의 단계별 소요 시간을 Server-Timing header로 응답
+
+    내부 pool, DNS, connect 시간이 드러나므로 debug header와 Server-Timing header는 유효한
+    JWT가 있는 요청에만 적용하고, 인증되지 않은 샘플링 요청은 지표만 기록
+    기록한 시간은 /metrics의 gateway_phase_seconds에도 반영
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry | None = None) -> None:
+        self.app = app
+        self.settings = get_settings()
+        self.sample_rate = self.settings.server_timing_sample_rate
+        self.debug_header = self.settings.server_timing_debug_header.lower().encode()
+        self.registry = registry or metrics_registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        sampled = bool(self.sample_rate) and random.random() < self.sample_rate
+        if not sampled and not self._debug_requested(scope):
+            await self.app(scope, receive, send)
+            return
+        expose = self._authenticated(scope)
+        if not sampled and not expose:
+            await self.app(scope, receive, send)
+            return
+
+        timing = ServerTiming()
+        token = current_timing.set(timing)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timing.add("total", time.perf_counter() - start)
+            if message["type"] == "http.response.start" and expose:
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", timing.header().encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_timing.reset(token)
+            self.registry.record_phases(timing.phases)
+
+    def _debug_requested(self, scope: Scope) -> bool:
+        return bool(self.debug_header) and any(
+            name == self.debug_header for name, _ in scope["headers"]
+        )
+
+    def _authenticated(self, scope: Scope) -> bool:
+        authorization = dict(scope["headers"]).get(b"authorization", b"")
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            # 검증 결과는 캐시되어 뒤따르는 validate_token은 서명 검증을 다시 하지 않음
+            JWTValidator(self.settings, get_token_cache()).validate(token)
+        except NotAuthorizedException:
+            return False
+        return True
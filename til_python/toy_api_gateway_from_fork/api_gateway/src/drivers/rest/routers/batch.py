@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import Depends, Request
+from fastapi.responses import Response, StreamingResponse
+
+from adapters.batch_executor import BatchExecutor
+from config.settings import BaseSettings, get_settings
+from domain.enitities.batch import BatchRequest
+from drivers.rest.dependencies.gateway_router import get_batch_gateway_router
+from drivers.rest.dependencies.security import validate_token
+from drivers.rest.utils.api_router import APIRouter
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from ports.gateway_router import GatewayRouter
+from use_cases.exceptions import BatchTooLargeException
+from use_cases.json_codec import JSONCodec, get_json_codec
+
+router = APIRouter()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@router.post("/batch", dependencies=[Depends(validate_token)], response_model=None)
+async def batch_handler(
+    batch: BatchRequest,
+    request: Request,
+    redirect: Annotated[GatewayRouter, Depends(get_batch_gateway_router)],
+    settings: Annotated[BaseSettings, Depends(get_settings)],
+    codec: Annotated[JSONCodec, Depends(get_json_codec)],
+) -> Response:
+    # JWT는 batch 요청에서 한 번만 검증하고 sub-request는 같은 header로 upstream에 전달
+    if len(batch.requests) > settings.batch_max_requests:
+        raise BatchTooLargeException
+    executor = BatchExecutor(
+        redirect,
+        settings,
+        codec,
+        dict(request.headers),
+        client=request.client.host if request.client else None,
+    )
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            stream_lines(executor, codec, batch), media_type=NDJSON_MEDIA_TYPE
+        )
+    responses = await executor.run(batch.requests)
+    return RowJSONResponse(
+        codec.dumps({"responses": [executor.encode(r) for r in responses]})
+    )
+
+
+async def stream_lines(
+    executor: BatchExecutor, codec: JSONCodec, batch: BatchRequest
+) -> AsyncIterator[bytes]:
+    # 완료된 sub-request부터 한 줄에 하나씩 전송
+    async for response in executor.stream(batch.requests):
+        yield codec.dumps(executor.encode(response)) + b"\n"
@@ -0,0 +1,39 @@
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+
+from adapters.composer import Composer
+from config.settings import get_settings
+from domain.enitities.composition import ComposedRoute
+from drivers.rest.dependencies.gateway_router import get_composed_gateway_router
+from drivers.rest.dependencies.security import validate_token
+from drivers.rest.utils.api_router import APIRouter
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from ports.gateway_router import GatewayRouter
+from use_cases.json_codec import JSONCodec, get_json_codec
+
+router = APIRouter()
+
+
+def create_handler(route: ComposedRoute) -> Callable[..., Awaitable[Response]]:
+    async def composed_handler(
+        request: Request,
+        redirect: Annotated[GatewayRouter, Depends(get_composed_gateway_router)],
+        codec: Annotated[JSONCodec, Depends(get_json_codec)],
+    ) -> Response:
+        composer = Composer(redirect, codec, dict(request.headers))
+        params = {**request.query_params, **request.path_params}
+        return RowJSONResponse(codec.dumps(await composer(route, params)))
+
+    return composed_handler
+
+
+for path, route in get_settings().composed_routes.items():
+    router.add_api_route(
+        path,
+        create_handler(route),
+        methods=["GET"],
+        dependencies=[Depends(validate_token)],
+        response_model=None,
+    )
@@ -1,25 +1,46 @@
-from http import HTTPMethod
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import Depends, Request, Response
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 
+from adapters.schema_cache import CachedSchema, SchemaCache, get_schema_cache
+from config.settings import BaseSettings, get_settings
 from drivers.rest.dependencies.gateway_router import get_openapi_gateway_router
 from drivers.rest.utils.api_router import APIRouter
 from ports.gateway_router import GatewayRouter
-from use_cases.docs import modify_paths
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=128)
+def render_docs(service: str) -> bytes:
+    return bytes(
+        get_swagger_ui_html(
+            openapi_url=f"/{service}/openapi.json",
+            title=service.replace("-", " ").title(),
+            swagger_favicon_url="/static/favicon.png",
+        ).body
+    )
+
+
+@router.get("/openapi.json")
+async def merged_openapi_handler(
+    request: Request,
+    redirect: Annotated[GatewayRouter, Depends(get_openapi_gateway_router)],
+    cache: Annotated[SchemaCache, Depends(get_schema_cache)],
+    settings: Annotated[BaseSettings, Depends(get_settings)],
+) -> Response:
+    schema = await cache.get_merged(
+        list(settings.service_mapping), redirect, "API Gateway"
+    )
+    return schema_response(request, schema)
+
+
 @router.get("/{service}/docs")
 async def docs_handler(service: str) -> HTMLResponse:
-    return get_swagger_ui_html(
-        openapi_url=f"/{service}/openapi.json",
-        title=service.replace("-", " ").title(),
-        swagger_favicon_url="/static/favicon.png",
-    )
+    return HTMLResponse(render_docs(service))
 
 
 @router.get("/{service}/openapi.json")
@@ -27,8 +48,15 @@ async def openapi_handler(
     service: str,
     request: Request,
     redirect: Annotated[GatewayRouter, Depends(get_openapi_gateway_router)],
-) -> JSONResponse:
-    body, _ = await redirect(
-        service, "/openapi.json", dict(request.headers), HTTPMethod.GET
-    )
-    return JSONResponse(content=modify_paths(body, service))
+    cache: Annotated[SchemaCache, Depends(get_schema_cache)],
+) -> Response:
+    return schema_response(request, await cache.get(service, redirect))
+
+
+def schema_response(request: Request, schema: CachedSchema) -> Response:
+    # 브라우저가 매번 ETag로 재검증하도록 no-cache
+    headers = {"ETag": schema.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if schema.etag in if_none_match or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(schema.body, media_type="application/json", headers=headers)
@@ -1,12 +1,17 @@
+from collections.abc import AsyncIterator
 from typing import Annotated, NoReturn
 
+import anyio
 from fastapi import Depends, Request, Response
+from fastapi.responses import StreamingResponse
 
+from config.settings import BaseSettings, get_settings
 from drivers.rest.dependencies.gateway_router import get_generic_gateway_router
 from drivers.rest.dependencies.security import validate_token
 from drivers.rest.utils.api_router import APIRouter
 from drivers.rest.utils.http_methods import ALL_METHODS
-from ports.gateway_router import GatewayRouter
+from drivers.rest.utils.row_json_response import RowJSONResponse
+from ports.gateway_router import GatewayRouter, UpstreamResponse
 from use_cases.exceptions import ForbiddenException
 
 router = APIRouter()
@@ -23,6 +28,7 @@ async def internal_handler() -> NoReturn:
     "/{service}/{path:path}",
     methods=ALL_METHODS,
     dependencies=[Depends(validate_token)],
+    response_model=None,
 )
 async def generic_handler(
     service: str,
@@ -30,9 +36,62 @@ async def generic_handler(
     request: Request,
     response: Response,
     redirect: Annotated[GatewayRouter, Depends(get_generic_gateway_router)],
-) -> bytes:
+    settings: Annotated[BaseSettings, Depends(get_settings)],
+) -> bytes | Response:
     full_path = f"/{path}?{request.url.query}" if request.url.query else f"/{path}"
+    if settings.streaming_enabled:
+        return await stream_handler(service, full_path, request, redirect, settings)
     body, response.status_code = await redirect(
         service, full_path, dict(request.headers), request.method, await request.body()
     )
     return body
+
+
+async def stream_handler(
+    service: str,
+    full_path: str,
+    request: Request,
+    redirect: GatewayRouter,
+    settings: BaseSettings,
+) -> Response:
+    upstream = await redirect.stream(
+        service,
+        full_path,
+        dict(request.headers),
+        request.method,
+        await get_request_body(request, settings),
+    )
+    media_type = upstream.headers.get("Content-Type", RowJSONResponse.media_type)
+    if isinstance(upstream.body, bytes):
+        return Response(upstream.body, upstream.status_code, media_type=media_type)
+    return StreamingResponse(
+        iter_body(upstream, upstream.body),
+        status_code=upstream.status_code,
+        media_type=media_type,
+    )
+
+
+async def iter_body(
+    upstream: UpstreamResponse, body: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    # 전송 중 예외나 취소로 끝나면 background task가 실행되지 않으므로 여기서 connection,
+    # concurrency slot, in-flight 지표를 반환(close는 여러 번 호출해도 한 번만 반환)
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        with anyio.CancelScope(shield=True):
+            await upstream.close()
+
+
+async def get_request_body(
+    request: Request, settings: BaseSettings
+) -> bytes | AsyncIterator[bytes] | None:
+    content_length = request.headers.get("content-length")
+    if content_length is None and "transfer-encoding" not in request.headers:
+        return None
+    if content_length is not None and (
+        content_length.isdigit() and int(content_length) <= settings.streaming_threshold
+    ):
+        return await request.body()
+    return request.stream()
@@ -1,12 +1,22 @@
+from dataclasses import asdict
+from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import Depends, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from starlette.templating import _TemplateResponse
 
+from adapters.exceptions import NotFoundException
+from adapters.health_prober import health_prober
+from adapters.pool_warmer import pool_warmer
+from adapters.response_cache import ResponseCache, get_response_cache
+from adapters.shared_metrics import metrics_publisher
 from config.settings import BaseSettings, get_settings
 from drivers.rest.utils.api_router import APIRouter
+from drivers.rest.utils.codec_json_response import CodecJSONResponse
+from use_cases.circuit_breaker import circuit_breakers
+from use_cases.metrics import render_metrics
 
 router = APIRouter()
 
@@ -28,5 +38,32 @@ async def index(
 
 
 @router.get("/healthcheck")
-def healthcheck() -> JSONResponse:
-    return JSONResponse(content={"status": "OK"})
+def healthcheck(
+    cache: Annotated[ResponseCache, Depends(get_response_cache)],
+) -> CodecJSONResponse:
+    # connection pool warmup 중에는 503으로 응답해 orchestrator가 아직 트래픽을 보내지 않게 함
+    warming = pool_warmer.warming
+    return CodecJSONResponse(
+        content={
+            "status": "WARMING" if warming else "OK",
+            "cache": asdict(cache.stats),
+            "circuit_breakers": circuit_breakers.states(),
+            "health": health_prober.results,
+            "warmup": pool_warmer.results,
+        },
+        status_code=(HTTPStatus.SERVICE_UNAVAILABLE if warming else HTTPStatus.OK),
+    )
+
+
+# lock 없이 갱신되는 지표를 같은 event loop에서 읽도록 async로 정의
+@router.get("/metrics")
+async def metrics(
+    settings: Annotated[BaseSettings, Depends(get_settings)],
+) -> PlainTextResponse:
+    if not settings.metrics_enabled:
+        raise NotFoundException
+    # runner로 여러 worker를 띄웠으면 shared memory의 모든 worker 지표를 합산
+    registry, pools, limits = metrics_publisher.collect()
+    return PlainTextResponse(
+        render_metrics(registry, pools, limits), media_type="text/plain; version=0.0.4"
+    )
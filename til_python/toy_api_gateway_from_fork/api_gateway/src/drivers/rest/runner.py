@@ -0,0 +1,141 @@
+"""gateway를 worker process N개로 실행
+
+worker마다 SO_REUSEPORT socket을 따로 bind 해 kernel이 연결을 worker들에 나눠 주고,
+각 worker는 app을 새로 import 하므로 AiohttpSessionEngine(connection pool)도 worker별로 가짐
+uvloop/httptools가 설치되어 있으면 uvicorn이 자동으로 사용
+metrics 외의 상태(rate limit bucket, response cache, circuit breaker, concurrency limiter)는
+worker마다 따로 가지므로 rate_limits를 쓰는 경우에는 --workers 1로 실행
+
+    python -m drivers.rest.runner --workers 4 --port 8010
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+import uvicorn
+
+from adapters.shared_metrics import SharedMetrics
+
+logger = logging.getLogger()
+
+APP = "drivers.rest.main:app"
+# 시작 후 이 시간(초) 안에 종료된 worker는 설정/bind 오류로 보고 재시작하지 않음
+MIN_UPTIME = 1.0
+
+
+def create_socket(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(index: int, args: argparse.Namespace, shm_name: str | None) -> None:
+    # get_settings()가 처음 호출되기 전에 설정해야 worker의 settings에 반영됨
+    os.environ["WORKER_INDEX"] = str(index)
+    if shm_name:
+        os.environ["METRICS_SHM_NAME"] = shm_name
+    sock = create_socket(args.host, args.port, args.backlog)
+    config = uvicorn.Config(
+        APP,
+        loop="auto",
+        http="auto",
+        proxy_headers=True,
+        backlog=args.backlog,
+        access_log=False,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Runner:
+    """worker process를 띄우고 비정상 종료된 worker는 같은 index로 다시 띄움"""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.context = multiprocessing.get_context("spawn")
+        # worker 1개면 합산할 필요가 없어 shared memory를 만들지 않음
+        self.shared = SharedMetrics.create(args.workers) if args.workers > 1 else None
+        self.processes: dict[int, BaseProcess] = {}
+        self.started_at: dict[int, float] = {}
+        self.stopping = False
+
+    def start(self, index: int) -> None:
+        process = self.context.Process(
+            target=serve,
+            args=(index, self.args, self.shared.name if self.shared else None),
+            name=f"gateway-worker-{index}",
+        )
+        process.start()
+        self.processes[index] = process
+        self.started_at[index] = time.monotonic()
+
+    def stop(self, signum: int, frame: FrameType | None) -> None:
+        self.stopping = True
+        for process in self.processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)  # type: ignore[arg-type]
+
+    def run(self) -> int:
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        exit_code = 0
+        try:
+            for index in range(self.args.workers):
+                self.start(index)
+            while not self.stopping:
+                sentinels = {p.sentinel: i for i, p in self.processes.items()}
+                for sentinel in wait(list(sentinels)):
+                    index = sentinels[sentinel]  # type: ignore[index]
+                    if self.stopping:
+                        break
+                    exitcode = self.processes[index].exitcode
+                    if time.monotonic() - self.started_at[index] < MIN_UPTIME:
+                        logger.error(f"worker {index} failed to start ({exitcode})")
+                        exit_code = 1
+                        self.stop(signal.SIGTERM, None)
+                        break
+                    logger.warning(f"worker {index} exited with {exitcode}, restarting")
+                    self.start(index)
+        finally:
+            for process in self.processes.values():
+                process.join()
+            if self.shared is not None:
+                self.shared.close()
+                self.shared.unlink()
+        return exit_code
+
+
+def available_cpus() -> int:
+    # container에서 CPU affinity로 제한된 경우 host 전체 core 수 대신 사용할 수 있는 core 수
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=available_cpus())
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--backlog", type=int, default=2048)
+    args = parser.parse_args()
+    if not hasattr(socket, "SO_REUSEPORT"):
+        parser.error("SO_REUSEPORT is not supported on this platform")
+    logging.basicConfig(level=logging.INFO)
+    return Runner(args).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
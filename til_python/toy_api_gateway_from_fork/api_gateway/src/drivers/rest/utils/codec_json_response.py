@@ -0,0 +1,11 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from use_cases.json_codec import get_json_codec
+
+
+class CodecJSONResponse(JSONResponse):
+    # settings.json_codec로 선택된 codec으로 직렬화
+    def render(self, content: Any) -> bytes:
+        return get_json_codec().dumps(content)
@@ -1,8 +1,42 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
 from http import HTTPMethod
 from typing import Any
 
 
+async def _noop() -> None:
+    return None
+
+
+@dataclass
+class UpstreamResponse:
+    status_code: int
+    headers: Mapping[str, str]
+    # 작은 응답은 bytes로 버퍼링, 큰 응답은 chunk 단위 async iterator
+    body: bytes | AsyncIterator[bytes]
+    # 스트리밍 응답 전송이 끝난 뒤 upstream connection을 pool로 반환
+    close: Callable[[], Awaitable[None]] = field(default=_noop)
+
+    async def read(self) -> bytes:
+        if isinstance(self.body, bytes):
+            return self.body
+        try:
+            return b"".join([chunk async for chunk in self.body])
+        finally:
+            await self.close()
+
+
+def close_unclaimed(task: asyncio.Future[UpstreamResponse]) -> None:
+    # 아무도 소비하지 않게 된 스트리밍 응답의 connection을 반환(done callback용)
+    if task.cancelled() or task.exception() is not None:
+        return
+    upstream = task.result()
+    if not isinstance(upstream.body, bytes):
+        asyncio.ensure_future(upstream.close())
+
+
 class GatewayRouter(ABC):
     @abstractmethod
     async def __call__(
@@ -14,3 +48,14 @@ class GatewayRouter(ABC):
         body: bytes | None = None,
     ) -> tuple[bytes, int]:
         pass
+
+    @abstractmethod
+    async def stream(
+        self,
+        service_name: str,
+        route: str,
+        headers: dict[str, Any],
+        method: str = HTTPMethod.GET,
+        body: bytes | AsyncIterable[bytes] | None = None,
+    ) -> UpstreamResponse:
+        pass
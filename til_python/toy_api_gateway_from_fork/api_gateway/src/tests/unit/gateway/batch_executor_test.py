@@ -0,0 +1,85 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any
+
+from adapters.batch_executor import BatchExecutor
+from config.settings import TestSettings
+from domain.enitities.batch import SubRequest
+from domain.enitities.service import RateLimit
+from use_cases.json_codec import StdlibJSONCodec
+from use_cases.rate_limiter import RateLimiter
+
+
+class CountingGatewayRouter:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return b"not json", HTTPStatus.OK
+
+
+async def test_batch_executor_caps_concurrency():
+    router = CountingGatewayRouter()
+    settings = TestSettings(batch_concurrency=3)
+    executor = BatchExecutor(
+        router,  # type: ignore
+        settings,
+        StdlibJSONCodec(),
+        {"Authorization": "Bearer token", "Content-Length": "100"},
+    )
+    responses = await executor.run([SubRequest("test", "/items")] * 10)
+
+    assert router.max_active == 3
+    assert [r.index for r in responses] == list(range(10))
+    assert executor.encode(responses[0])["body"] == "not json"
+
+
+class RecordingGatewayRouter:
+    def __init__(self) -> None:
+        self.headers: list[dict[str, str]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        self.headers.append(args[2])
+        return b"{}", HTTPStatus.OK
+
+
+async def test_batch_executor_keeps_validated_authorization():
+    router = RecordingGatewayRouter()
+    executor = BatchExecutor(
+        router,  # type: ignore
+        TestSettings(),
+        StdlibJSONCodec(),
+        {"Authorization": "Bearer validated", "Accept": "text/plain"},
+    )
+    sub_headers = {
+        "authorization": "Bearer forged",
+        "Host": "evil",
+        "Connection": "close",
+        "ACCEPT": "application/json",
+    }
+    await executor.run([SubRequest("test", "/items", headers=sub_headers)])
+
+    assert router.headers == [
+        {"authorization": "Bearer validated", "accept": "application/json"}
+    ]
+
+
+async def test_batch_executor_charges_service_rate_limit():
+    settings = TestSettings()
+    settings.service_mapping["test"].rate_limit = RateLimit(rate=0.001, burst=2)
+    executor = BatchExecutor(
+        RecordingGatewayRouter(),  # type: ignore
+        settings,
+        StdlibJSONCodec(),
+        {},
+        RateLimiter(shards=1, idle_timeout=60),
+        client="127.0.0.1",
+    )
+    responses = await executor.run([SubRequest("test", "/items")] * 3)
+
+    assert [r.status for r in responses] == [200, 200, 429]
@@ -0,0 +1,89 @@
+from typing import Any
+
+import pytest
+
+from adapters.circuit_breaker_gateway_router import CircuitBreakerGatewayRouter
+from adapters.exceptions import GatewayRouterException, ServiceUnavailableException
+from config.settings import TestSettings
+from use_cases.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+
+
+@pytest.fixture
+def settings() -> TestSettings:
+    return TestSettings(
+        circuit_breaker_min_requests=4,
+        circuit_breaker_open_duration=60,
+        circuit_breaker_half_open_calls=2,
+    )
+
+
+def test_breaker_opens_on_error_rate(settings: TestSettings):
+    breaker = CircuitBreaker(settings)
+    for success in (True, True, False, False):
+        breaker.record(success, 0.01)
+    assert breaker.state == CircuitState.open
+    assert not breaker.allow()
+
+
+def test_breaker_opens_on_slow_calls(settings: TestSettings):
+    breaker = CircuitBreaker(settings)
+    for _ in range(4):
+        breaker.record(True, settings.circuit_breaker_slow_call_duration)
+    assert breaker.state == CircuitState.open
+
+
+def test_breaker_stays_closed_below_min_requests(settings: TestSettings):
+    breaker = CircuitBreaker(settings)
+    for _ in range(3):
+        breaker.record(False, 0.01)
+    assert breaker.state == CircuitState.closed
+
+
+def test_breaker_half_open_recovers(settings: TestSettings):
+    breaker = CircuitBreaker(settings)
+    breaker.trip()
+    breaker.probe_succeeded()
+
+    assert breaker.allow() and breaker.allow()
+    assert not breaker.allow()
+    breaker.record(True, 0.01)
+    breaker.record(True, 0.01)
+    assert breaker.state == CircuitState.closed
+
+
+def test_breaker_half_open_failure_reopens(settings: TestSettings):
+    breaker = CircuitBreaker(settings)
+    breaker.trip()
+    breaker.probe_succeeded()
+    breaker.allow()
+    breaker.record(False, 0.01)
+    assert breaker.state == CircuitState.open
+
+
+class FailingGatewayRouter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        self.calls += 1
+        raise GatewayRouterException
+
+
+async def test_breaker_router_fails_fast(settings: TestSettings):
+    upstream = FailingGatewayRouter()
+    router = CircuitBreakerGatewayRouter(
+        upstream,  # type: ignore
+        CircuitBreakerRegistry(),
+        settings,
+    )
+    for _ in range(4):
+        with pytest.raises(GatewayRouterException):
+            await router("test", "/items", {})
+
+    with pytest.raises(ServiceUnavailableException):
+        await router("test", "/items", {})
+    assert upstream.calls == 4
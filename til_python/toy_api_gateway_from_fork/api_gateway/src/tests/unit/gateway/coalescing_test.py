@@ -0,0 +1,101 @@
+import asyncio
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+import pytest
+
+from adapters.coalescing_gateway_router import CoalescingGatewayRouter, SingleFlight
+from adapters.exceptions import GatewayRouterException
+from config.settings import TestSettings
+from ports.gateway_router import UpstreamResponse
+
+
+class SlowGatewayRouter:
+    def __init__(self, exc: Exception | None = None) -> None:
+        self.exc = exc
+        self.calls = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        self.calls += 1
+        return b"", HTTPStatus.CREATED
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.exc:
+            raise self.exc
+        return UpstreamResponse(HTTPStatus.OK, {}, b"shared")
+
+
+def create_router(
+    upstream: SlowGatewayRouter, max_waiters: int = 100
+) -> CoalescingGatewayRouter:
+    return CoalescingGatewayRouter(
+        upstream,  # type: ignore
+        SingleFlight(max_waiters),
+        TestSettings(),
+    )
+
+
+async def test_coalescing_shares_single_upstream_call():
+    upstream = SlowGatewayRouter()
+    router = create_router(upstream)
+
+    results = await asyncio.gather(*(router("test", "/items", {}) for _ in range(10)))
+    assert upstream.calls == 1
+    assert results == [(b"shared", HTTPStatus.OK)] * 10
+
+
+@pytest.mark.parametrize(
+    ("name", "values"),
+    [("authorization", ("Bearer a", "Bearer b")), ("cookie", ("sid=a", "sid=b"))],
+)
+async def test_coalescing_key_includes_credentials(name: str, values: tuple[str, str]):
+    upstream = SlowGatewayRouter()
+    router = create_router(upstream)
+
+    await asyncio.gather(*(router("test", "/items", {name: value}) for value in values))
+    assert upstream.calls == 2
+
+
+async def test_coalescing_fans_out_errors():
+    upstream = SlowGatewayRouter(GatewayRouterException())
+    router = create_router(upstream)
+
+    results = await asyncio.gather(
+        *(router("test", "/items", {}) for _ in range(3)), return_exceptions=True
+    )
+    assert upstream.calls == 1
+    assert all(isinstance(result, GatewayRouterException) for result in results)
+
+
+async def test_coalescing_caps_waiters():
+    upstream = SlowGatewayRouter()
+    router = create_router(upstream, max_waiters=2)
+
+    await asyncio.gather(*(router("test", "/items", {}) for _ in range(5)))
+    assert upstream.calls == 3
+
+
+async def test_coalescing_skips_unsafe_methods():
+    upstream = SlowGatewayRouter()
+    router = create_router(upstream)
+
+    await asyncio.gather(
+        *(router("test", "/items", {}, HTTPMethod.POST, b"{}") for _ in range(3))
+    )
+    assert upstream.calls == 3
+
+
+async def test_coalescing_survives_leader_cancellation():
+    upstream = SlowGatewayRouter()
+    router = create_router(upstream)
+
+    leader = asyncio.create_task(router("test", "/items", {}))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(router("test", "/items", {}))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == (b"shared", HTTPStatus.OK)
+    assert upstream.calls == 1
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+
+from adapters.composer import Composer, lookup
+from adapters.exceptions import CompositionException
+from domain.enitities.composition import ComposedRoute, UpstreamCall
+from use_cases.exceptions import ForbiddenException
+from use_cases.json_codec import StdlibJSONCodec
+
+
+class DelayedGatewayRouter:
+    """(service, path) -> (지연, body, status)로 응답하는 upstream"""
+
+    def __init__(self, responses: dict[tuple[str, str], tuple[float, bytes, int]]):
+        self.responses = responses
+        self.paths: list[str] = []
+
+    async def __call__(self, service: str, path: str, *args: Any) -> tuple[bytes, int]:
+        self.paths.append(path)
+        delay, body, status = self.responses[(service, path)]
+        await asyncio.sleep(delay)
+        return body, status
+
+
+def create_composer(router: DelayedGatewayRouter) -> Composer:
+    return Composer(router, StdlibJSONCodec(), {})  # type: ignore
+
+
+async def test_composer_runs_independent_calls_concurrently():
+    router = DelayedGatewayRouter(
+        {
+            ("users", "/users/7"): (0.05, b'{"id": 7, "team": {"id": 3}}', 200),
+            ("teams", "/teams/3"): (0.05, b'{"name": "core"}', 200),
+            ("feed", "/feed?user=7"): (0.05, b'[{"title": "hi"}]', 200),
+        }
+    )
+    route = ComposedRoute(
+        calls={
+            "user": UpstreamCall(service="users", path="/users/{id}"),
+            "team": UpstreamCall(
+                service="teams", path="/teams/{user.team.id}", depends_on=["user"]
+            ),
+            "feed": UpstreamCall(service="feed", path="/feed?user={id}"),
+        },
+        merge={"team": "team.name", "first": "feed.0.title", "missing": "user.nope"},
+    )
+    start = time.perf_counter()
+    result = await create_composer(router)(route, {"id": "7"})
+    elapsed = time.perf_counter() - start
+
+    assert result == {"team": "core", "first": "hi", "missing": None}
+    # user -> team 경로(2회 지연)만큼 걸리고 feed는 동시에 진행
+    assert 0.1 <= elapsed < 0.15
+
+
+async def test_composer_optional_and_required_failures():
+    router = DelayedGatewayRouter(
+        {
+            ("a", "/ok"): (0, b'{"ok": true}', 200),
+            ("b", "/fail"): (0, b'{"detail": "boom"}', 500),
+        }
+    )
+    optional = ComposedRoute(
+        calls={
+            "a": UpstreamCall(service="a", path="/ok"),
+            "b": UpstreamCall(service="b", path="/fail", optional=True),
+        }
+    )
+    assert await create_composer(router)(optional, {}) == {"a": {"ok": True}, "b": None}
+
+    required = ComposedRoute(calls={"b": UpstreamCall(service="b", path="/fail")})
+    with pytest.raises(CompositionException) as exc_info:
+        await create_composer(router)(required, {})
+    assert exc_info.value.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@pytest.mark.parametrize(
+    "calls, merge",
+    (
+        ({"a": UpstreamCall(service="a", path="/", depends_on=["b"])}, {}),
+        (
+            {
+                "a": UpstreamCall(service="a", path="/", depends_on=["b"]),
+                "b": UpstreamCall(service="b", path="/", depends_on=["a"]),
+            },
+            {},
+        ),
+        ({"a": UpstreamCall(service="a", path="/")}, {"x": "b.field"}),
+        ({"a": UpstreamCall(service="a", path="/internal/hello")}, {}),
+        ({"a": UpstreamCall(service="a", path="/x/%2e%2e/internal?id={id}")}, {}),
+    ),
+)
+def test_composed_route_validation(
+    calls: dict[str, UpstreamCall], merge: dict[str, str]
+):
+    with pytest.raises(ValueError):
+        ComposedRoute(calls=calls, merge=merge)
+
+
+@pytest.mark.parametrize("value", (".", "..", "internal"))
+async def test_composer_rejects_paths_escaping_template(value: str):
+    router = DelayedGatewayRouter({})
+    route = ComposedRoute(calls={"a": UpstreamCall(service="a", path="/{id}/orders")})
+    with pytest.raises(ForbiddenException):
+        await create_composer(router)(route, {"id": value})
+    assert router.paths == []
+
+
+def test_lookup():
+    values = {"a": {"items": [{"id": 1}]}}
+    assert lookup(values, "a.items.0.id") == 1
+    assert lookup(values, "a.items.5.id") is None
@@ -0,0 +1,65 @@
+import gzip
+import zlib
+from collections.abc import Callable
+
+import brotli
+import pytest
+import zstandard
+
+from adapters.compression import (
+    CompressedBodyCache,
+    compress,
+    compressors,
+    negotiate_encoding,
+)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0.8, *;q=0.9", "zstd"),
+        ("gzip;q=0, identity", None),
+        ("deflate", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_compressed_body_cache_reuses_result():
+    cache = CompressedBodyCache(max_bytes=1024)
+    body = b'{"id": 1}' * 100
+
+    first = cache.compress(body, "gzip", 6)
+    assert gzip.decompress(first) == body
+    assert cache.compress(body, "gzip", 6) is first
+    assert len(cache) == 1
+
+
+def test_compressed_body_cache_evicts_by_size():
+    cache = CompressedBodyCache(max_bytes=len(compress(b"a" * 10, "gzip", 6)) * 2)
+    for i in range(5):
+        cache.compress(str(i).encode() * 10, "gzip", 6)
+    assert len(cache) == 2
+    assert cache.size <= cache.max_bytes
+
+
+@pytest.mark.parametrize(
+    "encoding, decompressor",
+    [
+        ("gzip", lambda: zlib.decompressobj(16 + zlib.MAX_WBITS).decompress),
+        ("br", lambda: brotli.Decompressor().process),
+        ("zstd", lambda: zstandard.ZstdDecompressor().decompressobj().decompress),
+    ],
+)
+def test_compressor_flush_emits_each_chunk(
+    encoding: str, decompressor: Callable[[], Callable[[bytes], bytes]]
+):
+    compressor = compressors[encoding](6)
+    decompress = decompressor()
+    # SSE event처럼 작은 chunk도 다음 chunk를 기다리지 않고 바로 풀 수 있어야 함
+    for event in (b"data: 1\n\n", b"data: 2\n\n"):
+        assert decompress(compressor.compress(event) + compressor.flush()) == event
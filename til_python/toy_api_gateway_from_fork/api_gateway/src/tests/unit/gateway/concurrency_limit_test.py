@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from adapters.concurrency_limit_gateway_router import ConcurrencyLimitGatewayRouter
+from adapters.exceptions import ServiceUnavailableException
+from config.settings import TestSettings
+from use_cases.concurrency_limit import ConcurrencyLimiter, ConcurrencyLimiterRegistry
+
+
+@pytest.fixture
+def settings() -> TestSettings:
+    return TestSettings(
+        concurrency_limit_initial=4,
+        concurrency_limit_min=1,
+        concurrency_limit_max=100,
+        concurrency_limit_queue_size=2,
+        concurrency_limit_queue_timeout=0.05,
+        concurrency_limit_retry_after=3,
+    )
+
+
+async def fill(limiter: ConcurrencyLimiter) -> None:
+    while limiter.in_flight < int(limiter.limit):
+        assert await limiter.acquire()
+
+
+async def test_limit_grows_while_latency_is_stable(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    await fill(limiter)
+    for _ in range(20):
+        limiter.record(0.01, False)
+    assert limiter.limit > 4
+
+
+async def test_limit_shrinks_when_latency_rises(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    limiter.limit = 40
+    await fill(limiter)
+    for _ in range(50):
+        limiter.record(0.01, False)
+    before = limiter.limit
+    for _ in range(20):
+        limiter.record(0.1, False)
+    assert limiter.limit < before / 2
+
+
+async def test_zero_rtt_does_not_break_limit(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    await fill(limiter)
+    limiter.record(0.01, False)
+    limiter.record(0.0, False)
+    assert limiter.limit >= 4
+
+
+def test_drop_backs_off(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    limiter.record(0.01, True)
+    assert limiter.limit == 4 * settings.concurrency_limit_backoff
+
+
+async def test_release_hands_slot_to_waiter(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    await fill(limiter)
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    limiter.release()
+    assert await waiter
+    assert limiter.in_flight == 4
+    assert limiter.queued == 0
+
+
+async def test_sheds_when_queue_is_full_or_wait_times_out(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    await fill(limiter)
+    waiters = [asyncio.ensure_future(limiter.acquire()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # queue가 가득 차면 기다리지 않고 거절
+    assert not await limiter.acquire()
+    assert await asyncio.gather(*waiters) == [False, False]
+    assert limiter.shed == 3
+    assert limiter.queued == 0
+    assert limiter.in_flight == 4
+
+
+class SlowGatewayRouter:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        await self.release.wait()
+        return b"{}", 200
+
+
+async def test_router_sheds_with_retry_after(settings: TestSettings):
+    upstream = SlowGatewayRouter()
+    limiters = ConcurrencyLimiterRegistry()
+    router = ConcurrencyLimitGatewayRouter(
+        upstream,  # type: ignore
+        limiters,
+        settings,
+    )
+    tasks = [asyncio.ensure_future(router("test", "/items", {})) for _ in range(6)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableException) as exc_info:
+        await router("test", "/items", {})
+    assert exc_info.value.retry_after == 3
+
+    upstream.release.set()
+    assert [status for _, status in await asyncio.gather(*tasks)] == [200] * 6
+    assert limiters.get("test", settings).in_flight == 0
+
+
+class DelayedGatewayRouter:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        await asyncio.sleep(self.delay)
+        return b"{}", 200
+
+
+async def test_default_limit_absorbs_burst_against_slow_upstream():
+    # 기본 설정에서는 느린 upstream으로 몰린 요청도 이전 connection pool 크기만큼은 거절하지 않음
+    settings = TestSettings()
+    limiters = ConcurrencyLimiterRegistry()
+    router = ConcurrencyLimitGatewayRouter(
+        DelayedGatewayRouter(0.2),  # type: ignore
+        limiters,
+        settings,
+    )
+
+    results = await asyncio.gather(*(router("test", "/items", {}) for _ in range(100)))
+
+    assert [status for _, status in results] == [200] * 100
+    assert limiters.get("test", settings).shed == 0
@@ -0,0 +1,51 @@
+import httpx
+
+from adapters.health_prober import HealthProber
+from config.settings import TestSettings
+from domain.enitities.service import Service
+from use_cases.circuit_breaker import CircuitBreakerRegistry, CircuitState
+
+SERVICE = Service(
+    name="A", internal_url="http://service-a:8000", slug="a", health_path="/health"
+)
+
+
+def create_client(statuses: dict[str, int]) -> httpx.AsyncClient:
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses[request.url.path])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+
+async def test_single_failed_round_keeps_breaker_closed():
+    statuses = {"/health": 503}
+    breakers = CircuitBreakerRegistry()
+    prober = HealthProber(breakers)
+    settings = TestSettings(health_check_failure_threshold=3)
+    async with create_client(statuses) as client:
+        assert not await prober.probe(client, settings, SERVICE)
+        assert breakers.get("a", settings).state == CircuitState.closed
+
+        # 성공하면 연속 실패 횟수를 다시 셈
+        statuses["/health"] = 200
+        assert await prober.probe(client, settings, SERVICE)
+        statuses["/health"] = 503
+        for _ in range(2):
+            assert not await prober.probe(client, settings, SERVICE)
+        assert breakers.get("a", settings).state == CircuitState.closed
+
+
+async def test_consecutive_failures_trip_breaker():
+    statuses = {"/health": 503}
+    breakers = CircuitBreakerRegistry()
+    prober = HealthProber(breakers)
+    settings = TestSettings(health_check_failure_threshold=3)
+    async with create_client(statuses) as client:
+        for _ in range(3):
+            assert not await prober.probe(client, settings, SERVICE)
+        assert breakers.get("a", settings).state == CircuitState.open
+
+        # health check가 다시 성공하면 시험 요청을 허용
+        statuses["/health"] = 200
+        assert await prober.probe(client, settings, SERVICE)
+        assert breakers.get("a", settings).state == CircuitState.half_open
@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import AsyncIterator
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+import pytest
+
+from adapters.exceptions import UpstreamConnectionException
+from adapters.hedging_gateway_router import HedgingGatewayRouter
+from config.environements import EnvType
+from config.settings import LocalSettings, TestSettings
+from domain.enitities.service import RetryPolicy, Service
+from ports.gateway_router import UpstreamResponse
+from use_cases.retry_policy import LatencyTracker, RetryBudget, RetryStateRegistry
+
+
+class ScriptedGatewayRouter:
+    """호출 순서대로 (지연, 결과)를 돌려주는 upstream"""
+
+    def __init__(self, *script: tuple[float, bytes | Exception]) -> None:
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        upstream = await self.stream(*args, **kwargs)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        delay, result = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return UpstreamResponse(HTTPStatus.OK, {}, result)
+
+
+class GatedGatewayRouter:
+    """gate가 열릴 때까지 모든 요청을 붙잡아 두는 스트리밍 upstream"""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.calls = 0
+        self.closed = 0
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        self.calls += 1
+        await self.gate.wait()
+
+        async def body() -> AsyncIterator[bytes]:
+            yield b"ok"
+
+        async def close() -> None:
+            self.closed += 1
+
+        return UpstreamResponse(HTTPStatus.OK, {}, body(), close)
+
+
+def create_router(upstream: ScriptedGatewayRouter, policy: RetryPolicy):
+    settings = TestSettings()
+    settings.service_mapping["test"] = Service(
+        name="Test", internal_url="http://test", slug="test", retry_policy=policy
+    )
+    states = RetryStateRegistry()
+    router = HedgingGatewayRouter(upstream, states, settings)  # type: ignore
+    return router, states.get(settings.service_mapping["test"], policy)
+
+
+def test_retry_policies_are_opt_in():
+    settings = LocalSettings(env=EnvType.local)
+    assert settings.service_mapping["service-a"].retry_policy is None
+
+    settings = LocalSettings(
+        env=EnvType.local, retry_policies={"service-a": RetryPolicy(hedge=True)}
+    )
+    assert settings.service_mapping["service-a"].retry_policy == RetryPolicy(hedge=True)
+    assert settings.service_mapping["service-b"].retry_policy is None
+
+
+async def test_retries_connect_errors():
+    upstream = ScriptedGatewayRouter((0, UpstreamConnectionException()), (0, b"ok"))
+    router, _ = create_router(upstream, RetryPolicy(backoff_base=0.001))
+
+    assert await router("test", "/items", {}) == (b"ok", HTTPStatus.OK)
+    assert upstream.calls == 2
+
+
+async def test_retry_budget_stops_retries():
+    upstream = ScriptedGatewayRouter((0, UpstreamConnectionException()))
+    router, _ = create_router(
+        upstream,
+        RetryPolicy(backoff_base=0.001, budget_ratio=0, budget_min_per_second=0),
+    )
+
+    with pytest.raises(UpstreamConnectionException):
+        await router("test", "/items", {})
+    assert upstream.calls == 1
+
+
+async def test_hedge_uses_first_response_and_cancels_loser():
+    upstream = ScriptedGatewayRouter((1, b"slow"), (0, b"fast"))
+    router, state = create_router(upstream, RetryPolicy(hedge=True))
+    for _ in range(64):
+        state.latency.record(0.001)
+
+    assert await router("test", "/items", {}) == (b"fast", HTTPStatus.OK)
+    await asyncio.sleep(0)
+    assert upstream.calls == 2
+    assert upstream.cancelled == 1
+
+
+async def test_hedge_closes_response_finished_in_same_round():
+    upstream = GatedGatewayRouter()
+    router, state = create_router(upstream, RetryPolicy(hedge=True))  # type: ignore
+    for _ in range(64):
+        state.latency.record(0.001)
+
+    task = asyncio.create_task(router.stream("test", "/items", {}))
+    while upstream.calls < 2:
+        await asyncio.sleep(0.001)
+    # primary와 hedge가 같은 loop tick에 끝남
+    upstream.gate.set()
+    winner = await task
+    await asyncio.sleep(0)
+    assert upstream.closed == 1
+
+    await winner.close()
+    assert upstream.closed == 2
+
+
+async def test_non_idempotent_methods_are_not_retried():
+    upstream = ScriptedGatewayRouter((0, UpstreamConnectionException()))
+    router, _ = create_router(upstream, RetryPolicy())
+
+    with pytest.raises(UpstreamConnectionException):
+        await router("test", "/items", {}, HTTPMethod.POST, b"{}")
+    assert upstream.calls == 1
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(size=100, refresh_every=10)
+    for i in range(100):
+        tracker.record(i / 1000)
+    assert tracker.percentile(95) == pytest.approx(0.095)
+
+
+def test_retry_budget_ratio():
+    budget = RetryBudget(ratio=0.5, min_per_second=0)
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
@@ -0,0 +1,74 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from adapters.exceptions import UpstreamConnectionException
+from adapters.httpx_gateway_router import HttpxClientEngine, HttpxGatewayRouter
+from benchmarks.stub_upstream import H2StubUpstream, StubUpstream
+from config.settings import TestSettings
+
+
+def create_router(handler: httpx.MockTransport) -> HttpxGatewayRouter:
+    settings = TestSettings(streaming_threshold=16, streaming_chunk_size=4)
+    return HttpxGatewayRouter(httpx.AsyncClient(transport=handler), settings)
+
+
+async def test_httpx_router_buffers_small_response():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url == "https://jsonplaceholder.typicode.com/todos/1"
+        assert "upgrade" not in request.headers
+        assert request.headers["authorization"] == "Bearer token"
+        return httpx.Response(HTTPStatus.OK, content=b'{"id": 1}')
+
+    router = create_router(httpx.MockTransport(handler))
+    body, status = await router(
+        "test", "/todos/1/", {"authorization": "Bearer token", "upgrade": "websocket"}
+    )
+    assert (body, status) == (b'{"id": 1}', HTTPStatus.OK)
+
+
+async def test_httpx_router_streams_large_response():
+    payload = b"x" * 64
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(HTTPStatus.OK, content=payload)
+
+    router = create_router(httpx.MockTransport(handler))
+    upstream = await router.stream("test", "/photos", {})
+    assert not isinstance(upstream.body, bytes)
+    assert [chunk async for chunk in upstream.body] == [b"xxxx"] * 16
+    await upstream.close()
+
+
+async def test_httpx_router_maps_connect_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    router = create_router(httpx.MockTransport(handler))
+    with pytest.raises(UpstreamConnectionException):
+        await router("test", "/todos/1", {})
+
+
+async def test_http2_client_uses_h2c_for_plaintext_upstream():
+    upstream = await H2StubUpstream().start()
+    engine = HttpxClientEngine()
+    try:
+        client = engine(TestSettings())
+        response = await client.get(f"{upstream.url}/items")
+        assert response.http_version == "HTTP/2"
+    finally:
+        await engine.close()
+        await upstream.stop()
+
+
+async def test_http2_client_falls_back_to_http1_without_prior_knowledge():
+    upstream = await StubUpstream().start()
+    engine = HttpxClientEngine()
+    try:
+        client = engine(TestSettings(http2_prior_knowledge=False))
+        response = await client.get(f"{upstream.url}/items")
+        assert response.http_version == "HTTP/1.1"
+    finally:
+        await engine.close()
+        await upstream.stop()
@@ -0,0 +1,41 @@
+import json
+from typing import Any
+
+import pytest
+
+from config.settings import TestSettings
+from use_cases.json_codec import JSONCodec, json_codec_mapping
+
+DOCUMENT: dict[str, Any] = {
+    "openapi": "3.1.0",
+    "info": {"title": "서비스", "version": "0.1.0"},
+    "paths": {
+        "/items": {"get": {"summary": "항목", "parameters": [{"name": "q"}]}},
+        "/items/{id}": {"delete": {"responses": {"204": {"description": ""}}}},
+    },
+}
+
+
+@pytest.fixture(params=list(json_codec_mapping))
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    return json_codec_mapping[request.param]()
+
+
+def test_codec_round_trip(codec: JSONCodec):
+    body = codec.dumps(DOCUMENT)
+    assert b": " not in body
+    assert codec.loads(body) == DOCUMENT
+
+
+def test_codec_prefix_keys(codec: JSONCodec):
+    body = codec.prefix_keys(json.dumps(DOCUMENT).encode(), "paths", "/service-a")
+
+    result = json.loads(body)
+    assert list(result["paths"]) == ["/service-a/items", "/service-a/items/{id}"]
+    assert result["paths"]["/service-a/items"] == DOCUMENT["paths"]["/items"]
+    assert result["info"] == DOCUMENT["info"]
+
+
+def test_invalid_json_codec_setting():
+    with pytest.raises(ValueError):
+        TestSettings(json_codec="ujson")
@@ -0,0 +1,66 @@
+from collections import Counter
+
+from domain.enitities.service import LoadBalancingStrategy, Service
+from use_cases.load_balancing import (
+    LeastOutstandingLoadBalancer,
+    LoadBalancerRegistry,
+    PowerOfTwoLoadBalancer,
+    RoundRobinLoadBalancer,
+)
+
+URLS = ["http://replica-1", "http://replica-2", "http://replica-3"]
+
+
+def test_round_robin_cycles_endpoints():
+    balancer = RoundRobinLoadBalancer(URLS)
+    assert [balancer.pick().url for _ in range(6)] == URLS * 2
+
+
+def test_least_outstanding_avoids_busy_endpoints():
+    balancer = LeastOutstandingLoadBalancer(URLS)
+    balancer.endpoints[0].acquire()
+    balancer.endpoints[1].acquire()
+    assert balancer.pick().url == "http://replica-3"
+
+
+def test_power_of_two_prefers_fast_endpoints():
+    balancer = PowerOfTwoLoadBalancer(URLS)
+    balancer.endpoints[0].observe(0.5)
+    balancer.endpoints[1].observe(0.01)
+    balancer.endpoints[2].observe(0.01)
+
+    picks = Counter(balancer.pick().url for _ in range(300))
+    assert picks["http://replica-1"] == 0
+
+
+def test_registry_uses_service_endpoints():
+    registry = LoadBalancerRegistry()
+    single = Service(name="A", internal_url="http://a", slug="a")
+    replicated = Service(
+        name="B",
+        internal_url="http://b",
+        slug="b",
+        endpoints=URLS,
+        load_balancing=LoadBalancingStrategy.least_outstanding,
+    )
+
+    assert registry.get(single).pick().url == "http://a"
+    assert isinstance(registry.get(replicated), LeastOutstandingLoadBalancer)
+    assert registry.get(replicated) is registry.get(replicated)
+
+
+def test_registry_update_keeps_existing_endpoints():
+    registry = LoadBalancerRegistry()
+    service = Service(name="B", internal_url="http://b", slug="b", endpoints=URLS)
+    kept = registry.get(service).endpoints[1]
+    kept.acquire()
+
+    registry.update(service, ["http://replica-2", "http://replica-4"])
+
+    endpoints = registry.get(service).endpoints
+    assert [endpoint.url for endpoint in endpoints] == [
+        "http://replica-2",
+        "http://replica-4",
+    ]
+    assert endpoints[0] is kept
+    assert endpoints[0].outstanding == 1
@@ -0,0 +1,127 @@
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+
+from adapters.exceptions import GatewayRouterException
+from adapters.metrics_gateway_router import MetricsGatewayRouter
+from config.settings import TestSettings
+from ports.gateway_router import UpstreamResponse
+from use_cases.metrics import LatencyHistogram, MetricsRegistry, render_metrics
+
+
+class StaticGatewayRouter:
+    def __init__(self, body: bytes | Exception, chunked: bool = False) -> None:
+        self.body = body
+        self.chunked = chunked
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        upstream = await self.stream(*args, **kwargs)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        body = self.body
+        if isinstance(body, Exception):
+            raise body
+        if not self.chunked:
+            return UpstreamResponse(HTTPStatus.OK, {}, body)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield body
+
+        return UpstreamResponse(HTTPStatus.OK, {}, chunks())
+
+
+@pytest.mark.parametrize("value", (0.0, 3e-5, 2**-14, 0.001, 0.0125, 0.5, 1.0, 63.9))
+def test_histogram_bucket_bounds(value: float):
+    bounds = LatencyHistogram.bounds
+    index = LatencyHistogram.index(value)
+    assert value <= bounds[index]
+    assert index == 0 or bounds[index - 1] <= value
+    # 상대 오차는 1/SUB_BUCKETS 이하
+    if index:
+        assert bounds[index] / bounds[index - 1] <= 1 + 1 / LatencyHistogram.SUB_BUCKETS
+
+
+def test_histogram_overflow_bucket():
+    histogram = LatencyHistogram()
+    histogram.record(1000)
+    assert histogram.counts[-1] == 1
+    assert (histogram.count, histogram.sum) == (1, 1000)
+
+
+async def test_metrics_router_records_status_and_errors():
+    registry = MetricsRegistry()
+    router = MetricsGatewayRouter(
+        StaticGatewayRouter(b"ok"),  # type: ignore
+        TestSettings(),
+        registry,
+    )
+    await router("test", "/items", {})
+    failing = MetricsGatewayRouter(
+        StaticGatewayRouter(GatewayRouterException()),  # type: ignore
+        TestSettings(),
+        registry,
+    )
+    with pytest.raises(GatewayRouterException):
+        await failing("test", "/items", {})
+
+    metrics = registry.get("test")
+    assert metrics.requests == {HTTPStatus.OK: 1, "error": 1}
+    assert metrics.latency.count == 2
+    assert metrics.in_flight == 0
+
+
+async def test_metrics_router_tracks_streams_until_close():
+    registry = MetricsRegistry()
+    router = MetricsGatewayRouter(
+        StaticGatewayRouter(b"ok", chunked=True),  # type: ignore
+        TestSettings(),
+        registry,
+    )
+    upstream = await router.stream("test", "/items", {})
+    assert registry.get("test").in_flight == 1
+    assert await upstream.read() == b"ok"
+    await upstream.close()
+    assert registry.get("test").in_flight == 0
+
+
+async def test_metrics_router_skips_unknown_services():
+    registry = MetricsRegistry()
+    router = MetricsGatewayRouter(
+        StaticGatewayRouter(b"ok"),  # type: ignore
+        TestSettings(),
+        registry,
+    )
+    await router("random-slug", "/items", {})
+    upstream = await router.stream("another-slug", "/items", {})
+    await upstream.close()
+    assert registry.services == {}
+
+
+def test_render_metrics():
+    registry = MetricsRegistry()
+    registry.get("test").record(HTTPStatus.OK, 0.001)
+    registry.record_loop_lag(0.002)
+    text = render_metrics(registry, [("127.0.0.1:8000", 2, 3)], [("test", 12.5, 1, 4)])
+
+    assert 'gateway_upstream_requests_total{service="test",status="200"} 1' in text
+    assert 'gateway_upstream_in_flight{service="test"} 0' in text
+    assert 'gateway_upstream_latency_seconds_bucket{service="test",le="+Inf"} 1' in text
+    assert 'gateway_upstream_latency_seconds_count{service="test"} 1' in text
+    assert "gateway_event_loop_lag_seconds_count 1" in text
+    assert 'gateway_pool_connections{host="127.0.0.1:8000",state="acquired"} 2' in text
+    assert 'gateway_pool_connections{host="127.0.0.1:8000",state="idle"} 3' in text
+    assert 'gateway_concurrency_limit{service="test"} 12.5' in text
+    assert 'gateway_concurrency_queued{service="test"} 1' in text
+    assert 'gateway_concurrency_shed_total{service="test"} 4' in text
+
+
+def test_render_metrics_escapes_label_values():
+    registry = MetricsRegistry()
+    registry.get('a"b\\c\nd').record(HTTPStatus.OK, 0.001)
+    text = render_metrics(registry)
+
+    assert 'gateway_upstream_in_flight{service="a\\"b\\\\c\\nd"} 0' in text
+    assert all(not line.startswith("d") for line in text.splitlines())
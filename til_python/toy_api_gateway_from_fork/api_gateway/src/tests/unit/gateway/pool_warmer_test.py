@@ -0,0 +1,96 @@
+import asyncio
+
+import httpx
+from aiohttp import web
+
+from adapters.aihttp_gateway_router import AiohttpSessionEngine
+from adapters.pool_warmer import PoolWarmer
+from adapters.service_discovery import ServiceDiscovery
+from config.settings import TestSettings
+from domain.enitities.service import Service
+from use_cases.load_balancing import LoadBalancerRegistry
+
+
+async def test_warmup_opens_keep_alive_connections():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handle(request: web.Request) -> web.Response:
+        started.set()
+        await release.wait()
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/health", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    settings = TestSettings(pool_warmup_connections=3, service_discovery_enabled=False)
+    settings.service_mapping.clear()
+    settings.service_mapping["warm"] = Service(
+        name="warm",
+        internal_url=f"http://127.0.0.1:{port}",
+        slug="warm",
+        health_path="/health",
+    )
+    sessions = AiohttpSessionEngine()
+    warmer = PoolWarmer(LoadBalancerRegistry(), ServiceDiscovery())
+    try:
+        warmer.start(sessions, settings)
+        await started.wait()
+        assert warmer.warming
+
+        release.set()
+        assert warmer._task is not None
+        await warmer._task
+        assert not warmer.warming
+        assert warmer.results == {f"http://127.0.0.1:{port}": 3}
+        # 응답이 끝난 connection은 idle 상태로 pool에 남음
+        assert sessions.pool_stats() == [(f"127.0.0.1:{port}", 0, 3)]
+    finally:
+        await warmer.stop()
+        await sessions.close()
+        await runner.cleanup()
+
+
+async def test_warmup_gives_up_after_timeout():
+    settings = TestSettings(
+        pool_warmup_connections=1,
+        pool_warmup_timeout=0.01,
+        service_discovery_enabled=True,
+    )
+    sessions = AiohttpSessionEngine()
+    # 첫 DNS 조회가 끝나지 않아도 timeout이 지나면 ready
+    warmer = PoolWarmer(LoadBalancerRegistry(), ServiceDiscovery())
+    try:
+        warmer.start(sessions, settings)
+        assert warmer._task is not None
+        await warmer._task
+        assert not warmer.warming
+    finally:
+        await warmer.stop()
+        await sessions.close()
+
+
+async def test_warmup_uses_httpx_client():
+    requests: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200)
+
+    settings = TestSettings(pool_warmup_connections=3, service_discovery_enabled=False)
+    settings.service_mapping.clear()
+    settings.service_mapping["warm"] = Service(
+        name="warm", internal_url="http://warm:8000", slug="warm", health_path="/health"
+    )
+    warmer = PoolWarmer(LoadBalancerRegistry(), ServiceDiscovery())
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as client:
+        await warmer.warm(client, settings)
+
+    # HTTP/2 요청은 connection 하나에 multiplexing 되므로 endpoint마다 한 번만 요청
+    assert requests == ["http://warm:8000/health"]
+    assert warmer.results == {"http://warm:8000": 1}
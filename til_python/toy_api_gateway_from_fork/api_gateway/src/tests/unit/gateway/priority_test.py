@@ -0,0 +1,113 @@
+import asyncio
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from jose import jwt
+
+from config.settings import TestSettings
+from domain.enitities.service import PriorityRule
+from use_cases.concurrency_limit import ConcurrencyLimiter, WeightedFairQueue
+from use_cases.priority import PriorityClassifier
+
+
+@pytest.fixture
+def settings() -> TestSettings:
+    return TestSettings(
+        priority_rules=[
+            PriorityRule(priority="high", service="test", path="/auth/*"),
+            PriorityRule(priority="high", claim="plan", value="premium"),
+            PriorityRule(priority="low", path="*/reports/*"),
+        ],
+        concurrency_limit_initial=1,
+        concurrency_limit_queue_size=2,
+        concurrency_limit_queue_timeout=1,
+    )
+
+
+def create_token(settings: TestSettings, **claims: str) -> str:
+    exp = datetime.now(tz=UTC) + timedelta(minutes=5)
+    return jwt.encode(
+        {"aud": "user@example.com", "exp": exp, **claims},
+        settings.jwt_secret_key.get_secret_value(),
+        algorithm=settings.jwt_algorithm,
+    )
+
+
+def test_classify_by_route_and_claim(settings: TestSettings):
+    classifier = PriorityClassifier(settings)
+    premium = {"authorization": f"Bearer {create_token(settings, plan='premium')}"}
+    forged = {"authorization": "Bearer not-a-token"}
+
+    assert classifier.classify("test", "/auth/login?next=/", {}) == "high"
+    assert classifier.classify("other", "/auth/login", {}) == "normal"
+    assert classifier.classify("test", "/v1/reports/2024", premium) == "high"
+    assert classifier.classify("test", "/v1/reports/2024", forged) == "low"
+    assert classifier.classify("test", "/items", {}) == "normal"
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"priority_rules": [PriorityRule(priority="urgent")]},
+        {"default_priority": "urgent"},
+        {"priority_weights": {"high": 8, "normal": 0, "low": 1}},
+    ],
+)
+def test_settings_reject_invalid_priorities(config: dict[str, Any]):
+    with pytest.raises(ValueError):
+        TestSettings(**config)
+
+
+async def test_weighted_fair_queue_shares_by_weight():
+    queue = WeightedFairQueue({"high": 3, "low": 1})
+    loop = asyncio.get_running_loop()
+    priorities = {}
+    for _ in range(40):
+        for priority in ("high", "low"):
+            waiter = loop.create_future()
+            priorities[waiter] = priority
+            queue.push(priority, waiter)
+
+    popped: Counter[str] = Counter()
+    for _ in range(40):
+        popped_waiter = queue.pop()
+        assert popped_waiter is not None
+        popped[priorities[popped_waiter]] += 1
+
+    assert popped == {"high": 30, "low": 10}
+    assert len(queue) == 40
+
+
+async def test_weighted_fair_queue_idle_class_does_not_catch_up():
+    queue = WeightedFairQueue({"high": 1, "low": 1})
+    loop = asyncio.get_running_loop()
+    for _ in range(10):
+        queue.push("high", loop.create_future())
+    for _ in range(5):
+        queue.pop()
+    low = loop.create_future()
+    queue.push("low", low)
+
+    # 오래 비어 있던 low도 밀린 몫 없이 high와 번갈아 꺼냄
+    assert low in (queue.pop(), queue.pop())
+
+
+async def test_high_priority_evicts_low_when_queue_is_full(settings: TestSettings):
+    limiter = ConcurrencyLimiter(settings)
+    assert limiter.try_acquire()
+    low = [asyncio.ensure_future(limiter.acquire("low")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    high = asyncio.ensure_future(limiter.acquire("high"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    # 가장 늦게 들어온 low 요청이 거절되고 그 자리에 high 요청이 기다림
+    assert low[1].done() and not low[1].result()
+    assert limiter.shed == 1
+
+    limiter.release()
+    assert await high
+    limiter.release()
+    assert await low[0]
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from domain.enitities.service import RateLimit
+from use_cases.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+def test_limiter_allows_burst_then_rejects(clock: FakeClock):
+    limiter = RateLimiter(shards=4, idle_timeout=60)
+    limit = RateLimit(rate=2, burst=3)
+
+    decisions = [limiter.acquire("client", limit) for _ in range(4)]
+    assert [decision.allowed for decision in decisions] == [True, True, True, False]
+    assert decisions[2].remaining == 0
+    assert decisions[3].retry_after == pytest.approx(0.5)
+    assert limiter.acquire("other", limit).allowed
+
+
+def test_limiter_refills_tokens(clock: FakeClock):
+    limiter = RateLimiter(shards=4, idle_timeout=60)
+    limit = RateLimit(rate=2, burst=3)
+    for _ in range(3):
+        limiter.acquire("client", limit)
+
+    clock.now += 0.5
+    decision = limiter.acquire("client", limit)
+    assert decision.allowed
+    assert decision.reset == pytest.approx(1.5)
+
+
+def test_limiter_evicts_idle_full_buckets(clock: FakeClock):
+    limiter = RateLimiter(shards=2, idle_timeout=10)
+    slow = RateLimit(rate=0.01, burst=1)
+    for key in range(100):
+        limiter.acquire(key, RateLimit(rate=100, burst=10))
+    limiter.acquire("slow", slow)
+
+    # 모든 shard를 한 번씩 sweep 할 만큼 시간을 보냄
+    for _ in range(2):
+        clock.now += 10
+        limiter.acquire("trigger", RateLimit(rate=100, burst=10))
+    # 아직 가득 차지 않은 bucket은 남겨 둬야 제한이 풀리지 않음
+    assert len(limiter) == 2
+    assert not limiter.acquire("slow", slow).allowed
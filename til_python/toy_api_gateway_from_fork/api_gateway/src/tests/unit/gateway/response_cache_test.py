@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterator
+from http import HTTPMethod, HTTPStatus
+from typing import Any
+
+import pytest
+
+from adapters.cached_gateway_router import CachedGatewayRouter
+from adapters.response_cache import ResponseCache
+from config.settings import TestSettings
+from domain.enitities.service import Service
+from ports.gateway_router import UpstreamResponse
+
+KEY = ("test", HTTPMethod.GET, "/items/1")
+AUTHORIZED = {"authorization": "Bearer token"}
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(max_bytes=1024, max_entry_bytes=512)
+
+
+@pytest.mark.parametrize(
+    "cache_control, request_headers, cached",
+    (
+        ("max-age=60", {}, True),
+        ("public, max-age=60", AUTHORIZED, True),
+        ("max-age=60", AUTHORIZED, False),
+        ("private, max-age=60", {}, False),
+        ("no-store", {}, False),
+        ("public", {}, False),
+    ),
+)
+def test_cache_respects_cache_control(
+    cache: ResponseCache,
+    cache_control: str,
+    request_headers: dict[str, str],
+    cached: bool,
+):
+    headers = {"Cache-Control": cache_control}
+    assert cache.set(KEY, request_headers, HTTPStatus.OK, headers, b"{}") is cached
+    assert (cache.get(KEY, request_headers) is not None) is cached
+
+
+def test_cache_vary_keys(cache: ResponseCache):
+    headers = {"Cache-Control": "max-age=60", "Vary": "Accept-Language"}
+    cache.set(KEY, {"accept-language": "en"}, HTTPStatus.OK, headers, b"en")
+    cache.set(KEY, {"accept-language": "ko"}, HTTPStatus.OK, headers, b"ko")
+
+    assert cache.get(KEY, {"accept-language": "en"}).body == b"en"  # type: ignore
+    assert cache.get(KEY, {"accept-language": "ko"}).body == b"ko"  # type: ignore
+    assert cache.get(KEY, {"accept-language": "de"}) is None
+
+
+def test_cache_evicts_least_recently_used(cache: ResponseCache):
+    headers = {"Cache-Control": "max-age=60"}
+    for i in range(4):
+        cache.set(("test", "GET", f"/{i}"), {}, HTTPStatus.OK, headers, b"x" * 300)
+
+    assert cache.stats.size_bytes <= cache.max_bytes
+    assert cache.stats.evictions == 1
+    assert cache.get(("test", "GET", "/0"), {}) is None
+    assert cache.get(("test", "GET", "/3"), {}) is not None
+
+
+class CountingGatewayRouter:
+    def __init__(self, cache_control: str) -> None:
+        self.cache_control = cache_control
+        self.calls = 0
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        self.calls += 1
+        headers = {"Cache-Control": self.cache_control}
+        return UpstreamResponse(HTTPStatus.OK, headers, str(self.calls).encode())
+
+
+@pytest.fixture
+def settings() -> TestSettings:
+    settings = TestSettings()
+    settings.service_mapping["test"] = Service(
+        name="Test", internal_url="http://test", slug="test", cache_enabled=True
+    )
+    return settings
+
+
+async def test_cached_router_serves_hits(cache: ResponseCache, settings: TestSettings):
+    upstream = CountingGatewayRouter("max-age=60")
+    router = CachedGatewayRouter(upstream, cache, settings)  # type: ignore
+
+    assert await router("test", "/items/1", {}) == (b"1", HTTPStatus.OK)
+    assert await router("test", "/items/1", {}) == (b"1", HTTPStatus.OK)
+    assert upstream.calls == 1
+    assert cache.stats.hits == 1
+
+
+async def test_cached_router_stale_while_revalidate(
+    cache: ResponseCache, settings: TestSettings
+):
+    upstream = CountingGatewayRouter("max-age=1, stale-while-revalidate=60")
+    router = CachedGatewayRouter(upstream, cache, settings)  # type: ignore
+    await router("test", "/items/1", {})
+    next(iter(cache._entries.values())).fresh_until = 0
+
+    assert await router("test", "/items/1", {}) == (b"1", HTTPStatus.OK)
+    await asyncio.gather(*cache.revalidating.values())
+    assert upstream.calls == 2
+    assert await router("test", "/items/1", {}) == (b"2", HTTPStatus.OK)
+
+
+async def test_cached_router_closes_uncached_revalidation(
+    cache: ResponseCache, settings: TestSettings
+):
+    upstream = CountingGatewayRouter("max-age=1, stale-while-revalidate=60")
+    router = CachedGatewayRouter(upstream, cache, settings)  # type: ignore
+    await router("test", "/items/1", {})
+    next(iter(cache._entries.values())).fresh_until = 0
+    closed = []
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"large"
+
+    async def close() -> None:
+        closed.append(True)
+
+    async def stream(*args: Any, **kwargs: Any) -> UpstreamResponse:
+        return UpstreamResponse(HTTPStatus.OK, {}, chunks(), close)
+
+    upstream.stream = stream  # type: ignore
+    await router("test", "/items/1", {})
+    await asyncio.gather(*cache.revalidating.values())
+    assert closed == [True]
@@ -0,0 +1,71 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any
+
+from adapters.schema_cache import SchemaCache
+from ports.gateway_router import UpstreamResponse
+from use_cases.docs import merge_schemas
+
+SCHEMA: dict[str, Any] = {
+    "openapi": "3.1.0",
+    "info": {"title": "Service A", "version": "0.1.0"},
+    "paths": {
+        "/items": {
+            "get": {"responses": {"200": {"$ref": "#/components/responses/Item"}}}
+        }
+    },
+    "components": {"responses": {"Item": {"description": "item"}}},
+}
+
+
+class SchemaGatewayRouter:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.status_code = HTTPStatus.OK
+
+    async def __call__(
+        self, service_name: str, route: str, headers: dict[str, Any], *args: Any
+    ) -> tuple[bytes, int]:
+        upstream = await self.stream(service_name, route, headers)
+        return await upstream.read(), upstream.status_code
+
+    async def stream(
+        self, service_name: str, route: str, headers: dict[str, Any], *args: Any
+    ) -> UpstreamResponse:
+        self.requests.append(headers)
+        body = json.dumps(SCHEMA).encode()
+        return UpstreamResponse(self.status_code, {"ETag": '"v1"'}, body)
+
+
+async def test_schema_cache_revalidates_in_background():
+    router = SchemaGatewayRouter()
+    cache = SchemaCache(ttl=0)
+
+    first = await cache.get("service-a", router)  # type: ignore
+    router.status_code = HTTPStatus.NOT_MODIFIED
+    assert await cache.get("service-a", router) is first  # type: ignore
+    await asyncio.sleep(0)
+
+    assert router.requests == [{}, {"if-none-match": '"v1"'}]
+    assert cache.schemas["service-a"] is first
+    assert json.loads(first.body)["paths"].keys() == {"/service-a/items"}
+
+
+async def test_schema_cache_shares_concurrent_fetch():
+    router = SchemaGatewayRouter()
+    cache = SchemaCache(ttl=60)
+
+    await asyncio.gather(*(cache.get("service-a", router) for _ in range(5)))  # type: ignore
+    assert len(router.requests) == 1
+
+
+def test_merge_schemas_prefixes_components():
+    merged = merge_schemas({"service-a": SCHEMA, "service-b": SCHEMA}, "Gateway")
+
+    assert merged["components"]["responses"].keys() == {"ServiceAItem", "ServiceBItem"}
+    ref = merged["paths"]["/items"]["get"]["responses"]["200"]["$ref"]
+    assert ref == "#/components/responses/ServiceBItem"
+    assert SCHEMA["paths"]["/items"]["get"]["responses"]["200"]["$ref"].endswith(
+        "/Item"
+    )
@@ -0,0 +1,176 @@
+import asyncio
+import socket
+import time
+
+import pytest
+
+from adapters.service_discovery import DiscoveryResolver, ServiceDiscovery
+from config.settings import BaseSettings, TestSettings
+from domain.enitities.service import Service
+from use_cases.load_balancing import LoadBalancerRegistry
+
+SERVICE = Service(
+    name="A",
+    internal_url="http://service-a:8000",
+    slug="a",
+    endpoints=["http://service-a:8000", "https://secure-a", "unix:///tmp/a.sock"],
+)
+
+
+class FakeDNS:
+    def __init__(self) -> None:
+        self.answers: dict[str, tuple[list[str], float | None]] = {}
+        self.calls: list[str] = []
+
+    async def __call__(self, host: str) -> tuple[list[str], float | None]:
+        self.calls.append(host)
+        if host not in self.answers:
+            raise OSError(f"unknown host {host}")
+        return self.answers[host]
+
+
+def create_settings() -> BaseSettings:
+    settings = TestSettings(dns_min_ttl=5.0, dns_max_ttl=60.0, dns_fallback_ttl=30.0)
+    settings.service_mapping.clear()
+    settings.service_mapping["a"] = SERVICE
+    return settings
+
+
+@pytest.mark.parametrize(
+    ("ttl", "expected"), [(1, 5.0), (20, 20.0), (3600, 60.0), (None, 30.0)]
+)
+async def test_resolve_clamps_ttl(ttl: float | None, expected: float):
+    dns = FakeDNS()
+    dns.answers["service-a"] = (["10.0.0.1"], ttl)
+    discovery = ServiceDiscovery(LoadBalancerRegistry(), dns)
+
+    now = time.monotonic()
+    await discovery.resolve("service-a", create_settings())
+
+    assert discovery.hosts["service-a"].expires_at - now == pytest.approx(
+        expected, abs=1
+    )
+
+
+async def test_resolve_keeps_last_known_good_answer():
+    dns = FakeDNS()
+    dns.answers["service-a"] = (["10.0.0.1", "10.0.0.2"], 10)
+    discovery = ServiceDiscovery(LoadBalancerRegistry(), dns)
+    settings = create_settings()
+    await discovery.resolve("service-a", settings)
+
+    dns.answers.pop("service-a")
+    assert await discovery.resolve("service-a", settings) == ["10.0.0.1", "10.0.0.2"]
+
+    with pytest.raises(OSError):
+        await discovery.resolve("unknown", settings)
+
+
+async def test_refresh_expands_http_endpoints():
+    dns = FakeDNS()
+    dns.answers["service-a"] = (["10.0.0.1", "10.0.0.2"], 10)
+    dns.answers["secure-a"] = (["10.0.1.1"], 10)
+    balancers = LoadBalancerRegistry()
+    discovery = ServiceDiscovery(balancers, dns)
+
+    await discovery.refresh(create_settings())
+
+    assert [endpoint.url for endpoint in balancers.get(SERVICE).endpoints] == [
+        "http://10.0.0.1:8000",
+        "http://10.0.0.2:8000",
+        "https://secure-a",
+        "unix:///tmp/a.sock",
+    ]
+    # 만료되지 않은 host는 다시 조회하지 않음
+    await discovery.refresh(create_settings())
+    assert sorted(dns.calls) == ["secure-a", "service-a"]
+
+
+async def test_resolver_serves_cached_addresses():
+    dns = FakeDNS()
+    dns.answers["secure-a"] = (["10.0.1.1"], 10)
+    settings = create_settings()
+    discovery = ServiceDiscovery(LoadBalancerRegistry(), dns)
+    await discovery.refresh(settings)
+    resolver = DiscoveryResolver(discovery, settings)
+
+    hosts = await resolver.resolve("secure-a", 443)
+
+    assert [(host["hostname"], host["host"], host["port"]) for host in hosts] == [
+        ("secure-a", "10.0.1.1", 443)
+    ]
+    assert dns.calls.count("secure-a") == 1
+
+
+async def test_refresh_expands_ipv6_endpoints():
+    dns = FakeDNS()
+    dns.answers["service-a"] = (["10.0.0.1", "fd00::1"], 10)
+    balancers = LoadBalancerRegistry()
+    discovery = ServiceDiscovery(balancers, dns)
+
+    await discovery.refresh(create_settings())
+
+    assert [endpoint.url for endpoint in balancers.get(SERVICE).endpoints][:2] == [
+        "http://10.0.0.1:8000",
+        "http://[fd00::1]:8000",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("family", "expected"),
+    [
+        (
+            socket.AF_UNSPEC,
+            [("10.0.1.1", socket.AF_INET), ("fd00::1", socket.AF_INET6)],
+        ),
+        (socket.AF_INET, [("10.0.1.1", socket.AF_INET)]),
+        (socket.AF_INET6, [("fd00::1", socket.AF_INET6)]),
+    ],
+)
+async def test_resolver_filters_by_family(
+    family: socket.AddressFamily, expected: list[tuple[str, int]]
+):
+    dns = FakeDNS()
+    dns.answers["secure-a"] = (["10.0.1.1", "fd00::1"], 10)
+    settings = create_settings()
+    resolver = DiscoveryResolver(
+        ServiceDiscovery(LoadBalancerRegistry(), dns), settings
+    )
+
+    hosts = await resolver.resolve("secure-a", 443, family)
+
+    assert [(host["host"], host["family"]) for host in hosts] == expected
+
+
+async def test_resolver_rejects_missing_family():
+    dns = FakeDNS()
+    dns.answers["secure-a"] = (["fd00::1"], 10)
+    settings = create_settings()
+    resolver = DiscoveryResolver(
+        ServiceDiscovery(LoadBalancerRegistry(), dns), settings
+    )
+
+    with pytest.raises(OSError):
+        await resolver.resolve("secure-a", 443, socket.AF_INET)
+
+
+def test_refreshed_is_reset_across_lifespans():
+    dns = FakeDNS()
+    dns.answers["service-a"] = (["10.0.0.1"], 10)
+    discovery = ServiceDiscovery(LoadBalancerRegistry(), dns)
+    settings = create_settings()
+    settings.service_discovery_enabled = True
+
+    async def lifespan() -> None:
+        discovery.start(settings)
+        await asyncio.wait_for(discovery.refreshed.wait(), 1)
+        await discovery.stop()
+        assert not discovery.refreshed.is_set()
+
+    # 재시작한 lifespan은 새 event loop에서 다시 첫 refresh를 기다림
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(lifespan())
+        finally:
+            loop.close()
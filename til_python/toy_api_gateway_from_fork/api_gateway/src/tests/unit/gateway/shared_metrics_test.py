@@ -0,0 +1,97 @@
+from typing import Any
+
+from adapters.shared_metrics import (
+    SLOT_HEADER,
+    MetricsPublisher,
+    SharedMetrics,
+    merge_snapshots,
+)
+from config.settings import TestSettings
+from use_cases.json_codec import get_json_codec
+from use_cases.metrics import MetricsRegistry, metrics_registry
+
+
+def create_snapshot(status: int, latency: float, lag: float) -> dict[str, Any]:
+    registry = MetricsRegistry()
+    registry.get("service-a").record(status, latency)
+    registry.get("service-a").in_flight = 1
+    registry.record_loop_lag(lag)
+    registry.record_phases({"ttfb": latency})
+    # process 사이에서는 JSON으로 주고받음
+    codec = get_json_codec()
+    snapshot: dict[str, Any] = codec.loads(
+        codec.dumps(
+            {
+                "metrics": registry.snapshot(),
+                "pools": [("a:80", 1, 2)],
+                "limits": [("service-a", 20.0, 1, 3)],
+            }
+        )
+    )
+    return snapshot
+
+
+def test_merge_snapshots_sums_workers():
+    registry, pools, limits = merge_snapshots(
+        [create_snapshot(200, 0.01, 0.001), create_snapshot(500, 0.02, 0.005)]
+    )
+
+    metrics = registry.services["service-a"]
+    assert metrics.requests == {"200": 1, "500": 1}
+    assert metrics.in_flight == 2
+    assert metrics.latency.count == 2
+    assert sum(metrics.latency.counts) == 2
+    assert registry.loop_lag_max == 0.005
+    assert registry.phases["ttfb"].count == 2
+    assert pools == [("a:80", 2, 4)]
+    assert limits == [("service-a", 40.0, 2, 6)]
+
+
+def test_shared_metrics_slots():
+    owner = SharedMetrics.create(2, slot_size=1024)
+    worker = SharedMetrics.attach(owner.name)
+    try:
+        assert worker.slots == 2
+        assert owner.read(1) is None
+
+        worker.write(1, b"first")
+        worker.write(1, b"second")
+        assert owner.read(1) == b"second"
+        # slot보다 큰 snapshot은 기록하지 않음
+        assert not worker.write(0, b"x" * 2048)
+        assert owner.read(0) is None
+
+        # 쓰는 도중 죽은 process가 남긴 홀수 sequence도 다음 기록으로 복구
+        SLOT_HEADER.pack_into(worker.buf, worker._offset(1), 7, 0)
+        assert owner.read(1) is None
+        worker.write(1, b"third")
+        assert owner.read(1) == b"third"
+    finally:
+        worker.close()
+        owner.close()
+        owner.unlink()
+
+
+async def test_restarted_worker_keeps_previous_counters():
+    owner = SharedMetrics.create(1, slot_size=64 * 1024)
+    # 같은 slot을 쓰던 worker가 요청 1개, 거절 3개를 기록한 채 죽음
+    owner.write(0, get_json_codec().dumps(create_snapshot(200, 0.01, 0.001)))
+    before = metrics_registry.snapshot()["services"].get("service-a", {})
+    publisher = MetricsPublisher()
+    publisher.start(
+        TestSettings(
+            metrics_shm_name=owner.name, worker_index=0, metrics_publish_interval=60
+        )
+    )
+    try:
+        registry, pools, limits = publisher.collect()
+        metrics = registry.services["service-a"]
+        assert metrics.requests["200"] == before.get("requests", {}).get("200", 0) + 1
+        # 이전 process의 in flight, connection pool, 제한 값은 이어받지 않음
+        assert metrics.in_flight == before.get("in_flight", 0)
+        assert ("a:80", 1, 2) not in pools
+        assert ("service-a", 0.0, 0, 3) in limits
+    finally:
+        await publisher.stop()
+        owner.close()
+        owner.unlink()
@@ -0,0 +1,42 @@
+import aiohttp
+from aiohttp import web
+
+from adapters.trace_config import create_trace_config
+from use_cases.server_timing import ServerTiming, current_timing
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.Response(body=b"ok")
+
+
+async def test_trace_config_records_phases():
+    app = web.Application()
+    app.router.add_get("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}/"
+
+    connector = aiohttp.TCPConnector(limit=1)
+    timing = ServerTiming()
+    token = current_timing.set(timing)
+    try:
+        async with aiohttp.ClientSession(
+            connector=connector, trace_configs=[create_trace_config()]
+        ) as session:
+            async with session.get(url) as response:
+                assert await response.read() == b"ok"
+            # 두 번째 요청은 pool의 connection을 재사용해 connect가 다시 기록되지 않음
+            connect = timing.phases["connect"]
+            async with session.get(url) as response:
+                await response.read()
+            # 샘플링되지 않은 요청은 기록하지 않음
+            current_timing.reset(token)
+            async with session.get(url) as response:
+                await response.read()
+    finally:
+        await runner.cleanup()
+
+    assert set(timing.phases) == {"connect", "ttfb"}
+    assert timing.phases["connect"] == connect
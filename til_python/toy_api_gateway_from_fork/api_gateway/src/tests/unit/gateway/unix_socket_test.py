@@ -0,0 +1,41 @@
+from http import HTTPStatus
+
+from aiohttp import web
+
+from adapters.aihttp_gateway_router import AiohttpGatewayRouter, AiohttpSessionEngine
+from config.settings import TestSettings
+from domain.enitities.service import Service
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.json_response({"path": request.path, "host": request.host})
+
+
+async def test_aiohttp_router_uses_unix_socket(tmp_path):
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    path = str(tmp_path / "upstream.sock")
+    await web.UnixSite(runner, path).start()
+
+    settings = TestSettings()
+    settings.service_mapping["uds"] = Service(
+        name="uds", internal_url=f"unix://{path}", slug="uds"
+    )
+    sessions = AiohttpSessionEngine()
+    router = AiohttpGatewayRouter(await sessions(), settings, sessions=sessions)
+    try:
+        body, status = await router("uds", "/todos/1/", {})
+        assert status == HTTPStatus.OK
+        assert body == b'{"path": "/todos/1", "host": "localhost"}'
+
+        upstream = await router.stream("uds", "/todos/2", {})
+        assert upstream.status_code == HTTPStatus.OK
+        await upstream.close()
+        # 같은 socket 경로는 session(connection pool) 하나를 재사용
+        assert list(sessions.unix_sessions) == [path]
+    finally:
+        await sessions.close()
+        await runner.cleanup()
+    assert sessions.unix_sessions == {}
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any
+
+from httpx import AsyncClient
+
+from adapters.exceptions import NotFoundException
+from drivers.rest.dependencies.gateway_router import get_batch_gateway_router
+from drivers.rest.main import app
+from tests.conftest import create_jwt
+
+
+class SlowGatewayRouter:
+    """route의 첫 segment를 지연(초)으로 사용하는 upstream"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, ...]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        self.calls.append(args)
+        service, route, headers, method, body = args
+        if service == "missing":
+            raise NotFoundException
+        await asyncio.sleep(float(route.split("/")[1]))
+        return body or b'{"route": "%s"}' % route.encode(), HTTPStatus.OK
+
+
+def override_router() -> SlowGatewayRouter:
+    router = SlowGatewayRouter()
+    app.dependency_overrides[get_batch_gateway_router] = lambda: router
+    return router
+
+
+async def test_batch_returns_results_in_order(async_client: AsyncClient):
+    router = override_router()
+    response = await async_client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"service": "test", "path": "/0.02/items", "id": "slow"},
+                {
+                    "service": "test",
+                    "path": "/0/items",
+                    "method": "POST",
+                    "body": {"a": 1},
+                },
+                {"service": "missing", "path": "/0"},
+                {"service": "test", "path": "/internal/users"},
+                {"service": "test", "path": "/1/items", "timeout": 0.01},
+            ]
+        },
+        headers={"Authorization": f"Bearer {create_jwt()}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()["responses"]
+    assert [r["status"] for r in results] == [200, 200, 404, 403, 504]
+    assert results[0] == {
+        "index": 0,
+        "id": "slow",
+        "status": 200,
+        "body": {"route": "/0.02/items"},
+    }
+    assert results[1]["body"] == {"a": 1}
+    # 모든 sub-request에 batch 요청의 인증 header를 전달
+    assert all(call[2]["authorization"].startswith("Bearer ") for call in router.calls)
+    assert router.calls[1][2]["content-type"] == "application/json"
+
+
+async def test_batch_rejects_internal_paths_after_normalization(
+    async_client: AsyncClient,
+):
+    router = override_router()
+    paths = [
+        "/x/../internal/hello",
+        "/x/%2e%2e/internal/hello",
+        "//internal/hello",
+        "/./internal",
+        "/0//items/./?q=1",
+    ]
+    response = await async_client.post(
+        "/batch",
+        json={"requests": [{"service": "test", "path": path} for path in paths]},
+        headers={"Authorization": f"Bearer {create_jwt()}"},
+    )
+    results = response.json()["responses"]
+    assert [r["status"] for r in results] == [403, 403, 403, 403, 200]
+    assert [call[1] for call in router.calls] == ["/0/items/?q=1"]
+
+
+async def test_batch_streams_results_as_completed(async_client: AsyncClient):
+    override_router()
+    response = await async_client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"service": "test", "path": "/0.05/items"},
+                {"service": "test", "path": "/0/items"},
+            ]
+        },
+        headers={
+            "Authorization": f"Bearer {create_jwt()}",
+            "Accept": "application/x-ndjson",
+        },
+    )
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == [1, 0]
+
+
+async def test_batch_limits(async_client: AsyncClient):
+    override_router()
+    headers = {"Authorization": f"Bearer {create_jwt()}"}
+    too_many = {"requests": [{"service": "test", "path": "/0"}] * 51}
+    response = await async_client.post("/batch", json=too_many, headers=headers)
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+    response = await async_client.post("/batch", json={"requests": []})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
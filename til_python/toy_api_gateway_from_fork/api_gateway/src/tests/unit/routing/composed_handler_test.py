@@ -0,0 +1,35 @@
+from http import HTTPStatus
+from typing import Any
+
+from httpx import AsyncClient
+
+from drivers.rest.dependencies.gateway_router import get_composed_gateway_router
+from drivers.rest.main import app
+from tests.conftest import create_jwt
+
+
+async def test_composed_route_merges_results(async_client: AsyncClient):
+    async def router(service: str, path: str, *args: Any) -> tuple[bytes, int]:
+        return b'{"message": "Hello from %s"}' % service.encode(), HTTPStatus.OK
+
+    app.dependency_overrides[get_composed_gateway_router] = lambda: router
+    response = await async_client.get(
+        "/compose/hello", headers={"Authorization": f"Bearer {create_jwt()}"}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "service_a": "Hello from service-a",
+        "service_b": "Hello from service-b",
+    }
+
+
+async def test_composed_route_upstream_failure(async_client: AsyncClient):
+    async def router(service: str, path: str, *args: Any) -> tuple[bytes, int]:
+        return b"{}", HTTPStatus.INTERNAL_SERVER_ERROR
+
+    app.dependency_overrides[get_composed_gateway_router] = lambda: router
+    response = await async_client.get(
+        "/compose/hello", headers={"Authorization": f"Bearer {create_jwt()}"}
+    )
+    assert response.status_code == HTTPStatus.BAD_GATEWAY
+    assert response.json() == {"detail": "Upstream call 'a' failed"}
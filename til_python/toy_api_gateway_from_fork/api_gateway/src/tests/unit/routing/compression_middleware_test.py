@@ -0,0 +1,84 @@
+import gzip
+from collections.abc import AsyncIterator
+
+import pytest
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from adapters.compression import CompressedBodyCache
+from domain.enitities.service import CompressionPolicy
+from drivers.rest.middleware.compression_middleware import CompressionMiddleware
+
+BODY = b'{"id": 1, "title": "delectus aut autem"}' * 100
+
+
+async def whole(request: Request) -> Response:
+    return Response(BODY, media_type="application/json")
+
+
+async def small(request: Request) -> Response:
+    return JSONResponse({"id": 1})
+
+
+async def encoded(request: Request) -> Response:
+    return Response(
+        gzip.compress(BODY),
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+async def stream(request: Request) -> Response:
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(10):
+            yield BODY
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+@pytest.fixture
+async def client():
+    app = Starlette(
+        routes=[
+            Route("/test/whole", whole),
+            Route("/test/small", small),
+            Route("/test/encoded", encoded),
+            Route("/test/stream", stream),
+        ]
+    )
+    middleware = CompressionMiddleware(app, CompressedBodyCache(1024 * 1024))
+    middleware.policies = {"test": CompressionPolicy()}
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        yield client
+
+
+async def test_compresses_whole_body(client: AsyncClient):
+    response = await client.get("/test/whole", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(BODY)
+    assert response.content == BODY
+
+
+async def test_compresses_streamed_body(client: AsyncClient):
+    response = await client.get("/test/stream", headers={"Accept-Encoding": "zstd"})
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert "Content-Length" not in response.headers
+    assert response.content == BODY * 10
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding", [("/test/small", "gzip"), ("/test/whole", "identity")]
+)
+async def test_skips_compression(client: AsyncClient, path: str, accept_encoding: str):
+    response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+    assert "Content-Encoding" not in response.headers
+
+
+async def test_keeps_already_encoded_body(client: AsyncClient):
+    response = await client.get("/test/encoded", headers={"Accept-Encoding": "br"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.content == BODY
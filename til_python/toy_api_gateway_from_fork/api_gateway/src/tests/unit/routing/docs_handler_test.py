@@ -1,15 +1,39 @@
 from http import HTTPStatus
 from typing import Any
 
+import pytest
 from httpx import AsyncClient
 
+from adapters.schema_cache import SchemaCache, get_schema_cache
 from drivers.rest.dependencies.gateway_router import get_openapi_gateway_router
 from drivers.rest.main import app
+from ports.gateway_router import UpstreamResponse
 
 openapi_json = b'{"openapi":"3.1.0","info":{"title":"Service B","version":"0.1.0"},"paths":{"/hello":{"get":{"summary":"Hello","operationId":"hello_hello_get","responses":{"200":{"description":"Successful Response","content":{"application/json":{"schema":{}}}}}}}}}'
 service = "service-a"
 
 
+class MockGatewayRouter:
+    calls = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
+        return openapi_json, HTTPStatus.OK
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        MockGatewayRouter.calls += 1
+        return UpstreamResponse(HTTPStatus.OK, {"ETag": '"v1"'}, openapi_json)
+
+
+@pytest.fixture
+def schema_cache():
+    cache = SchemaCache(ttl=60)
+    MockGatewayRouter.calls = 0
+    app.dependency_overrides[get_openapi_gateway_router] = MockGatewayRouter
+    app.dependency_overrides[get_schema_cache] = lambda: cache
+    yield cache
+    del app.dependency_overrides[get_schema_cache]
+
+
 async def test_docs_success(async_client: AsyncClient):
     response = await async_client.get(f"/{service}/docs")
     assert response.status_code == 200
@@ -23,12 +47,28 @@ async def test_static_success(async_client: AsyncClient):
 
 
 async def test_openapi_router_success(async_client: AsyncClient):
-    class MockGatewayRouter:
-        async def __call__(self, *args: Any, **kwargs: Any) -> tuple[bytes, int]:
-            return openapi_json, HTTPStatus.OK
-
     app.dependency_overrides[get_openapi_gateway_router] = MockGatewayRouter
 
     response = await async_client.get(f"/{service}/openapi.json")
     for path in response.json()["paths"]:
         assert path.startswith(f"/{service}")
+
+
+async def test_openapi_cached_with_etag(
+    async_client: AsyncClient, schema_cache: SchemaCache
+):
+    response = await async_client.get(f"/{service}/openapi.json")
+    etag = response.headers["ETag"]
+    cached = await async_client.get(
+        f"/{service}/openapi.json", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == HTTPStatus.NOT_MODIFIED
+    assert cached.headers["ETag"] == etag
+    assert MockGatewayRouter.calls == 1
+
+
+async def test_merged_openapi(async_client: AsyncClient, schema_cache: SchemaCache):
+    response = await async_client.get("/openapi.json")
+    paths = response.json()["paths"]
+    assert set(paths) == {"/test/hello", "/not-exist/hello"}
+    assert paths["/test/hello"]["get"]["tags"] == ["test"]
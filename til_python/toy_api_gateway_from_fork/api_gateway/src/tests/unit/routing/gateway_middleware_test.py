@@ -0,0 +1,85 @@
+import pytest
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from drivers.rest.middleware.gateway_middleware import GatewayMiddleware
+
+ORIGIN = "https://example.com"
+
+
+async def client_info(request: Request) -> JSONResponse:
+    return JSONResponse(
+        {"host": request.client.host, "scheme": request.url.scheme},  # type: ignore
+        headers={
+            "Access-Control-Allow-Origin": "https://upstream.com",
+            "Vary": "Accept",
+        },
+    )
+
+
+def create_client(allow_origins: list[str], trusted_hosts: list[str]) -> AsyncClient:
+    app = GatewayMiddleware(
+        Starlette(routes=[Route("/info", client_info)]),
+        allow_origins=allow_origins,
+        additional_headers={"X-Content-Type-Options": "nosniff"},
+        trusted_hosts=trusted_hosts,
+    )
+    return AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    "trusted_hosts, expected",
+    [
+        (["*"], {"host": "1.1.1.1", "scheme": "https"}),
+        (["127.0.0.1"], {"host": "10.0.0.1", "scheme": "https"}),
+        (["127.0.0.1", "10.0.0.1"], {"host": "1.1.1.1", "scheme": "https"}),
+        (["10.0.0.1"], {"host": "127.0.0.1", "scheme": "http"}),
+    ],
+)
+async def test_proxy_headers_rewrite_trusted_client(
+    trusted_hosts: list[str], expected: dict[str, str]
+):
+    headers = {"X-Forwarded-For": "1.1.1.1, 10.0.0.1", "X-Forwarded-Proto": "https"}
+    async with create_client(["*"], trusted_hosts) as client:
+        response = await client.get("/info", headers=headers)
+    assert response.json() == expected
+
+
+async def test_cors_overrides_upstream_headers():
+    async with create_client(["*"], ["*"]) as client:
+        response = await client.get("/info", headers={"Origin": ORIGIN})
+    assert response.headers.get_list("Access-Control-Allow-Origin") == ["*"]
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+
+async def test_cors_echoes_origin_with_cookie():
+    async with create_client(["*"], ["*"]) as client:
+        response = await client.get(
+            "/info", headers={"Origin": ORIGIN, "Cookie": "session=1"}
+        )
+    assert response.headers["Access-Control-Allow-Origin"] == ORIGIN
+    assert response.headers["Vary"] == "Accept, Origin"
+
+
+async def test_cors_preflight_for_configured_origin():
+    headers = {"Origin": ORIGIN, "Access-Control-Request-Method": "POST"}
+    async with create_client([ORIGIN], ["*"]) as client:
+        response = await client.options("/info", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["Access-Control-Allow-Origin"] == ORIGIN
+    assert response.headers["Vary"] == "Origin"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert "Access-Control-Allow-Headers" not in response.headers
+
+
+async def test_cors_rejects_unknown_origin():
+    headers = {"Origin": "https://evil.com", "Access-Control-Request-Method": "TRACE"}
+    async with create_client([ORIGIN], ["*"]) as client:
+        preflight = await client.options("/info", headers=headers)
+        response = await client.get("/info", headers={"Origin": "https://evil.com"})
+    assert preflight.status_code == 400
+    assert preflight.text == "Disallowed CORS origin, method"
+    assert "Access-Control-Allow-Origin" not in response.headers
@@ -5,7 +5,11 @@ from unittest.mock import AsyncMock
 import pytest
 from httpx import AsyncClient
 
-from adapters.exceptions import GatewayRouterException, NotFoundException
+from adapters.exceptions import (
+    GatewayRouterException,
+    NotFoundException,
+    ServiceUnavailableException,
+)
 from drivers.rest.dependencies.gateway_router import (
     get_gateway_router,
     get_generic_gateway_router,
@@ -45,6 +49,7 @@ async def test_generic_router_is_called(
     (
         (GatewayRouterException(), HTTPStatus.BAD_REQUEST),
         (NotFoundException(), HTTPStatus.NOT_FOUND),
+        (ServiceUnavailableException(), HTTPStatus.SERVICE_UNAVAILABLE),
     ),
 )
 async def test_generic_router_exceptions(
@@ -62,6 +67,21 @@ async def test_generic_router_exceptions(
     assert response.json() == {"detail": str(exc)}
 
 
+async def test_generic_router_service_unavailable_retry_after(
+    async_client: AsyncClient,
+):
+    class OpenCircuitGatewayRouter:
+        async def __call__(self, *args: Any, **kwargs: Any) -> NoReturn:
+            raise ServiceUnavailableException(retry_after=2.5)
+
+    app.dependency_overrides[get_gateway_router] = OpenCircuitGatewayRouter
+    response = await async_client.get(
+        "/test-service/item/1", headers={"Authorization": f"Bearer {create_jwt()}"}
+    )
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "3"
+
+
 async def test_generic_router_not_authorized(async_client: AsyncClient):
     response = await async_client.get("/test-service/item/1")
     assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,106 @@
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from config.settings import TestSettings, get_settings
+from drivers.rest.dependencies.gateway_router import get_generic_gateway_router
+from drivers.rest.main import app
+from ports.gateway_router import UpstreamResponse
+from tests.conftest import create_jwt
+
+
+class MockStreamingGatewayRouter:
+    def __init__(self, body: bytes | AsyncIterator[bytes]) -> None:
+        self.body = body
+        self.request_body: Any = None
+        self.closed = False
+
+    async def stream(self, *args: Any, **kwargs: Any) -> UpstreamResponse:
+        self.request_body = args[4]
+
+        async def close() -> None:
+            self.closed = True
+
+        return UpstreamResponse(
+            HTTPStatus.OK, {"Content-Type": "text/plain"}, self.body, close
+        )
+
+
+async def chunks() -> AsyncIterator[bytes]:
+    for chunk in (b"first,", b"second,", b"third"):
+        yield chunk
+
+
+@pytest.fixture
+def streaming_settings():
+    app.dependency_overrides[get_settings] = lambda: TestSettings(
+        streaming_enabled=True, streaming_threshold=16
+    )
+    yield
+    app.dependency_overrides.pop(get_settings)
+
+
+async def test_stream_handler_relays_chunks(
+    async_client: AsyncClient, streaming_settings: None
+):
+    router = MockStreamingGatewayRouter(chunks())
+    app.dependency_overrides[get_generic_gateway_router] = lambda: router
+
+    response = await async_client.get(
+        "/test-service/files/1", headers={"Authorization": f"Bearer {create_jwt()}"}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.content == b"first,second,third"
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert router.request_body is None
+    assert router.closed
+
+
+async def test_stream_handler_buffers_small_bodies(
+    async_client: AsyncClient, streaming_settings: None
+):
+    router = MockStreamingGatewayRouter(b"small")
+    app.dependency_overrides[get_generic_gateway_router] = lambda: router
+
+    response = await async_client.post(
+        "/test-service/items",
+        content=b"tiny",
+        headers={"Authorization": f"Bearer {create_jwt()}"},
+    )
+    assert response.content == b"small"
+    assert router.request_body == b"tiny"
+
+
+async def test_stream_handler_streams_large_uploads(
+    async_client: AsyncClient, streaming_settings: None
+):
+    router = MockStreamingGatewayRouter(b"")
+    app.dependency_overrides[get_generic_gateway_router] = lambda: router
+
+    await async_client.post(
+        "/test-service/items",
+        content=b"x" * 1024,
+        headers={"Authorization": f"Bearer {create_jwt()}"},
+    )
+    assert not isinstance(router.request_body, bytes)
+
+
+async def test_stream_handler_closes_upstream_when_stream_fails(
+    async_client: AsyncClient, streaming_settings: None
+):
+    async def failing_chunks() -> AsyncIterator[bytes]:
+        yield b"first,"
+        raise RuntimeError("send failed")
+
+    router = MockStreamingGatewayRouter(failing_chunks())
+    app.dependency_overrides[get_generic_gateway_router] = lambda: router
+
+    # anyio task group에 따라 ExceptionGroup으로 감싸져 올라올 수 있음
+    with pytest.raises(Exception):  # noqa: B017
+        await async_client.get(
+            "/test-service/files/1", headers={"Authorization": f"Bearer {create_jwt()}"}
+        )
+    assert router.closed
@@ -0,0 +1,23 @@
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+from adapters.pool_warmer import pool_warmer
+
+URL = "/healthcheck"
+
+
+async def test_healthcheck_ready(async_client: AsyncClient):
+    response = await async_client.get(URL)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["status"] == "OK"
+
+
+async def test_healthcheck_not_ready_while_warming(
+    async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(pool_warmer, "warming", True)
+    response = await async_client.get(URL)
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.json()["status"] == "WARMING"
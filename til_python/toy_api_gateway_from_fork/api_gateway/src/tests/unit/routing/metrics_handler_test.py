@@ -0,0 +1,9 @@
+from httpx import AsyncClient
+
+
+async def test_metrics(async_client: AsyncClient):
+    response = await async_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE gateway_upstream_latency_seconds histogram" in response.text
+    assert "# TYPE gateway_pool_connections gauge" in response.text
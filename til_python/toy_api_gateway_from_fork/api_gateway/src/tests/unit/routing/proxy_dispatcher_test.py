@@ -0,0 +1,68 @@
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from drivers.rest.main import app
+from drivers.rest.middleware import proxy_dispatcher
+from drivers.rest.middleware.proxy_dispatcher import ProxyDispatcher
+from tests.conftest import create_jwt
+
+
+async def fallback_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await PlainTextResponse("fallback")(scope, receive, send)
+
+
+@pytest.fixture
+def mocked_router(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    router = AsyncMock(return_value=(b'{"id": 1}', HTTPStatus.CREATED))
+    monkeypatch.setattr(proxy_dispatcher, "get_gateway_router", lambda *args: router)
+    return router
+
+
+@pytest.fixture
+async def dispatcher_client(mocked_router: AsyncMock):
+    dispatcher = ProxyDispatcher(fallback_app, app.exception_handlers)
+    async with AsyncClient(app=dispatcher, base_url="http://test") as client:
+        yield client
+
+
+async def test_dispatcher_proxies_service_paths(
+    dispatcher_client: AsyncClient, mocked_router: AsyncMock
+):
+    response = await dispatcher_client.get(
+        "/test/items/1?page=2", headers={"Authorization": f"Bearer {create_jwt()}"}
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json() == {"id": 1}
+    args: Any = mocked_router.call_args.args
+    assert args[:2] == ("test", "/items/1?page=2")
+
+
+@pytest.mark.parametrize(
+    "path",
+    (
+        "/",
+        "/healthcheck",
+        "/unknown/items",
+        "/test/docs",
+        "/test/openapi.json",
+        "/test/internal/users",
+    ),
+)
+async def test_dispatcher_falls_back_to_app(
+    dispatcher_client: AsyncClient, mocked_router: AsyncMock, path: str
+):
+    response = await dispatcher_client.get(path)
+    assert response.text == "fallback"
+    mocked_router.assert_not_called()
+
+
+async def test_dispatcher_uses_exception_handlers(dispatcher_client: AsyncClient):
+    response = await dispatcher_client.get("/test/items/1")
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Not authorized"}
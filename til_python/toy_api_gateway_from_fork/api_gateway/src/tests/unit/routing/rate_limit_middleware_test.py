@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from domain.enitities.service import RateLimit, RateLimitKey
+from drivers.rest.middleware.rate_limit_middleware import RateLimitMiddleware
+from tests.conftest import create_jwt
+from use_cases.rate_limiter import RateLimiter
+
+
+async def upstream_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+def create_client(key: RateLimitKey) -> AsyncClient:
+    middleware = RateLimitMiddleware(upstream_app, RateLimiter(4, 60))
+    middleware.limits = {"test": RateLimit(rate=1, burst=2, key=key)}
+    return AsyncClient(app=middleware, base_url="http://test")
+
+
+async def test_rate_limit_headers_and_rejection():
+    async with create_client(RateLimitKey.ip) as client:
+        responses = [await client.get("/test/items") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [
+        200,
+        200,
+        HTTPStatus.TOO_MANY_REQUESTS,
+    ]
+    assert responses[0].headers["RateLimit-Limit"] == "2"
+    assert responses[0].headers["RateLimit-Remaining"] == "1"
+    assert responses[2].headers["RateLimit-Remaining"] == "0"
+    assert responses[2].headers["Retry-After"] == "1"
+
+
+async def test_rate_limit_skips_unlimited_services():
+    async with create_client(RateLimitKey.ip) as client:
+        responses = [await client.get("/not-exist/items") for _ in range(3)]
+    assert all("RateLimit-Limit" not in r.headers for r in responses)
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        (RateLimitKey.aud, [200, 200, 200, 200]),
+        (RateLimitKey.service, [200, 200, 429, 429]),
+    ],
+)
+async def test_rate_limit_key(key: RateLimitKey, expected: list[int]):
+    tokens = [create_jwt("a@example.com"), create_jwt("b@example.com")]
+    async with create_client(key) as client:
+        responses = [
+            await client.get(
+                "/test/items", headers={"Authorization": f"Bearer {token}"}
+            )
+            for token in tokens * 2
+        ]
+    assert [r.status_code for r in responses] == expected
@@ -0,0 +1,65 @@
+import time
+
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from drivers.rest.middleware.server_timing_middleware import ServerTimingMiddleware
+from tests.conftest import create_jwt
+from use_cases.metrics import MetricsRegistry
+from use_cases.server_timing import record_phase
+
+
+async def upstream_app(scope: Scope, receive: Receive, send: Send) -> None:
+    record_phase("auth", time.perf_counter())
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+async def test_server_timing_with_debug_header():
+    registry = MetricsRegistry()
+    middleware = ServerTimingMiddleware(upstream_app, registry)
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        response = await client.get(
+            "/test/items",
+            headers={"X-Debug-Timing": "1", "Authorization": f"Bearer {create_jwt()}"},
+        )
+
+    phases = [
+        part.split(";")[0] for part in response.headers["Server-Timing"].split(", ")
+    ]
+    assert phases == ["auth", "total"]
+    assert set(registry.phases) == {"auth", "total"}
+
+
+async def test_server_timing_not_sampled():
+    registry = MetricsRegistry()
+    middleware = ServerTimingMiddleware(upstream_app, registry)
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        response = await client.get("/test/items")
+
+    assert "Server-Timing" not in response.headers
+    assert registry.phases == {}
+
+
+async def test_server_timing_debug_header_requires_auth():
+    registry = MetricsRegistry()
+    middleware = ServerTimingMiddleware(upstream_app, registry)
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        responses = [
+            await client.get("/test/items", headers={"X-Debug-Timing": "1", **auth})
+            for auth in ({}, {"Authorization": "Bearer invalid"})
+        ]
+
+    assert all("Server-Timing" not in r.headers for r in responses)
+    assert registry.phases == {}
+
+
+async def test_server_timing_sampled_without_auth_records_only():
+    registry = MetricsRegistry()
+    middleware = ServerTimingMiddleware(upstream_app, registry)
+    middleware.sample_rate = 1.0
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        response = await client.get("/test/items")
+
+    assert "Server-Timing" not in response.headers
+    assert set(registry.phases) == {"auth", "total"}
@@ -1,3 +1,6 @@
+import time
+from unittest.mock import patch
+
 import pytest
 
 from config.settings import TestSettings
@@ -7,7 +10,7 @@ from use_cases.exceptions import (
     JWTClaimsMissingException,
     JWTMissingException,
 )
-from use_cases.security import JWTValidator
+from use_cases.security import JWTValidator, VerifiedTokenCache
 
 
 @pytest.fixture
@@ -41,3 +44,43 @@ def test_jwt_validation_aud_missing(jwt_validator: JWTValidator):
 def test_jwt_validation_token_missing(jwt_validator: JWTValidator):
     with pytest.raises(JWTMissingException):
         jwt_validator.validate(None)
+
+
+@pytest.fixture
+def token_cache() -> VerifiedTokenCache:
+    return VerifiedTokenCache(max_size=2)
+
+
+def test_jwt_validation_uses_cache(token_cache: VerifiedTokenCache):
+    validator = JWTValidator(TestSettings(), token_cache)
+    token = create_jwt()
+    validator.validate(token)
+
+    with patch("use_cases.security.jwt.decode") as decode:
+        validator.validate(token)
+    decode.assert_not_called()
+
+
+def test_jwt_cache_drops_expired_tokens(token_cache: VerifiedTokenCache):
+    validator = JWTValidator(TestSettings(), token_cache)
+    token = create_jwt()
+    validator.validate(token)
+    key = token_cache.key(token)
+    token_cache._claims[key]["exp"] = time.time() - 1
+
+    assert token_cache.get(key) is None
+    assert len(token_cache) == 0
+
+
+def test_jwt_cache_is_bounded(token_cache: VerifiedTokenCache):
+    validator = JWTValidator(TestSettings(), token_cache)
+    for email in ("a@example.com", "b@example.com", "c@example.com"):
+        validator.validate(create_jwt(email=email))
+    assert len(token_cache) == 2
+
+
+def test_jwt_cache_rejects_invalid_tokens(token_cache: VerifiedTokenCache):
+    validator = JWTValidator(TestSettings(), token_cache)
+    with pytest.raises(JWTClaimsMissingException):
+        validator.validate(create_jwt(email=None))
+    assert len(token_cache) == 0
@@ -0,0 +1,142 @@
+import time
+from enum import StrEnum
+
+from config.settings import BaseSettings
+
+
+class CircuitState(StrEnum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class RollingWindow:
+    """시간 bucket 단위로 요청/실패/느린 호출 수를 집계하는 rolling window"""
+
+    def __init__(self, window: float, buckets: int = 10) -> None:
+        self.bucket_width = window / buckets
+        self._epochs = [-1] * buckets
+        self._requests = [0] * buckets
+        self._failures = [0] * buckets
+        self._slow = [0] * buckets
+
+    def record(self, failure: bool, slow: bool) -> None:
+        epoch = int(time.monotonic() / self.bucket_width)
+        index = epoch % len(self._epochs)
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._requests[index] = self._failures[index] = self._slow[index] = 0
+        self._requests[index] += 1
+        self._failures[index] += failure
+        self._slow[index] += slow
+
+    def totals(self) -> tuple[int, int, int]:
+        oldest = int(time.monotonic() / self.bucket_width) - len(self._epochs)
+        requests = failures = slow = 0
+        for index, epoch in enumerate(self._epochs):
+            if epoch > oldest:
+                requests += self._requests[index]
+                failures += self._failures[index]
+                slow += self._slow[index]
+        return requests, failures, slow
+
+    def reset(self) -> None:
+        self._epochs = [-1] * len(self._epochs)
+
+
+class CircuitBreaker:
+    def __init__(self, settings: BaseSettings) -> None:
+        self.settings = settings
+        self.window = RollingWindow(settings.circuit_breaker_window)
+        self._state = CircuitState.closed
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.open and self.retry_after <= 0:
+            self._to_half_open()
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        open_until = self._opened_at + self.settings.circuit_breaker_open_duration
+        return open_until - time.monotonic()
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CircuitState.closed:
+            return True
+        if state == CircuitState.open:
+            return False
+        # half-open에서는 제한된 수의 시험 요청만 upstream으로 보냄
+        if self._half_open_calls >= self.settings.circuit_breaker_half_open_calls:
+            return False
+        self._half_open_calls += 1
+        return True
+
+    def record(self, success: bool, latency: float) -> None:
+        slow = latency >= self.settings.circuit_breaker_slow_call_duration
+        if self._state == CircuitState.half_open:
+            if not success or slow:
+                self.trip()
+                return
+            self._half_open_successes += 1
+            half_open_calls = self.settings.circuit_breaker_half_open_calls
+            if self._half_open_successes >= half_open_calls:
+                self.reset()
+            return
+
+        self.window.record(not success, slow)
+        # 성공한 호출로는 trip 조건이 새로 충족될 수 없으므로 실패/느린 호출일 때만 검사
+        if (not success or slow) and self._should_trip():
+            self.trip()
+
+    def abandon(self) -> None:
+        # 취소된 시험 요청은 결과 없이 슬롯만 반환
+        if self._state == CircuitState.half_open and self._half_open_calls:
+            self._half_open_calls -= 1
+
+    def trip(self) -> None:
+        self._state = CircuitState.open
+        self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        self._state = CircuitState.closed
+        self.window.reset()
+
+    def probe_succeeded(self) -> None:
+        # health check가 성공하면 open 대기 시간을 기다리지 않고 시험 요청을 허용
+        if self._state == CircuitState.open:
+            self._to_half_open()
+
+    def _to_half_open(self) -> None:
+        self._state = CircuitState.half_open
+        self._half_open_calls = self._half_open_successes = 0
+
+    def _should_trip(self) -> bool:
+        requests, failures, slow = self.window.totals()
+        if requests < self.settings.circuit_breaker_min_requests:
+            return False
+        return (
+            failures / requests >= self.settings.circuit_breaker_failure_rate
+            or slow / requests >= self.settings.circuit_breaker_slow_call_rate
+        )
+
+
+class CircuitBreakerRegistry:
+    def __init__(self) -> None:
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, slug: str, settings: BaseSettings) -> CircuitBreaker:
+        breaker = self.breakers.get(slug)
+        if breaker is None:
+            breaker = self.breakers[slug] = CircuitBreaker(settings)
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        return {slug: breaker.state for slug, breaker in self.breakers.items()}
+
+
+circuit_breakers = CircuitBreakerRegistry()
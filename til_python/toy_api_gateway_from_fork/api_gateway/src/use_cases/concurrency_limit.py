@@ -0,0 +1,186 @@
+import asyncio
+import contextlib
+import math
+from collections import deque
+
+from config.settings import BaseSettings
+
+# 긴 기준 RTT(EWMA)가 반영하는 대략적인 sample 수
+LONG_RTT_WINDOW = 600
+
+
+class WeightedFairQueue:
+    """priority class별 FIFO queue, 꺼낼 때는 weight 비율대로 class를 고름(stride scheduling)
+
+    class마다 꺼낼 때마다 1/weight씩 늘어나는 pass 값을 두고 가장 작은 class부터 꺼내므로
+    모든 class가 기다리는 중이면 weight 비율로 slot을 나눠 받고 높은 class도 낮은 class를 굶기지 않음
+    """
+
+    def __init__(self, weights: dict[str, int]) -> None:
+        self.weights = weights
+        self.queues: dict[str, deque[asyncio.Future[bool]]] = {
+            priority: deque() for priority in weights
+        }
+        self._passes = dict.fromkeys(weights, 0.0)
+        self._virtual_time = 0.0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, priority: str, waiter: asyncio.Future[bool]) -> None:
+        queue = self.queues[priority]
+        if not queue:
+            # 한동안 비어 있던 class가 그동안 못 받은 몫을 한꺼번에 가져가지 않도록 함
+            self._passes[priority] = max(self._passes[priority], self._virtual_time)
+        queue.append(waiter)
+        self._size += 1
+
+    def pop(self) -> asyncio.Future[bool] | None:
+        active = [priority for priority, queue in self.queues.items() if queue]
+        if not active:
+            return None
+        priority = min(active, key=self._passes.__getitem__)
+        self._virtual_time = self._passes[priority]
+        self._passes[priority] += 1 / self.weights[priority]
+        self._size -= 1
+        return self.queues[priority].popleft()
+
+    def remove(self, priority: str, waiter: asyncio.Future[bool]) -> None:
+        with contextlib.suppress(ValueError):
+            self.queues[priority].remove(waiter)
+            self._size -= 1
+
+    def evict_below(self, priority: str) -> asyncio.Future[bool] | None:
+        """priority보다 weight가 낮은 class 중 가장 낮은 class에서 가장 늦게 들어온 대기 요청을 꺼냄"""
+        weight = self.weights[priority]
+        lower = [
+            p for p, queue in self.queues.items() if queue and self.weights[p] < weight
+        ]
+        if not lower:
+            return None
+        self._size -= 1
+        return self.queues[min(lower, key=self.weights.__getitem__)].pop()
+
+
+class ConcurrencyLimiter:
+    """latency에 따라 upstream 동시 요청 수 제한을 조정하는 적응형 limiter(Gradient2 방식)
+
+    최근 RTT가 긴 기준 RTT보다 tolerance배 이상 늘면 그 비율만큼 제한을 줄이고,
+    그렇지 않으면 sqrt(limit)씩 늘림, timeout/연결 실패는 AIMD처럼 backoff 비율로 바로 줄임
+    제한을 넘은 요청은 priority class별 짧은 queue에서 기다리고, queue가 가득 차거나
+    기다리다 timeout이면 거절
+    """
+
+    def __init__(self, settings: BaseSettings) -> None:
+        self.settings = settings
+        self.limit = float(settings.concurrency_limit_initial)
+        self.in_flight = 0
+        # queue가 가득 차거나 timeout으로 거절한 요청 수
+        self.shed = 0
+        self._long_rtt = 0.0
+        self._waiters = WeightedFairQueue(settings.priority_weights)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def try_acquire(self) -> bool:
+        """기다리지 않고 slot을 얻을 수 있으면 얻음, 기다리는 요청이 있으면 새치기하지 않음"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    async def acquire(self, priority: str | None = None) -> bool:
+        """slot을 얻으면 True, 거절되면 False, True면 끝난 뒤 반드시 release 호출"""
+        if self.try_acquire():
+            return True
+        priority = priority or self.settings.default_priority
+        if len(self._waiters) >= self.settings.concurrency_limit_queue_size:
+            # 더 낮은 class의 대기 요청이 있으면 그 요청을 대신 거절
+            evicted = self._waiters.evict_below(priority)
+            self.shed += 1
+            if evicted is None:
+                return False
+            evicted.set_result(False)
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._waiters.push(priority, waiter)
+        try:
+            async with asyncio.timeout(self.settings.concurrency_limit_queue_timeout):
+                return await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            # timeout/취소와 동시에 release가 slot을 넘겨줬거나 evict 된 경우
+            granted = waiter.done() and not waiter.cancelled() and waiter.result()
+            if not waiter.done() or waiter.cancelled():
+                self._waiters.remove(priority, waiter)
+                if isinstance(e, TimeoutError):
+                    self.shed += 1
+            if isinstance(e, asyncio.CancelledError):
+                if granted:
+                    self.release()
+                raise
+            return granted
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def record(self, rtt: float, dropped: bool) -> None:
+        """끝난 요청의 RTT로 제한을 갱신, dropped는 timeout/연결 실패/503, 504 응답"""
+        settings = self.settings
+        # 매우 빠른 응답이나 해상도가 낮은 clock에서는 0이 나올 수 있음
+        rtt = max(rtt, 1e-6)
+        if dropped:
+            limit = self.limit * settings.concurrency_limit_backoff
+        else:
+            if self._long_rtt == 0.0:
+                self._long_rtt = rtt
+            else:
+                self._long_rtt += (rtt - self._long_rtt) * 2 / (LONG_RTT_WINDOW + 1)
+            # upstream이 회복되어 RTT가 크게 줄면 긴 기준 RTT도 빨리 따라 내려오게 함
+            if self._long_rtt > 2 * rtt:
+                self._long_rtt *= 0.95
+            gradient = max(
+                0.5,
+                min(1.0, settings.concurrency_limit_tolerance * self._long_rtt / rtt),
+            )
+            limit = self.limit * gradient + math.sqrt(self.limit)
+            smoothing = settings.concurrency_limit_smoothing
+            limit = self.limit * (1 - smoothing) + limit * smoothing
+            # 제한의 절반도 쓰지 않는 중이면 늘릴 근거가 없으므로 줄이기만 함
+            if limit > self.limit and self.in_flight < self.limit / 2:
+                return
+        self.limit = min(
+            max(limit, settings.concurrency_limit_min), settings.concurrency_limit_max
+        )
+        self._wake()
+
+    def _wake(self) -> None:
+        # 비는 slot만큼 먼저 기다린 요청부터 slot을 넘겨줌
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.pop()
+            if waiter is not None and not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+
+class ConcurrencyLimiterRegistry:
+    def __init__(self) -> None:
+        self.limiters: dict[str, ConcurrencyLimiter] = {}
+
+    def get(self, slug: str, settings: BaseSettings) -> ConcurrencyLimiter:
+        limiter = self.limiters.get(slug)
+        if limiter is None:
+            limiter = self.limiters[slug] = ConcurrencyLimiter(settings)
+        return limiter
+
+    def stats(self) -> list[tuple[str, float, int, int]]:
+        """service별 (현재 제한, 대기 중인 요청 수, 거절한 요청 수)"""
+        return [
+            (slug, limiter.limit, limiter.queued, limiter.shed)
+            for slug, limiter in self.limiters.items()
+        ]
+
+
+concurrency_limiters = ConcurrencyLimiterRegistry()
@@ -1,12 +1,60 @@
-import json
 from typing import Any
 
+from use_cases.json_codec import get_json_codec
 
-def modify_paths(body: bytes, service_name: str) -> dict[str, Any]:
-    data: dict[str, Any] = json.loads(body.decode())
-    modified_paths = {}
-    for path, details in data["paths"].items():
-        new_path = f"/{service_name}" + path
-        modified_paths[new_path] = details
-    data["paths"] = modified_paths
-    return data
+
+def modify_paths(body: bytes, service_name: str) -> bytes:
+    return get_json_codec().prefix_keys(body, "paths", f"/{service_name}")
+
+
+def _prefix_refs(node: Any, prefix: str) -> Any:
+    if isinstance(node, dict):
+        return {
+            key: (
+                _prefix_ref(value, prefix)
+                if key == "$ref" and isinstance(value, str)
+                else _prefix_refs(value, prefix)
+            )
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_prefix_refs(item, prefix) for item in node]
+    return node
+
+
+def _prefix_ref(ref: str, prefix: str) -> str:
+    if not ref.startswith("#/components/"):
+        return ref
+    base, _, name = ref.rpartition("/")
+    return f"{base}/{prefix}{name}"
+
+
+def merge_schemas(schemas: dict[str, dict[str, Any]], title: str) -> dict[str, Any]:
+    """service별 schema(paths는 modify_paths 적용)를 하나로 합침
+
+    component 이름 충돌을 막기 위해 service별 prefix를 붙이고 $ref도 함께 바꿈
+    """
+    paths: dict[str, Any] = {}
+    components: dict[str, dict[str, Any]] = {}
+    tags = []
+    for service_name, schema in schemas.items():
+        prefix = service_name.replace("-", " ").title().replace(" ", "")
+        schema = _prefix_refs(schema, prefix)
+        for path, operations in schema.get("paths", {}).items():
+            for operation in operations.values():
+                if isinstance(operation, dict):
+                    operation["tags"] = [service_name, *operation.get("tags", [])]
+            paths[path] = operations
+        for kind, items in schema.get("components", {}).items():
+            merged = components.setdefault(kind, {})
+            for name, item in items.items():
+                merged[f"{prefix}{name}"] = item
+        description = schema.get("info", {}).get("title", service_name)
+        tags.append({"name": service_name, "description": description})
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": title, "version": "1.0.0"},
+        "tags": tags,
+        "paths": paths,
+        "components": components,
+    }
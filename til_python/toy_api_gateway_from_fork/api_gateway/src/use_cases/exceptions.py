@@ -18,3 +18,13 @@ class JWTClaimsMissingException(NotAuthorizedException):
 class ForbiddenException(Exception):
     def __str__(self) -> str:
         return "Forbidden"
+
+
+class BatchTooLargeException(Exception):
+    def __str__(self) -> str:
+        return "Too many sub-requests"
+
+
+class RateLimitedException(Exception):
+    def __str__(self) -> str:
+        return "Too many requests"
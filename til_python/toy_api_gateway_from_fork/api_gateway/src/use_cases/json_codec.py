@@ -0,0 +1,93 @@
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from config.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+class JSONCodec(ABC):
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+    def prefix_keys(self, data: bytes, field: str, prefix: str) -> bytes:
+        """최상위 객체의 field 객체 key에 prefix를 붙임"""
+        document = self.loads(data)
+        document[field] = {
+            prefix + key: value for key, value in document[field].items()
+        }
+        return self.dumps(document)
+
+
+class StdlibJSONCodec(JSONCodec):
+    def dumps(self, obj: Any) -> bytes:
+        # starlette JSONResponse와 같은 형식(공백 없음, non-ASCII 그대로)
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecJSONCodec(JSONCodec):
+    def __init__(self) -> None:
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        # value는 decode 하지 않고 원본 JSON bytes 조각(Raw)으로 유지
+        self._raw_decoder = msgspec.json.Decoder(dict[str, msgspec.Raw])
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def prefix_keys(self, data: bytes, field: str, prefix: str) -> bytes:
+        # 바꿀 key가 있는 두 단계만 나누고 나머지 값은 bytes 그대로 다시 이어 붙임
+        document = self._raw_decoder.decode(data)
+        values = self._raw_decoder.decode(document[field])
+        prefixed = {prefix + key: value for key, value in values.items()}
+        return self._encoder.encode({**document, field: prefixed})
+
+
+# auto는 앞에서부터 설치된 codec을 사용
+json_codec_mapping: dict[str, type[JSONCodec]] = {}
+if msgspec is not None:
+    json_codec_mapping["msgspec"] = MsgspecJSONCodec
+if orjson is not None:
+    json_codec_mapping["orjson"] = OrjsonJSONCodec
+json_codec_mapping["stdlib"] = StdlibJSONCodec
+
+
+@lru_cache
+def get_json_codec() -> JSONCodec:
+    name = get_settings().json_codec
+    if name == "auto":
+        return next(iter(json_codec_mapping.values()))()
+    if name not in json_codec_mapping:
+        raise ValueError(f"json_codec {name} is not installed")
+    return json_codec_mapping[name]()
@@ -0,0 +1,99 @@
+import random
+from abc import ABC, abstractmethod
+
+from domain.enitities.service import LoadBalancingStrategy, Service
+
+
+class Endpoint:
+    # 최근 응답 시간에 더 큰 가중치를 주는 EWMA 계수
+    DECAY = 0.3
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.latency = 0.0
+
+    def acquire(self) -> None:
+        self.outstanding += 1
+
+    def release(self) -> None:
+        self.outstanding -= 1
+
+    def observe(self, latency: float) -> None:
+        self.latency = (
+            latency
+            if not self.latency
+            else self.latency + self.DECAY * (latency - self.latency)
+        )
+
+    @property
+    def score(self) -> float:
+        # 대기 중인 요청 수 x 평균 latency가 작을수록 빠르게 응답할 endpoint
+        return (self.outstanding + 1) * self.latency
+
+
+class LoadBalancer(ABC):
+    def __init__(self, urls: list[str]) -> None:
+        self.endpoints = [Endpoint(url) for url in urls]
+
+    def set_urls(self, urls: list[str]) -> None:
+        """endpoint 목록을 교체, 계속 남는 endpoint의 진행 중인 요청 수/latency는 유지"""
+        current = {endpoint.url: endpoint for endpoint in self.endpoints}
+        self.endpoints = [current.get(url) or Endpoint(url) for url in urls]
+
+    @abstractmethod
+    def pick(self) -> Endpoint:
+        pass
+
+
+class RoundRobinLoadBalancer(LoadBalancer):
+    def __init__(self, urls: list[str]) -> None:
+        super().__init__(urls)
+        self._next = 0
+
+    def pick(self) -> Endpoint:
+        endpoint = self.endpoints[self._next % len(self.endpoints)]
+        self._next += 1
+        return endpoint
+
+
+class LeastOutstandingLoadBalancer(LoadBalancer):
+    def pick(self) -> Endpoint:
+        return min(self.endpoints, key=lambda endpoint: endpoint.outstanding)
+
+
+class PowerOfTwoLoadBalancer(LoadBalancer):
+    def pick(self) -> Endpoint:
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+        first, second = random.sample(self.endpoints, 2)
+        return first if first.score <= second.score else second
+
+
+load_balancer_mapping: dict[LoadBalancingStrategy, type[LoadBalancer]] = {
+    LoadBalancingStrategy.round_robin: RoundRobinLoadBalancer,
+    LoadBalancingStrategy.least_outstanding: LeastOutstandingLoadBalancer,
+    LoadBalancingStrategy.power_of_two: PowerOfTwoLoadBalancer,
+}
+
+
+class LoadBalancerRegistry:
+    """service별 load balancer와 endpoint 카운터를 프로세스 메모리에 보관"""
+
+    def __init__(self) -> None:
+        self._balancers: dict[str, LoadBalancer] = {}
+
+    def get(self, service: Service) -> LoadBalancer:
+        balancer = self._balancers.get(service.slug)
+        if balancer is None:
+            balancer = load_balancer_mapping[service.load_balancing](service.urls)
+            self._balancers[service.slug] = balancer
+        return balancer
+
+    def update(self, service: Service, urls: list[str]) -> None:
+        balancer = self.get(service)
+        if urls and urls != [endpoint.url for endpoint in balancer.endpoints]:
+            balancer.set_urls(urls)
+
+
+load_balancers = LoadBalancerRegistry()
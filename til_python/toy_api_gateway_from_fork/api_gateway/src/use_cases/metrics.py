@@ -0,0 +1,282 @@
+import asyncio
+import contextlib
+import math
+from collections.abc import Iterable
+from typing import Any
+
+
+def log_linear_bounds(
+    min_exponent: int, max_exponent: int, sub_buckets: int
+) -> tuple[float, ...]:
+    """2^min_exponent 이하, 각 2의 거듭제곱 구간을 sub_buckets개로 나눈 상한들, +Inf"""
+    return (
+        2.0**min_exponent,
+        *(
+            2.0**exponent * (1 + (sub + 1) / sub_buckets)
+            for exponent in range(min_exponent, max_exponent)
+            for sub in range(sub_buckets)
+        ),
+        math.inf,
+    )
+
+
+class LatencyHistogram:
+    """2의 거듭제곱 구간을 SUB_BUCKETS개로 균등하게 나눈 고정 크기 log-linear 히스토그램
+
+    bucket 상대 오차는 1/SUB_BUCKETS 이하, 기록은 bucket 계산 후 list 원소 증가만 수행
+    """
+
+    SUB_BUCKETS = 4
+    # 2^-14초(약 61µs) ~ 2^6초(64초), 범위 밖은 양 끝 bucket에 기록
+    MIN_EXPONENT = -14
+    MAX_EXPONENT = 6
+    # 각 bucket의 상한(초)
+    bounds = log_linear_bounds(MIN_EXPONENT, MAX_EXPONENT, SUB_BUCKETS)
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[self.index(value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"counts": self.counts, "count": self.count, "sum": self.sum}
+
+    def merge(self, snapshot: dict[str, Any]) -> None:
+        self.counts = [
+            a + b for a, b in zip(self.counts, snapshot["counts"], strict=True)
+        ]
+        self.count += snapshot["count"]
+        self.sum += snapshot["sum"]
+
+    @classmethod
+    def index(cls, value: float) -> int:
+        if value <= cls.bounds[0]:
+            return 0
+        # value = mantissa * 2^exponent, 0.5 <= mantissa < 1
+        mantissa, exponent = math.frexp(value)
+        octave = exponent - 1 - cls.MIN_EXPONENT
+        index = 1 + octave * cls.SUB_BUCKETS + int((mantissa * 2 - 1) * cls.SUB_BUCKETS)
+        return min(index, len(cls.bounds) - 1)
+
+
+class ServiceMetrics:
+    __slots__ = ("requests", "in_flight", "latency")
+
+    def __init__(self) -> None:
+        # upstream 응답 status(예외는 "error") -> 요청 수
+        self.requests: dict[int | str, int] = {}
+        self.in_flight = 0
+        self.latency = LatencyHistogram()
+
+    def record(self, status: int | str, latency: float) -> None:
+        self.requests[status] = self.requests.get(status, 0) + 1
+        self.latency.record(latency)
+
+
+class MetricsRegistry:
+    """service별 upstream 요청 지표와 event loop 지연을 보관
+
+    단일 event loop에서만 갱신하므로 lock 없이 값을 바로 증가시킴
+    """
+
+    def __init__(self) -> None:
+        self.services: dict[str, ServiceMetrics] = {}
+        self.loop_lag = LatencyHistogram()
+        self.loop_lag_max = 0.0
+        # Server-Timing이 기록된 요청의 단계 이름 -> 소요 시간
+        self.phases: dict[str, LatencyHistogram] = {}
+
+    def get(self, service_name: str) -> ServiceMetrics:
+        metrics = self.services.get(service_name)
+        if metrics is None:
+            metrics = self.services[service_name] = ServiceMetrics()
+        return metrics
+
+    def record_phases(self, phases: dict[str, float]) -> None:
+        for phase, duration in phases.items():
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                histogram = self.phases[phase] = LatencyHistogram()
+            histogram.record(duration)
+
+    def record_loop_lag(self, lag: float) -> None:
+        self.loop_lag.record(lag)
+        self.loop_lag_max = max(self.loop_lag_max, lag)
+
+    def snapshot(self) -> dict[str, Any]:
+        """다른 process로 넘길 수 있는 JSON 형태, status key는 문자열로 바뀜"""
+        return {
+            "services": {
+                name: {
+                    "requests": {
+                        str(status): count for status, count in m.requests.items()
+                    },
+                    "in_flight": m.in_flight,
+                    "latency": m.latency.snapshot(),
+                }
+                for name, m in self.services.items()
+            },
+            "loop_lag": self.loop_lag.snapshot(),
+            "loop_lag_max": self.loop_lag_max,
+            "phases": {phase: h.snapshot() for phase, h in self.phases.items()},
+        }
+
+    def merge(self, snapshot: dict[str, Any]) -> None:
+        """snapshot의 값을 더함(loop_lag_max는 최댓값), worker별 지표를 host 전체로 합산할 때 사용"""
+        for name, service in snapshot["services"].items():
+            metrics = self.get(name)
+            for status, count in service["requests"].items():
+                metrics.requests[status] = metrics.requests.get(status, 0) + count
+            metrics.in_flight += service["in_flight"]
+            metrics.latency.merge(service["latency"])
+        self.loop_lag.merge(snapshot["loop_lag"])
+        self.loop_lag_max = max(self.loop_lag_max, snapshot["loop_lag_max"])
+        for phase, histogram in snapshot["phases"].items():
+            if phase not in self.phases:
+                self.phases[phase] = LatencyHistogram()
+            self.phases[phase].merge(histogram)
+
+
+class LoopLagMonitor:
+    """interval마다 sleep이 예정보다 늦게 깨어난 시간을 event loop 지연으로 기록"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, interval: float) -> None:
+        if interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            self.registry.record_loop_lag(max(0.0, loop.time() - start - interval))
+
+
+def render_metrics(
+    registry: MetricsRegistry,
+    pools: Iterable[tuple[str, int, int]] = (),
+    limits: Iterable[tuple[str, float, int, int]] = (),
+) -> str:
+    """Prometheus text format(0.0.4)으로 변환
+
+    pools는 (host, 사용 중, idle) connection 수, limits는 (service, 동시 요청 제한, 대기 중, 거절 수)
+    """
+    lines = [
+        "# HELP gateway_upstream_requests_total Upstream requests by response status.",
+        "# TYPE gateway_upstream_requests_total counter",
+    ]
+    for service, metrics in registry.services.items():
+        for status, count in metrics.requests.items():
+            lines.append(
+                f'gateway_upstream_requests_total{{service="{_escape(service)}",status="{_escape(status)}"}} {count}'
+            )
+    lines += [
+        "# HELP gateway_upstream_in_flight Upstream requests waiting for a response.",
+        "# TYPE gateway_upstream_in_flight gauge",
+    ]
+    for service, metrics in registry.services.items():
+        lines.append(
+            f'gateway_upstream_in_flight{{service="{_escape(service)}"}} {metrics.in_flight}'
+        )
+    lines += [
+        "# HELP gateway_upstream_latency_seconds Time until upstream response headers.",
+        "# TYPE gateway_upstream_latency_seconds histogram",
+    ]
+    for service, metrics in registry.services.items():
+        lines += _histogram_lines(
+            "gateway_upstream_latency_seconds",
+            f'service="{_escape(service)}",',
+            metrics.latency,
+        )
+    lines += [
+        "# HELP gateway_phase_seconds Sampled request time by phase (Server-Timing).",
+        "# TYPE gateway_phase_seconds histogram",
+    ]
+    for phase, histogram in registry.phases.items():
+        lines += _histogram_lines(
+            "gateway_phase_seconds", f'phase="{_escape(phase)}",', histogram
+        )
+    lines += [
+        "# HELP gateway_event_loop_lag_seconds Event loop scheduling delay.",
+        "# TYPE gateway_event_loop_lag_seconds histogram",
+        *_histogram_lines("gateway_event_loop_lag_seconds", "", registry.loop_lag),
+        "# HELP gateway_event_loop_lag_max_seconds Largest event loop delay observed.",
+        "# TYPE gateway_event_loop_lag_max_seconds gauge",
+        f"gateway_event_loop_lag_max_seconds {registry.loop_lag_max}",
+        "# HELP gateway_pool_connections Upstream connections in the client pool.",
+        "# TYPE gateway_pool_connections gauge",
+    ]
+    for host, acquired, idle in pools:
+        lines.append(
+            f'gateway_pool_connections{{host="{_escape(host)}",state="acquired"}} {acquired}'
+        )
+        lines.append(
+            f'gateway_pool_connections{{host="{_escape(host)}",state="idle"}} {idle}'
+        )
+    lines += [
+        "# HELP gateway_concurrency_limit Adaptive upstream concurrency limit.",
+        "# TYPE gateway_concurrency_limit gauge",
+    ]
+    limits = list(limits)
+    for service, limit, _, _ in limits:
+        lines.append(
+            f'gateway_concurrency_limit{{service="{_escape(service)}"}} {limit}'
+        )
+    lines += [
+        "# HELP gateway_concurrency_queued Requests waiting for a concurrency slot.",
+        "# TYPE gateway_concurrency_queued gauge",
+    ]
+    for service, _, queued, _ in limits:
+        lines.append(
+            f'gateway_concurrency_queued{{service="{_escape(service)}"}} {queued}'
+        )
+    lines += [
+        "# HELP gateway_concurrency_shed_total Requests rejected by the concurrency limit.",
+        "# TYPE gateway_concurrency_shed_total counter",
+    ]
+    for service, _, _, shed in limits:
+        lines.append(
+            f'gateway_concurrency_shed_total{{service="{_escape(service)}"}} {shed}'
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: object) -> str:
+    """label 값의 \\, ", 줄바꿈을 escape해 다른 줄이 끼어들지 않도록 함"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, histogram: LatencyHistogram) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts, strict=True):
+        cumulative += count
+        le = "+Inf" if bound == math.inf else repr(bound)
+        lines.append(f'{name}_bucket{{{labels}le="{le}"}} {cumulative}')
+    labels = labels.rstrip(",")
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {histogram.sum}")
+    lines.append(f"{name}_count{suffix} {histogram.count}")
+    return lines
+
+
+metrics_registry = MetricsRegistry()
+loop_lag_monitor = LoopLagMonitor(metrics_registry)
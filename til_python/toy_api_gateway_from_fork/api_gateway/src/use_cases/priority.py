@@ -0,0 +1,61 @@
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any
+
+from config.settings import BaseSettings, get_settings
+from domain.enitities.service import PriorityRule
+from use_cases.exceptions import NotAuthorizedException
+from use_cases.security import JWTValidator, VerifiedTokenCache, get_token_cache
+
+
+class PriorityClassifier:
+    """service, upstream 경로, JWT claim으로 요청의 priority class를 정함"""
+
+    def __init__(
+        self, settings: BaseSettings, cache: VerifiedTokenCache | None = None
+    ) -> None:
+        self.settings = settings
+        self.cache = cache
+
+    def classify(self, service: str, route: str, headers: dict[str, Any]) -> str:
+        path = route.partition("?")[0]
+        # claim 조건이 있는 rule까지 내려왔을 때만 token을 검증
+        claims: dict[str, Any] | None = None
+        for rule in self.settings.priority_rules:
+            if rule.service is not None and rule.service != service:
+                continue
+            if rule.path is not None and not fnmatchcase(path, rule.path):
+                continue
+            if rule.claim is not None:
+                if claims is None:
+                    claims = self._get_claims(headers)
+                if not self._claim_matches(claims.get(rule.claim), rule):
+                    continue
+            return rule.priority
+        return self.settings.default_priority
+
+    def _get_claims(self, headers: dict[str, Any]) -> dict[str, Any]:
+        authorization = headers.get("authorization") or headers.get("Authorization")
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return {}
+        try:
+            # 위조된 claim으로 priority를 올리지 못하도록 검증된 claims만 사용
+            return JWTValidator(self.settings, self.cache).validate(token)
+        except NotAuthorizedException:
+            return {}
+
+    @staticmethod
+    def _claim_matches(claim: Any, rule: PriorityRule) -> bool:
+        if claim is None:
+            return False
+        if rule.value is None:
+            return True
+        if isinstance(claim, list):
+            return rule.value in claim
+        return str(claim) == rule.value
+
+
+@lru_cache
+def get_priority_classifier() -> PriorityClassifier:
+    return PriorityClassifier(get_settings(), get_token_cache())
@@ -0,0 +1,112 @@
+import math
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from config.settings import BaseSettings, get_settings
+from domain.enitities.service import RateLimit, RateLimitKey
+from use_cases.exceptions import NotAuthorizedException
+from use_cases.security import JWTValidator, get_token_cache
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated_at", "expires_at")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.tokens = tokens
+        self.updated_at = now
+        self.expires_at = now
+
+
+@dataclass
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    # bucket이 다시 가득 찰 때까지 / 다음 token이 생길 때까지 남은 시간(초)
+    reset: float
+    retry_after: float
+
+
+class RateLimiter:
+    """key별 token bucket을 shard로 나눠 보관하고 shard 단위로 조금씩 정리하는 rate limiter
+
+    event loop 안에서 await 없이 한 번에 계산하므로 lock 없이 사용
+    """
+
+    def __init__(self, shards: int, idle_timeout: float) -> None:
+        self.idle_timeout = idle_timeout
+        self.shards: list[dict[Hashable, TokenBucket]] = [{} for _ in range(shards)]
+        # idle_timeout 동안 모든 shard를 한 번씩 돌도록 sweep 간격을 나눔
+        self._sweep_interval = idle_timeout / shards
+        self._next_sweep_at = time.monotonic() + self._sweep_interval
+        self._next_shard = 0
+
+    def acquire(self, key: Hashable, limit: RateLimit) -> RateLimitDecision:
+        now = time.monotonic()
+        if now >= self._next_sweep_at:
+            self._sweep(now)
+
+        shard = self.shards[hash(key) % len(self.shards)]
+        bucket = shard.get(key)
+        if bucket is None:
+            bucket = shard[key] = TokenBucket(limit.burst, now)
+        else:
+            elapsed = now - bucket.updated_at
+            bucket.tokens = min(limit.burst, bucket.tokens + elapsed * limit.rate)
+            bucket.updated_at = now
+
+        allowed = bucket.tokens >= 1
+        if allowed:
+            bucket.tokens -= 1
+        refill = (limit.burst - bucket.tokens) / limit.rate
+        # 다시 가득 찰 때까지는 지워도 남은 token 수가 바뀌지 않도록 보관
+        bucket.expires_at = now + max(refill, self.idle_timeout)
+        retry_after = 0.0 if allowed else (1 - bucket.tokens) / limit.rate
+        return RateLimitDecision(
+            allowed, limit.burst, math.floor(bucket.tokens), refill, retry_after
+        )
+
+    def _sweep(self, now: float) -> None:
+        shard = self.shards[self._next_shard]
+        for key in [key for key, bucket in shard.items() if bucket.expires_at <= now]:
+            del shard[key]
+        self._next_shard = (self._next_shard + 1) % len(self.shards)
+        self._next_sweep_at = now + self._sweep_interval
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+
+def get_rate_limit_key(
+    settings: BaseSettings, limit: RateLimit, authorization: str, client: str | None
+) -> Hashable:
+    """limit.key에 맞는 bucket key, /{service}/... 요청과 /batch의 sub-request가 같은 bucket을 사용"""
+    if limit.key == RateLimitKey.service:
+        return None
+    if limit.key == RateLimitKey.aud:
+        aud = _get_audience(settings, authorization)
+        if aud is not None:
+            return aud
+    # aud를 알 수 없는 요청(token 없음/검증 실패)은 IP 기준으로 제한
+    return client
+
+
+def _get_audience(settings: BaseSettings, authorization: str) -> Hashable:
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        # 위조된 aud로 제한을 피하지 못하도록 검증된 claims만 사용
+        claims = JWTValidator(settings, get_token_cache()).validate(token)
+    except NotAuthorizedException:
+        return None
+    aud = claims["aud"]
+    return ("aud", tuple(aud) if isinstance(aud, list) else aud)
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    settings = get_settings()
+    return RateLimiter(settings.rate_limit_shards, settings.rate_limit_idle_timeout)
@@ -0,0 +1,93 @@
+import random
+import time
+
+from domain.enitities.service import RetryPolicy, Service
+
+
+class LatencyTracker:
+    """최근 latency 샘플을 ring buffer에 보관하고 percentile을 주기적으로 재계산"""
+
+    def __init__(self, size: int = 256, refresh_every: int = 32) -> None:
+        self._samples: list[float] = []
+        self._size = size
+        self._next = 0
+        self._refresh_every = refresh_every
+        self._recorded = 0
+        self._percentiles: dict[float, float] = {}
+
+    def record(self, latency: float) -> None:
+        if len(self._samples) < self._size:
+            self._samples.append(latency)
+        else:
+            self._samples[self._next] = latency
+            self._next = (self._next + 1) % self._size
+        self._recorded += 1
+        if self._recorded % self._refresh_every == 0:
+            # 매 요청마다 정렬하지 않도록 일정 샘플마다 캐시 무효화
+            self._percentiles.clear()
+
+    def percentile(self, q: float) -> float | None:
+        if len(self._samples) < self._refresh_every:
+            return None
+        value = self._percentiles.get(q)
+        if value is None:
+            ordered = sorted(self._samples)
+            value = ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+            self._percentiles[q] = value
+        return value
+
+
+class RetryBudget:
+    """요청 수에 비례해 적립된 토큰 안에서만 재시도/hedge를 허용"""
+
+    def __init__(
+        self, ratio: float, min_per_second: float, capacity: float = 100
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._balance = min(capacity, min_per_second)
+        self._updated_at = time.monotonic()
+
+    def deposit(self) -> None:
+        self._refill()
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        self._refill()
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed, self._updated_at = now - self._updated_at, now
+        self._balance = min(
+            self.capacity, self._balance + elapsed * self.min_per_second
+        )
+
+
+def get_backoff(policy: RetryPolicy, attempt: int) -> float:
+    # full jitter: 0 ~ min(max, base * 2^attempt)
+    return random.uniform(0, min(policy.backoff_max, policy.backoff_base * 2**attempt))
+
+
+class RetryState:
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.latency = LatencyTracker()
+        self.budget = RetryBudget(policy.budget_ratio, policy.budget_min_per_second)
+
+
+class RetryStateRegistry:
+    def __init__(self) -> None:
+        self._states: dict[str, RetryState] = {}
+
+    def get(self, service: Service, policy: RetryPolicy) -> RetryState:
+        state = self._states.get(service.slug)
+        if state is None:
+            state = self._states[service.slug] = RetryState(policy)
+        return state
+
+
+retry_states = RetryStateRegistry()
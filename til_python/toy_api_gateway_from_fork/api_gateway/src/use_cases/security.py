@@ -1,6 +1,12 @@
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
 from jose import jwt
 
-from config.settings import BaseSettings
+from config.settings import BaseSettings, get_settings
 from use_cases.exceptions import (
     InvalidJWTException,
     JWTClaimsMissingException,
@@ -8,15 +14,55 @@ from use_cases.exceptions import (
 )
 
 
+class VerifiedTokenCache:
+    """서명 검증을 통과한 token의 claims를 exp 시점까지만 보관하는 LRU 캐시"""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._claims: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def key(access_token: str) -> bytes:
+        # token 원문 대신 digest를 key로 사용
+        return hashlib.sha256(access_token.encode()).digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        claims = self._claims.get(key)
+        if claims is None:
+            return None
+        if claims["exp"] <= time.time():
+            del self._claims[key]
+            return None
+        self._claims.move_to_end(key)
+        return claims
+
+    def set(self, key: bytes, claims: dict[str, Any]) -> None:
+        self._claims[key] = claims
+        self._claims.move_to_end(key)
+        if len(self._claims) > self.max_size:
+            self._claims.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+
 class JWTValidator:
     ALGORITHM = "HS256"
 
-    def __init__(self, settings: BaseSettings):
+    def __init__(self, settings: BaseSettings, cache: VerifiedTokenCache | None = None):
         self.settings = settings
+        self.cache = cache
 
-    def validate(self, access_token: str | None = None) -> None:
+    def validate(self, access_token: str | None = None) -> dict[str, Any]:
         if access_token is None:
             raise JWTMissingException
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(access_token)
+            cached_claims = self.cache.get(key)
+            if cached_claims is not None:
+                self._validate_claims(cached_claims)
+                return cached_claims
         try:
             claims = jwt.decode(
                 access_token,
@@ -26,5 +72,17 @@ class JWTValidator:
             )
         except Exception as e:
             raise InvalidJWTException from e
+        self._validate_claims(claims)
+        if self.cache is not None and key is not None:
+            self.cache.set(key, claims)
+        return claims
+
+    @staticmethod
+    def _validate_claims(claims: dict[str, Any]) -> None:
         if not claims.get("aud") or not claims.get("exp"):
             raise JWTClaimsMissingException
+
+
+@lru_cache
+def get_token_cache() -> VerifiedTokenCache:
+    return VerifiedTokenCache(get_settings().jwt_cache_max_size)
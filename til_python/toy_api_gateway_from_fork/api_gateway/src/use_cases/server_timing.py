@@ -0,0 +1,34 @@
+import time
+from contextvars import ContextVar
+
+
+class ServerTiming:
+    """요청 하나의 단계별 소요 시간(초), 재시도/hedging으로 같은 단계가 여러 번이면 합산"""
+
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, duration: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def header(self) -> str:
+        # Server-Timing의 dur 단위는 밀리초
+        return ", ".join(
+            f"{phase};dur={duration * 1000:.3f}"
+            for phase, duration in self.phases.items()
+        )
+
+
+# 샘플링된 요청에서만 ServerTimingMiddleware가 설정, 아니면 None
+current_timing: ContextVar[ServerTiming | None] = ContextVar(
+    "current_timing", default=None
+)
+
+
+def record_phase(phase: str, start: float) -> None:
+    """start(time.perf_counter())부터 지금까지를 현재 요청의 phase 시간으로 기록"""
+    timing = current_timing.get()
+    if timing is not None:
+        timing.add(phase, time.perf_counter() - start)